@@ -6,8 +6,12 @@ from .auxiliary import *
 from .voltLvl import *
 from .format_information import *
 from .pp_net_manipulation import *
+from .conversion_plan import *
+from .instrumentation import *
 from .csv_data_manipulation import *
 from .read_and_write import *
 from .csv_pp_converter import *
+from .batch_conversion import *
+from .incremental_export import *
 
 __author__ = "smeinecke"
@@ -0,0 +1,310 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import os
+import traceback
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandapower as pp
+
+from simbench.converter.auxiliary import merge_dataframes
+from simbench.converter.conversion_plan import get_conversion_plan
+from simbench.converter.csv_pp_converter import (
+    csv2pp,
+    pp2csv_data,
+    _highest_existing_coordinate_number,
+)
+from simbench.converter.read_and_write import (
+    read_csv_data,
+    write2csv,
+    _concat_csv_tables,
+    _drop_duplicated_rows,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+# csv columns which refer to node names
+_node_columns = ["node", "nodeA", "nodeB", "nodeHV", "nodeMV", "nodeLV", "element1"]
+
+
+def _init_conversion_worker():
+    """Prepares a worker process for many conversions: the conversion plan is built once per
+    worker instead of in the first conversion of each task."""
+    get_conversion_plan()
+
+
+def _output_files(paths, output_dir, extension):
+    """Returns the output file of each path in output_dir, named by the last folder or file name
+    of the path."""
+    names = [os.path.splitext(os.path.basename(os.path.normpath(path)))[0] for path in paths]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if len(duplicated):
+        raise ValueError(
+            "The output files in output_dir are named by the folder names, which must be unique, "
+            + "but these are duplicated: " + str(duplicated)
+        )
+    return [os.path.join(output_dir, name + extension) for name in names]
+
+
+def _csv2pp_task(path, output_file, kwargs):
+    """Converts the csv folder 'path' in a worker process. Returns the net, or the output_file
+    if the net is written to it, and the formatted error if the conversion failed."""
+    try:
+        net = csv2pp(path, **kwargs)
+        if output_file is None:
+            return net, None
+        pp.to_json(net, output_file)
+        return output_file, None
+    except Exception:
+        return None, traceback.format_exc()
+
+
+def csv2pp_many(paths, max_workers=None, output_dir=None, **kwargs):
+    """Converts many folders of csv files in simbench format to pandapower nets via csv2pp() in a
+    pool of worker processes. Each worker prepares the conversion once and converts many folders.
+    The results are yielded in the order in which the conversions finish. Failing conversions do
+    not abort the batch, but their errors are yielded.
+
+    INPUT:
+        **paths** (iterable) - paths of folders which include all csv files
+
+    OPTIONAL:
+        **max_workers** (int, None) - number of worker processes. If None, the number of processors
+        of the machine is used.
+
+        **output_dir** (str, None) - if given, the nets are not sent back to the calling process
+        but written as json files to output_dir, named by the folder names of the paths, and the
+        file names are yielded instead of the nets.
+
+        ****kwargs** - parameters of csv2pp(), e.g. sep, nrows or geodata
+
+    OUTPUT:
+        **results** (generator) - tuples of (path, net, error) in the order of completion. net is
+        the pandapower net (or its json file if output_dir is given) and None if the conversion
+        failed. error is None or the formatted exception of the failed conversion.
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> nets, errors = dict(), dict()
+        >>> for path, net, error in sb.csv2pp_many(paths, max_workers=4):
+        ...     if error is None:
+        ...         nets[path] = net
+        ...     else:
+        ...         errors[path] = error
+    """
+    paths = list(paths)
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        output_files = _output_files(paths, output_dir, ".json")
+    else:
+        output_files = [None] * len(paths)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_conversion_worker
+    ) as executor:
+        futures = {
+            executor.submit(_csv2pp_task, path, output_file, kwargs): path
+            for path, output_file in zip(paths, output_files)
+        }
+        try:
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    net, error = future.result()
+                except Exception:  # e.g. a worker process was terminated abruptly
+                    net, error = None, traceback.format_exc()
+                if error is not None:
+                    logger.warning("The conversion of %s failed:\n%s" % (path, error))
+                yield path, net, error
+        finally:  # if the results are not consumed completely, pending tasks are not started
+            for future in futures:
+                future.cancel()
+
+
+def _pp2csv_data_task(net, reserved_aux_node_names, kwargs):
+    """Converts net (or the json file of net) in a worker process. Returns the csv data and the
+    names of the created auxiliary nodes."""
+    if isinstance(net, str):
+        net = pp.from_json(net)
+    csv_data, aux_node_names = pp2csv_data(
+        net, reserved_aux_node_names=set(reserved_aux_node_names), **kwargs
+    )
+    return csv_data, aux_node_names - reserved_aux_node_names
+
+
+def _rename_aux_nodes(csv_data, aux_node_names, reserved_aux_node_names):
+    """Renames the auxiliary nodes of csv_data whose names are reserved, e.g. by nets converted
+    before, by increasing the number at the end of the names. Returns the final names of the
+    auxiliary nodes."""
+    taken = reserved_aux_node_names | aux_node_names
+    new_names = dict()
+    for name in sorted(aux_node_names & reserved_aux_node_names):
+        base, _, count = name.rpartition("_")
+        if not len(base) or not count.isdigit():
+            base, count = name, "0"
+        count = int(count) + 1
+        while "%s_%i" % (base, count) in taken:
+            count += 1
+        new_names[name] = "%s_%i" % (base, count)
+        taken.add(new_names[name])
+    if not len(new_names):
+        return aux_node_names
+    for tablename, df in csv_data.items():
+        columns = [col for col in _node_columns if col in df.columns]
+        columns += ["id"] if tablename == "Node" else []
+        if len(columns) and df.shape[0]:
+            csv_data[tablename] = df.assign(**{col: df[col].replace(new_names) for col in columns})
+    return (aux_node_names - set(new_names.keys())) | set(new_names.values())
+
+
+def _shift_coordinate_ids(csv_data, shift):
+    """Adds shift to the numbers of the coordinate ids "coord_<number>" of csv_data. Returns the
+    highest number of the coordinate ids after shifting, or shift - 1 if there are none."""
+    highest = shift - 1
+    for tablename, df in csv_data.items():
+        column = "id" if tablename == "Coordinates" else "coordID"
+        if column not in df.columns or not df.shape[0]:
+            continue
+        ids = df[column]
+        is_coord = ids.astype(str).str.startswith("coord_")
+        if not is_coord.any():
+            continue
+        numbers = ids[is_coord].str[len("coord_"):].astype(int) + shift
+        ids = ids.copy()
+        ids.loc[is_coord] = "coord_" + numbers.astype(str)
+        csv_data[tablename] = df.assign(**{column: ids})
+        if tablename == "Coordinates":
+            highest = max(highest, numbers.max())
+    return highest
+
+
+def _merge_csv_data(csv_datas, keep, existing=None):
+    """Merges the csv data of many nets (and the existing csv data) to one dict of csv tables.
+    Rows with duplicated names, voltLvl and subnet are dropped according to keep, profiles are
+    merged via their time column."""
+    existing = dict() if existing is None else existing
+    tablenames = list(dict.fromkeys(tablename for data in csv_datas for tablename in data.keys()))
+    merged = dict()
+    for tablename in tablenames:
+        dfs = [data[tablename] for data in csv_datas if tablename in data.keys()]
+        filled = [df for df in [existing.get(tablename)] + dfs if df is not None and df.shape[0]]
+        if len(filled) < 2:
+            merged[tablename] = filled[0] if len(filled) else dfs[0]
+        elif "Profile" in tablename:
+            merged[tablename] = merge_dataframes(
+                filled, column_to_sort="time", index_time_str="%d.%m.%Y %H:%M"
+            )
+        else:
+            merged[tablename] = _drop_duplicated_rows(
+                tablename, _concat_csv_tables(tablename, filled), keep
+            )
+    return merged
+
+
+def pp2csv_many(
+    nets,
+    path,
+    max_workers=None,
+    mode="w",
+    keep="last",
+    sep=";",
+    exclude_table=set(),
+    nrows=None,
+    reserved_aux_node_names=None,
+    **kwargs,
+):
+    """Converts many pandapower nets to one dataset of csv files in simbench format. The nets are
+    converted via pp2csv_data() in a pool of worker processes. Then, the coordinate ids and the
+    names of auxiliary nodes are allocated centrally in the order of the nets, duplicated data are
+    dropped as by pp2csv(mode="append_unique") and each table is written once.
+    The result equals exporting the nets one after another via pp2csv() with mode
+    "append_unique" and the returned reserved_aux_node_names, except that auxiliary nodes whose
+    names are reserved by previous nets are renamed by increasing the number at the end of their
+    names.
+
+    INPUT:
+        **nets** (iterable) - pandapower nets or paths of their json files
+
+        **path** (str) - folder path, the csv files should be stored into
+
+    OPTIONAL:
+        **max_workers** (int, None) - number of worker processes. If None, the number of processors
+        of the machine is used.
+
+        **mode** ("w", str) - If "w", existing csv files are replaced. If "append_unique", the
+        data of the nets are merged with the existing csv files, see pp2csv().
+
+        **keep** ('last', str) - decides which duplicated data is kept, see pp2csv()
+
+        **sep**, **exclude_table**, **nrows** - see pp2csv()
+
+        **reserved_aux_node_names** (None, set) - set of strings which are not allowed to be used as
+        auxiliary node names
+
+        ****kwargs** - parameters of pp2csv_data(), e.g. export_pp_std_types or
+        drop_inactive_elements
+
+    OUTPUT:
+        **reserved_aux_node_names** (set) - reserved_aux_node_names appended by created auxiliary
+        node names. Is only returned if given as input
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> sb.pp2csv_many([net1, net2, "net3.json"], "folder", max_workers=3)
+    """
+    if mode not in ["w", "append_unique"]:
+        raise ValueError("'mode' must be in ['w', 'append_unique'], not '%s'." % str(mode))
+    nets = list(nets)
+    aux_nodes_are_reserved = reserved_aux_node_names is not None
+    reserved = set(reserved_aux_node_names) if aux_nodes_are_reserved else set()
+    highest_coordinate_number = -1
+    if mode == "append_unique":
+        highest_coordinate_number = _highest_existing_coordinate_number(path, sep)
+
+    # --- convert the nets in parallel, allocate coordinate ids and aux node names in net order
+    csv_datas = list()
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_conversion_worker
+    ) as executor:
+        try:
+            results = executor.map(_pp2csv_data_task, nets, repeat(reserved), repeat(kwargs))
+            all_aux_node_names = set(reserved)
+            for csv_data, aux_node_names in results:
+                all_aux_node_names |= _rename_aux_nodes(
+                    csv_data, aux_node_names, all_aux_node_names
+                )
+                highest_coordinate_number = _shift_coordinate_ids(
+                    csv_data, highest_coordinate_number + 1
+                )
+                csv_datas.append(csv_data)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+    # --- merge the csv data and write each table once
+    if mode == "append_unique":
+        existing = {
+            tablename: read_csv_data(path, sep, tablename)
+            for tablename in {tablename for data in csv_datas for tablename in data.keys()}
+            - exclude_table
+            if os.path.isfile(os.path.join(path, "%s.csv" % tablename))
+        }
+    else:
+        existing = dict()
+    csv_data = _merge_csv_data(csv_datas, keep, existing)
+    os.makedirs(path, exist_ok=True)
+    write2csv(
+        path,
+        csv_data,
+        sep=sep,
+        float_format="%g",
+        keys=set(csv_data.keys()) - exclude_table,
+        nrows=nrows,
+    )
+
+    if aux_nodes_are_reserved:
+        return all_aux_node_names
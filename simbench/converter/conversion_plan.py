@@ -0,0 +1,177 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import threading
+from copy import deepcopy
+import numpy as np
+import pandas as pd
+import pandapower as pp
+from packaging import version
+
+from simbench.converter.format_information import (
+    _csv_table_pp_dataframe_correspondings,
+    _csv_pp_column_correspondings,
+    _cached_format_information,
+    all_columns,
+)
+from simbench.converter.pp_net_manipulation import (
+    _extend_pandapower_net_columns,
+    _prepare_res_bus_table,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+# conversion plans, built once per (pandas, pandapower) version pair
+_conversion_plans = dict()
+_conversion_plans_lock = threading.Lock()
+
+
+def _pp_fix_values(pp_version):
+    """Returns the tuples of pandapower columns and values which are not given in the csv data."""
+    const_percent = [
+        ("const_i_p_percent", 0.0),
+        ("const_z_p_percent", 0.0),
+        ("const_i_q_percent", 0.0),
+        ("const_z_q_percent", 0.0),
+    ] if pp_version >= version.parse("3.2.0") else [
+        ("const_i_percent", 0.0),
+        ("const_z_percent", 0.0),
+    ]
+    return [
+        ("in_service", True),
+        ("scaling", 1.0),
+        ("parallel", 1),
+        ("g_us_per_km", 0.0),
+        ("df", 1.0),
+        ("tap_step_degree", 0.0),
+        ("tap_phase_shifter", False),
+    ] + const_percent + [
+        ("min_e_mwh", 0.0),
+        ("slack", False),
+        ("z_ohm", 0.0),
+    ]
+
+
+def _csv_fix_values():
+    """Returns the tuples of csv columns and values which are not given in pandapower nets."""
+    return [
+        ("dVa", 0.0),
+        ("dVaHV", 0.0),
+        ("dVaMV", 0.0),
+        ("dVaLV", 0.0),
+    ]
+
+
+def _get_parameters_to_rename_and_multiply(drop_bus_geodata, columns=None):
+    """Returns a dict of tuples and a dict of dataframes where csv column names are assigned to
+    pandapower columns names which differ."""
+    columns = columns if columns is not None else all_columns()
+
+    # --- create dummy_net to get pp columns
+    dummy_net = pp.create_empty_network()
+    _extend_pandapower_net_columns(dummy_net)
+    _prepare_res_bus_table(dummy_net)
+    for elm in ["dcline"]:
+        dummy_net[elm] = dummy_net[elm].rename(columns={"type": "std_type"})
+    for elm in ["gen", "sgen"]:
+        dummy_net[elm]["vm_pu"] = np.nan
+        dummy_net[elm]["va_degree"] = np.nan
+
+    # --- get corresponding tables and dataframes
+    corr_strings = _csv_table_pp_dataframe_correspondings(
+        str, drop_bus_geodata
+    )
+    csv_tablenames_, pp_dfnames = _csv_table_pp_dataframe_correspondings(
+        list, drop_bus_geodata
+    )
+
+    # --- initialize tuples_dict
+    tuples_dict = dict.fromkeys(corr_strings, [("id", "name", None)])
+    tuples_dict["NodePFResult*res_bus"] = []
+
+    # --- determine tuples_dict
+    for corr_str, csv_tablename, pp_dfname in zip(
+        corr_strings, csv_tablenames_, pp_dfnames
+    ):
+        # adapt tuples_dict initialization of Type tables
+        if "Type" in csv_tablename:
+            tuples_dict[corr_str] = [("id", "std_type", None)]
+        # get all column correspodings
+        corr_col_tuples = _csv_pp_column_correspondings(csv_tablename)
+        # get csv and pp columns
+        csv_columns = columns[csv_tablename]
+        pp_columns = (
+            dummy_net[pp_dfname].columns
+            if "std_types" not in pp_dfname
+            else pd.DataFrame(dummy_net["std_types"][pp_dfname[10:]]).T.columns
+        )
+        # determine tuples_dict: all tuples which are in columns of both, csv and pp
+        tuples_dict[corr_str] = tuples_dict[corr_str] + [
+            corr_col_tuple
+            for corr_col_tuple in corr_col_tuples
+            if corr_col_tuple[0] in csv_columns
+            and corr_col_tuple[1] in pp_columns
+        ]
+    return tuples_dict
+
+
+class ConversionPlan:
+    """Everything the conversion between simbench csv data and pandapower nets needs to know about
+    the formats, which does not depend on the converted data: table and column correspondences,
+    unit factors, fix values and the behaviour of the installed pandas and pandapower versions.
+    The csv columns and dtypes are provided by get_columns() and get_dtypes(). Use
+    get_conversion_plan() to receive the plan of the installed versions.
+    """
+
+    def __init__(self):
+        self.pandas_version = version.parse(pd.__version__)
+        self.pandapower_version = version.parse(pp.__version__)
+        self.has_reindex_columns = self.pandas_version >= version.parse("0.21.0")
+
+        self._correspondings = {
+            (type_, drop_bus_geodata): _csv_table_pp_dataframe_correspondings(
+                type_, drop_bus_geodata
+            )
+            for type_ in [str, list, pd.DataFrame]
+            for drop_bus_geodata in [True, False]
+        }
+        # tuples of (csv column, pp column, factor to multiply csv values to receive pp values)
+        self.rename_and_multiply = _get_parameters_to_rename_and_multiply(
+            True, _cached_format_information("columns", all_columns)
+        )
+        self.fix_values = {
+            True: _pp_fix_values(self.pandapower_version),
+            False: _csv_fix_values(),
+        }
+        dummy_net = pp.create_empty_network()
+        self.pp_std_type_names = {
+            elm: frozenset(dummy_net.std_types[elm].keys())
+            for elm in ["line", "trafo", "trafo3w"]
+        }
+
+    def __repr__(self):
+        return "%s for pandas %s and pandapower %s" % (
+            self.__class__.__name__, self.pandas_version, self.pandapower_version)
+
+    def correspondings(self, type_, drop_bus_geodata):
+        """Returns a copy of _csv_table_pp_dataframe_correspondings(type_, drop_bus_geodata) for
+        type_ in [str, list, pd.DataFrame]."""
+        return deepcopy(self._correspondings[(type_, drop_bus_geodata)])
+
+
+def get_conversion_plan():
+    """Returns the ConversionPlan of the installed pandas and pandapower versions. The plan is
+    built at the first call and reused afterwards."""
+    key = (pd.__version__, pp.__version__)
+    plan = _conversion_plans.get(key)
+    if plan is None:
+        with _conversion_plans_lock:
+            if key not in _conversion_plans:
+                _conversion_plans[key] = ConversionPlan()
+            plan = _conversion_plans[key]
+    return plan
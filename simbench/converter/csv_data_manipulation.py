@@ -2,6 +2,7 @@
 # Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
 # contributors (see AUTHORS file for details). All rights reserved.
 
+import numpy as np
 import pandas as pd
 from copy import deepcopy
 
@@ -11,6 +12,7 @@ from simbench.converter.auxiliary import (
     idx_in_2nd_array,
     avoid_duplicates_in_column,
 )
+from simbench.converter.pp_net_manipulation import _geojson_points
 
 logger = logging.getLogger(__name__)
 
@@ -192,21 +194,25 @@ def _add_phys_type_and_vm_va_setpoints_to_element_tables(csv_data):
     # setpoint from busbars and not from auxiliary nodes
 
 
-def _extend_coordinates_to_node_shape(csv_data):
-    """Extends the Coordinates table to the shape of Nodes to enable copying simply to bus_geodata."""
+def _extend_coordinates_to_node_shape(csv_data, geodata="geojson"):
+    """Extends the Coordinates table to the shape of Nodes to enable copying simply to the bus
+    table: as GeoJSON strings in column "geo" (geodata "geojson") or as numeric columns "x" and
+    "y" (geodata "numeric"). With geodata "none", column "geo" stays empty."""
     geo = pd.Series(
         None, index=csv_data["Node"].index, name="geo", dtype=object
     )
-    with_coord = ~csv_data["Node"]["coordID"].isnull()
-    idx_in_coordID = idx_in_2nd_array(
-        csv_data["Node"]["coordID"].loc[with_coord].values,
-        csv_data["Coordinates"]["id"].values,
-    )
-    geo.loc[with_coord] = [
-        f'{{"type":"Point", "coordinates":[{x}, {y}]}}'
-        for x, y in zip(
-            csv_data["Coordinates"].loc[idx_in_coordID, "x"].values,
-            csv_data["Coordinates"].loc[idx_in_coordID, "y"].values,
+    if geodata != "none":
+        with_coord = ~csv_data["Node"]["coordID"].isnull()
+        idx_in_coordID = idx_in_2nd_array(
+            csv_data["Node"]["coordID"].loc[with_coord].values,
+            csv_data["Coordinates"]["id"].values,
         )
-    ]
+        x = csv_data["Coordinates"].loc[idx_in_coordID, "x"].values
+        y = csv_data["Coordinates"].loc[idx_in_coordID, "y"].values
+        if geodata == "geojson":
+            geo.loc[with_coord] = _geojson_points(x, y)
+        else:
+            for col, values in [("x", x), ("y", y)]:
+                csv_data["Node"][col] = np.nan
+                csv_data["Node"].loc[with_coord, col] = values
     csv_data["Node"]["geo"] = geo
@@ -9,19 +9,21 @@
 # which where fast enough or not available at the time SimBench was developed.
 
 import os
+import threading
+import warnings
 import pandas as pd
 import numpy as np
 from copy import deepcopy
-from packaging import version
 import pandapower as pp
-from pandapower.diagnostic.diagnostic_functions import DeviationFromStdType
-from pandapower.plotting import create_generic_coordinates
-import warnings
 
 try:
     from pandapower.toolbox.grid_modification import drop_inactive_elements as pp_drop_inactive_elements
 except ImportError:
     from pandapower import drop_inactive_elements as pp_drop_inactive_elements
+try:
+    from pandapower.std_types import required_std_type_parameters
+except ImportError:
+    required_std_type_parameters = None
 
 import logging
 
@@ -30,27 +32,27 @@ from simbench.converter.auxiliary import (
     idx_in_2nd_array,
     avoid_duplicates_in_column,
     get_unique_duplicated_dict,
-    ensure_iterability,
     merge_dataframes,
     ensure_full_column_data_existence,
 )
 from simbench.converter.format_information import (
     _correct_calc_type,
-    _csv_table_pp_dataframe_correspondings,
-    _csv_pp_column_correspondings,
     csv_tablenames,
-    get_columns,
 )
+from simbench.converter.conversion_plan import get_conversion_plan
+from simbench.converter.instrumentation import conversion_stage
 from simbench.converter.read_and_write import (
     _init_csv_tables,
     read_csv_data,
     write2csv,
 )
 from simbench.converter.pp_net_manipulation import (
+    _copy_net_for_export,
     _extend_pandapower_net_columns,
     _add_dspf_calc_type_and_phys_type_columns,
     _add_vm_va_setpoints_to_buses,
     _prepare_res_bus_table,
+    create_generic_tree_coordinates,
     replace_branch_switches,
     create_branch_switches,
     _add_coordID,
@@ -60,6 +62,7 @@ from simbench.converter.pp_net_manipulation import (
     convert_parallel_branches,
     merge_busbar_coordinates,
     move_slack_gens_to_ext_grid,
+    deviation_from_std_type,
     provide_subnet_col,
     provide_voltLvl_col,
     provide_substation_cols,
@@ -78,6 +81,17 @@ logger = logging.getLogger(__name__)
 
 __author__ = "smeinecke"
 
+# warnings.catch_warnings() changes the process-wide warning filters, so conversions in parallel
+# threads must not interleave there
+_catch_warnings_lock = threading.Lock()
+
+# bus columns of the measurement sides of pandapower branch elements (None: bus measurements)
+_measurement_side_buses = {
+    "trafo": {"hv": "hv_bus", "lv": "lv_bus"},
+    "line": {"from": "from_bus", "to": "to_bus"},
+    "bus": None,
+}
+
 
 def csv2pp(
     path,
@@ -85,6 +99,7 @@ def csv2pp(
     add_folder_name=None,
     nrows=None,
     fill_bus_geo_by_generic_data=True,
+    geodata="geojson",
 ):
     """
     Conversion function from simbench csv format to pandapower.
@@ -105,6 +120,8 @@ def csv2pp(
         created in case of missing geo data. If True, generic coordinates are create when at least
         one bus misses geo data.
 
+        **geodata** (str, "geojson") - how the bus coordinates are stored, see csv_data2pp()
+
     OUTPUT:
         **net** (pandapowerNet) - the created pandapower net from csv files data
 
@@ -124,62 +141,111 @@ def csv2pp(
 
     # run net creation
     net = csv_data2pp(
-        csv_data, fill_bus_geo_by_generic_data=fill_bus_geo_by_generic_data
+        csv_data,
+        fill_bus_geo_by_generic_data=fill_bus_geo_by_generic_data,
+        copy=False,
+        geodata=geodata,
     )
 
     return net
 
 
-def csv_data2pp(csv_data, fill_bus_geo_by_generic_data=False):
+def csv_data2pp(
+    csv_data, fill_bus_geo_by_generic_data=False, copy=True, geodata="geojson"
+):
     """Internal functionality of csv2pp, but with a given dict of csv_data as input instead of
-    csv files."""
+    csv files.
+    If copy is False, csv_data is not copied but consumed: its tables are changed and used by the
+    net, so that the caller must not use them anymore. This avoids copying all tables, e.g. if
+    csv_data is created only for the conversion.
+    geodata determines how the bus coordinates are stored:
+    "geojson" - GeoJSON strings in net.bus.geo; buses without coordinates are handled according
+    to fill_bus_geo_by_generic_data.
+    "numeric" - numeric columns net.bus.x and net.bus.y; net.bus.geo remains empty until
+    materialize_bus_geo(net) is called, which creates the same GeoJSON strings as "geojson".
+    "none" - no geodata.
+    With "numeric" and "none", no generic coordinates are created."""
+    if geodata not in ["geojson", "numeric", "none"]:
+        raise ValueError(
+            "geodata must be 'geojson', 'numeric' or 'none', not '%s'." % str(geodata)
+        )
     # --- initializations
-    csv_data = deepcopy(csv_data)
+    with conversion_stage("copy_csv_data"):
+        csv_data = deepcopy(csv_data) if copy else dict(csv_data)
     net = pp.create_empty_network()
 
     # --- extend pandapower net columns to store csv information that are unused in pandapower but
     # possible informative or helpful for reconversion
     _extend_pandapower_net_columns(net)
+    if geodata == "numeric":
+        for col in ["x", "y"]:
+            net.bus[col] = pd.Series(dtype=float)
 
     # --- correction of csv_data and preperation for converting
-    _ensure_safe_csv_ids(csv_data)
-    reindex_dict_dataframes(csv_data)
-    _ensure_single_switch_at_aux_node_and_copy_vm_setp(
-        csv_data, new_type_name="multi_auxiliary"
-    )
-    _convert_measurement(csv_data)
-    _sort_switch_nodes_and_prepare_element_and_et(csv_data)
-    convert_node_type(csv_data)
-    _correct_calc_type(csv_data)
-    _correct_autoTapSide_of_nonTapTrafos(csv_data)
-    _add_phys_type_and_vm_va_setpoints_to_element_tables(csv_data)
-    _extend_coordinates_to_node_shape(csv_data)
-    convert_line_type_acronym(csv_data)
+    with conversion_stage("_ensure_safe_csv_ids"):
+        _ensure_safe_csv_ids(csv_data)
+    with conversion_stage("reindex_dict_dataframes"):
+        reindex_dict_dataframes(csv_data)
+    # the switch related steps are skipped for csv data without switches, e.g. of no_sw grids
+    # created by generate_no_sw_variant_of_csv_data()
+    has_switches = csv_data["Switch"].shape[0] > 0
+    if has_switches:
+        with conversion_stage("_ensure_single_switch_at_aux_node_and_copy_vm_setp"):
+            _ensure_single_switch_at_aux_node_and_copy_vm_setp(
+                csv_data, new_type_name="multi_auxiliary"
+            )
+    with conversion_stage("_convert_measurement"):
+        _convert_measurement(csv_data)
+    if has_switches:
+        with conversion_stage("_sort_switch_nodes_and_prepare_element_and_et"):
+            _sort_switch_nodes_and_prepare_element_and_et(csv_data)
+    with conversion_stage("convert_node_type"):
+        convert_node_type(csv_data)
+    with conversion_stage("_correct_calc_type"):
+        _correct_calc_type(csv_data)
+    with conversion_stage("_correct_autoTapSide_of_nonTapTrafos"):
+        _correct_autoTapSide_of_nonTapTrafos(csv_data)
+    with conversion_stage("_add_phys_type_and_vm_va_setpoints_to_element_tables"):
+        _add_phys_type_and_vm_va_setpoints_to_element_tables(csv_data)
+    with conversion_stage("_extend_coordinates_to_node_shape"):
+        _extend_coordinates_to_node_shape(csv_data, geodata)
+    with conversion_stage("convert_line_type_acronym"):
+        convert_line_type_acronym(csv_data)
     if not csv_data["Transformer"]["autoTapSide"].isnull().all():
         csv_data["Transformer"]["autoTapSide"] = csv_data["Transformer"][
             "autoTapSide"
         ].str.lower()
 
     # --- convert csv_data
-    _csv_profiles_to_pp(net, csv_data)
+    with conversion_stage("_csv_profiles_to_pp"):
+        _csv_profiles_to_pp(net, csv_data)
     if (
         "StudyCases" in csv_data.keys()
         and isinstance(csv_data["StudyCases"], pd.DataFrame)
         and csv_data["StudyCases"].shape[0]
     ):
         net["loadcases"] = csv_data["StudyCases"]
-    _csv_types_to_pp1(net, csv_data)
-    _multi_parameter_determination(csv_data)
-    _convert_elements_and_types(csv_data, net)
-    create_branch_switches(net)
-    net.bus.loc[net.bus.type == "multi_auxiliary", "type"] = "auxiliary"
-    _set_vm_setpoint_to_trafos(net, csv_data)
-    _set_dependency_table_parameters(net)
-    _csv_types_to_pp2(net)
-    ensure_bus_index_columns_as_int(net)
+    with conversion_stage("_csv_types_to_pp1"):
+        _csv_types_to_pp1(net, csv_data)
+    with conversion_stage("_multi_parameter_determination"):
+        _multi_parameter_determination(csv_data)
+    with conversion_stage("_convert_elements_and_types"):
+        _convert_elements_and_types(csv_data, net)
+    if has_switches:
+        with conversion_stage("create_branch_switches"):
+            create_branch_switches(net)
+        net.bus.loc[net.bus.type == "multi_auxiliary", "type"] = "auxiliary"
+    with conversion_stage("_set_vm_setpoint_to_trafos"):
+        _set_vm_setpoint_to_trafos(net, csv_data)
+    with conversion_stage("_set_dependency_table_parameters"):
+        _set_dependency_table_parameters(net)
+    with conversion_stage("_csv_types_to_pp2"):
+        _csv_types_to_pp2(net)
+    with conversion_stage("ensure_bus_index_columns_as_int"):
+        ensure_bus_index_columns_as_int(net)
 
     # --- ensure geodata
-    if not fill_bus_geo_by_generic_data:
+    if geodata == "geojson" and not fill_bus_geo_by_generic_data:
         if n_missing_geo_data := sum(
             pd.isnull(net.bus.geo) | (net.bus.geo == "")
         ):
@@ -190,8 +256,8 @@ def csv_data2pp(csv_data, fill_bus_geo_by_generic_data=False):
                     f"{len(net.bus)-n_missing_geo_data} buses had geo data, "
                     f"{n_missing_geo_data} buses missed geo data)."
                 )
-            net.bus["geo"] = None
-            create_generic_coordinates(net)
+            with conversion_stage("create_generic_tree_coordinates"):
+                create_generic_tree_coordinates(net)
 
     return net
 
@@ -208,6 +274,7 @@ def pp2csv(
     drop_inactive_elements=True,
     round_qLoad_by_voltLvl=False,
     reserved_aux_node_names=None,
+    check_std_type_deviation=True,
 ):
     """
     Conversion function from pandapower to simbench csv format.
@@ -247,6 +314,10 @@ def pp2csv(
         **reserved_aux_node_names** (None, set) - set of strings which are not allowed to be used as
         auxiliary node names
 
+        **check_std_type_deviation** (True, boolean) - If True, a warning is logged if parameters
+        of elements deviate from their standard types, since only the standard type values are
+        converted. The check can be skipped, e.g. for nets which are known to be consistent.
+
     OUTPUT:
         **reserved_aux_node_names** (set) - reserved_aux_node_names appended by created auxiliary
         node names. Is only returned if given as input
@@ -264,12 +335,7 @@ def pp2csv(
         reserved_aux_node_names if aux_nodes_are_reserved else set()
     )
     if mode == "append_unique":
-        coords = read_csv_data(path, sep, "Coordinates")
-        if coords.shape[0]:
-            idx = coords.id.str.startswith("coord_")
-            coords_split = coords.id.loc[idx].str.split("coord_")
-            coords_values = coords_split.str[-1].astype(int)
-            highest_existing_coordinate_number = coords_values.max()
+        highest_existing_coordinate_number = _highest_existing_coordinate_number(path, sep)
 
     # --- create csv data and res data as dicts of DataFrames
     csv_data, reserved_aux_node_names = pp2csv_data(
@@ -279,6 +345,7 @@ def pp2csv(
         highest_existing_coordinate_number=highest_existing_coordinate_number,
         round_qLoad_by_voltLvl=round_qLoad_by_voltLvl,
         reserved_aux_node_names=reserved_aux_node_names,
+        check_std_type_deviation=check_std_type_deviation,
     )
 
     # --- export the grid data dict DataFrames to csv files
@@ -297,6 +364,18 @@ def pp2csv(
         return reserved_aux_node_names
 
 
+def _highest_existing_coordinate_number(path, sep):
+    """Returns the highest number of the coordinate ids "coord_<number>" in the Coordinates.csv
+    file of path, or -1 if there are none."""
+    coords = read_csv_data(path, sep, "Coordinates")
+    idx = coords.id.astype(str).str.startswith("coord_")
+    if not idx.any():
+        return -1
+    coords_split = coords.id.loc[idx].str.split("coord_")
+    coords_values = coords_split.str[-1].astype(int)
+    return coords_values.max()
+
+
 def pp2csv_data(
     net1,
     export_pp_std_types=False,
@@ -304,14 +383,17 @@ def pp2csv_data(
     highest_existing_coordinate_number=-1,
     round_qLoad_by_voltLvl=False,
     reserved_aux_node_names=None,
+    check_std_type_deviation=True,
 ):
     """Internal functionality of pp2csv, but without writing the determined dict to csv files.
     For parameter explanations, please have a look at the pp2csv() docstring.
+    net1 is not changed. To avoid copying large data, the returned profile tables share their
+    values with net1.profiles.
     """
     # --- initializations
-    net = deepcopy(
-        net1
-    )  # necessary because in net will be changed in converter function
+    with conversion_stage("copy_net"):
+        # net is changed by the conversion, but only the changed tables are copied
+        net = _copy_net_for_export(net1)
     csv_data = _init_csv_tables(
         ["elements", "profiles", "types", "res_elements"]
     )
@@ -332,8 +414,13 @@ def pp2csv_data(
     _extend_pandapower_net_columns(net)
     if drop_inactive_elements:
         # attention: trafo3ws are not considered in current version of drop_inactive_elements()
-        pp_drop_inactive_elements(net, respect_switches=False)
-    dev_from_std = DeviationFromStdType().diagnostic(net)
+        with conversion_stage("drop_inactive_elements"):
+            pp_drop_inactive_elements(net, respect_switches=False)
+    if check_std_type_deviation:
+        with conversion_stage("deviation_from_std_type"):
+            dev_from_std = deviation_from_std_type(net)
+    else:
+        dev_from_std = None
     if dev_from_std:
         logger.warning(
             "There are deviations from standard types in elements: "
@@ -341,15 +428,19 @@ def pp2csv_data(
             + ". Only the standard "
             + "type values are converted to csv."
         )
-    convert_parallel_branches(net)
-    merge_busbar_coordinates(net, True)
-    move_slack_gens_to_ext_grid(net)
+    with conversion_stage("convert_parallel_branches"):
+        convert_parallel_branches(net)
+    with conversion_stage("merge_busbar_coordinates"):
+        merge_busbar_coordinates(net, True)
+    with conversion_stage("move_slack_gens_to_ext_grid"):
+        move_slack_gens_to_ext_grid(net)
 
     scaling_is_not_1 = []
     for i in pp.pp_elements():
-        # prevent elements without name
-        net[i] = ensure_full_column_data_existence(net, i, "name")
-        avoid_duplicates_in_column(net, i, "name")
+        with conversion_stage("ensure_unique_names:%s" % i):
+            # prevent elements without name
+            net[i] = ensure_full_column_data_existence(net, i, "name")
+            avoid_duplicates_in_column(net, i, "name")
         # log scaling factor different from 1
         if "scaling" in net[i].columns:
             if not np.allclose(net[i]["scaling"].values, 1):
@@ -368,37 +459,53 @@ def pp2csv_data(
         )
 
     # further preparation
-    provide_subnet_col(net)  # TODO: 4 lines and 1 dc line with diffrent subnet
-    provide_voltLvl_col(net)
-    provide_substation_cols(net)
-    convert_node_type(net)
-    _add_dspf_calc_type_and_phys_type_columns(net)
-    _add_vm_va_setpoints_to_buses(net)
-    _prepare_res_bus_table(net)
-    reserved_aux_node_names = replace_branch_switches(
-        net, reserved_aux_node_names
-    )
-    _convert_measurement(net)
-    _add_coordID(net, highest_existing_coordinate_number)
+    with conversion_stage("provide_subnet_col"):
+        provide_subnet_col(net)  # TODO: 4 lines and 1 dc line with diffrent subnet
+    with conversion_stage("provide_voltLvl_col"):
+        provide_voltLvl_col(net)
+    with conversion_stage("provide_substation_cols"):
+        provide_substation_cols(net)
+    with conversion_stage("convert_node_type"):
+        convert_node_type(net)
+    with conversion_stage("_add_dspf_calc_type_and_phys_type_columns"):
+        _add_dspf_calc_type_and_phys_type_columns(net)
+    with conversion_stage("_add_vm_va_setpoints_to_buses"):
+        _add_vm_va_setpoints_to_buses(net)
+    with conversion_stage("_prepare_res_bus_table"):
+        _prepare_res_bus_table(net)
+    with conversion_stage("replace_branch_switches"):
+        reserved_aux_node_names = replace_branch_switches(
+            net, reserved_aux_node_names
+        )
+    with conversion_stage("_convert_measurement"):
+        _convert_measurement(net)
+    with conversion_stage("_add_coordID"):
+        _add_coordID(net, highest_existing_coordinate_number)
     if not net["trafo"]["autoTapSide"].isnull().all():
         net["trafo"]["autoTapSide"] = net["trafo"]["autoTapSide"].str.upper()
 
     # --- convert net
-    _pp_profiles_to_csv(net, csv_data)
+    with conversion_stage("_pp_profiles_to_csv"):
+        _pp_profiles_to_csv(net, csv_data)
     if "loadcases" in net:
         csv_data["StudyCases"] = net["loadcases"]
     else:
         csv_data["StudyCases"] = pd.DataFrame()
-    _pp_types_to_csv1(net, export_pp_std_types)
-    _multi_parameter_determination(net)
-    _convert_elements_and_types(net, csv_data)
-    _pp_types_to_csv2(csv_data)
+    with conversion_stage("_pp_types_to_csv1"):
+        _pp_types_to_csv1(net, export_pp_std_types)
+    with conversion_stage("_multi_parameter_determination"):
+        _multi_parameter_determination(net)
+    with conversion_stage("_convert_elements_and_types"):
+        _convert_elements_and_types(net, csv_data)
+    with conversion_stage("_pp_types_to_csv2"):
+        _pp_types_to_csv2(csv_data)
 
     if round_qLoad_by_voltLvl:
         _round_qLoad_by_voltLvl(csv_data)
 
     # --- post_conversion_checks
-    _check_id_voltLvl_subnet(csv_data)
+    with conversion_stage("_check_id_voltLvl_subnet"):
+        _check_id_voltLvl_subnet(csv_data)
 
     if aux_nodes_are_reserved:
         return csv_data, reserved_aux_node_names
@@ -484,130 +591,123 @@ def _convert_measurement(data):
     """Converts the measurement columns "side", "element", "measurement_type", respectively
     "element1", "element2", "variable"."""
     if _is_pp_type(data):
-        rename_dict = {"side": "element1", "measurement_type": "variable"}
-        data["measurement"] = data["measurement"].rename(columns=rename_dict)
-        data["measurement"]["element2"] = ""
-        for element_type in ["trafo", "line", "bus"]:
-            idx = data["measurement"].index[
-                data["measurement"]["element_type"] == element_type
-            ]
-            if element_type in ["trafo", "line"]:
-                this_branch_measurements = data["measurement"].loc[idx]
-                for side in this_branch_measurements["element1"].unique():
-                    idx_side = this_branch_measurements.index[
-                        this_branch_measurements["element1"] == side
-                    ]
-                    data["measurement"].loc[idx_side, "element1"] = (
-                        data.bus.name.loc[
-                            data[element_type][side + "_bus"].loc[
-                                data["measurement"]["element"].loc[idx_side]
-                            ]
-                        ].values
-                    )
-                data["measurement"].loc[idx, "element2"] = (
-                    data[element_type]
-                    .name.loc[data["measurement"]["element"].loc[idx]]
-                    .values
-                )
-            else:
-                data["measurement"].loc[idx, "element1"] = data.bus.name.loc[
-                    data["measurement"]["element"][idx]
-                ].values
-        del data["measurement"]["element"]
+        _convert_pp_measurement_to_csv(data)
     else:
-        rename_dict = {"element": "element2", "measurement_type": "variable"}
         _sort_measurement_elements(data)
-        rename_dict = {y: x for x, y in rename_dict.items()}
-        data["Measurement"] = data["Measurement"].rename(columns=rename_dict)
-
-        # --- determine which measurement indices are which element type -> fill "element_type"
-        idx_trafo = (
-            data["Measurement"]
-            .index[
-                data["Measurement"]["element"].isin(data["Transformer"]["id"])
-            ]
-            .astype(int)
-        )
-        idx_line = (
-            data["Measurement"]
-            .index[data["Measurement"]["element"].isin(data["Line"]["id"])]
-            .astype(int)
-        )
-        idx_bus = (
-            data["Measurement"]
-            .index.difference(idx_line.union(idx_trafo))
-            .astype(int)
-        )
-        n_no_element2_info = data["Measurement"]["element"].isnull().sum()
-        if n_no_element2_info != len(idx_bus):
-            logger.warning(
-                "%i Measurement have no element2 info, but "
-                % n_no_element2_info
-                + "%i are assumed as bus measurements. " % len(idx_bus)
-                + "Most likely there are line or "
-                + "trafo names given in element2 which do not exist in the "
-                + "csv_data[element] table."
-            )
-        data["Measurement"]["element_type"] = "bus"
-        data["Measurement"].loc[idx_trafo, "element_type"] = "trafo"
-        data["Measurement"].loc[idx_line, "element_type"] = "line"
-
-        # --- fill "element" column
-        data["Measurement"].loc[idx_trafo, "element"] = data[
-            "Transformer"
-        ].index[
-            idx_in_2nd_array(
-                data["Measurement"]["element"].loc[idx_trafo].values,
-                data["Transformer"]["id"].values,
-            )
-        ]
-        data["Measurement"].loc[idx_line, "element"] = data["Line"].index[
-            idx_in_2nd_array(
-                data["Measurement"]["element"].loc[idx_line].values,
-                data["Line"]["id"].values,
-            )
-        ]
-        data["Measurement"].loc[idx_bus, "element"] = data["Node"].index[
-            idx_in_2nd_array(
-                data["Measurement"]["element1"].loc[idx_bus].values,
-                data["Node"]["id"].values,
+        _convert_csv_measurement_to_pp(data)
+
+
+def _positions_in(keys, values):
+    """Returns the positions of values in keys (of the first occurrence if keys contains
+    duplicates) and -1 for values which miss in keys."""
+    keys = pd.Index(keys)
+    if keys.is_unique:
+        return keys.get_indexer(values)
+    is_first = ~keys.duplicated()
+    pos = keys[is_first].get_indexer(values)
+    return np.where(pos >= 0, np.flatnonzero(is_first)[pos], -1)
+
+
+def _convert_pp_measurement_to_csv(net):
+    """Converts the columns "side", "element" and "measurement_type" of net.measurement into
+    "element1" (bus name), "element2" (branch name) and "variable" by one lookup per element
+    type."""
+    meas = net["measurement"].rename(
+        columns={"side": "element1", "measurement_type": "variable"}
+    )
+    element_types = meas["element_type"].values
+    elements = meas["element"].values
+    sides = meas["element1"].values
+    element1 = sides.astype(object)
+    element2 = np.full(meas.shape[0], "", dtype=object)
+    bus_names = net.bus["name"].values
+
+    for element_type, side_buses in _measurement_side_buses.items():
+        is_type = element_types == element_type
+        if not is_type.any():
+            continue
+        pos = _positions_in(net[element_type].index, elements[is_type])
+        if (pos < 0).any():
+            raise ValueError(
+                "These %s indices of measurements miss in net.%s: " % (element_type, element_type)
+                + str(list(pd.unique(elements[is_type][pos < 0])))
             )
-        ]
-
-        # --- fill "side" column
-        bus_indices = data["Node"].index[
-            idx_in_2nd_array(
-                data["Measurement"]["element1"].values,
-                data["Node"]["id"].values,
+        if element_type == "bus":
+            element1[is_type] = bus_names[pos]
+            continue
+        type_sides = sides[is_type]
+        invalid = ~np.isin(type_sides, list(side_buses))
+        if invalid.any():
+            raise ValueError(
+                "The sides of %s measurements must be in %s, not " % (
+                    element_type, str(list(side_buses)))
+                + str(list(pd.unique(type_sides[invalid])))
             )
-        ]
-        bus_names = pd.Series(
-            data["Node"]["id"].loc[bus_indices].values,
-            index=data["Measurement"].index,
-        )
-        data["Measurement"]["side"] = ""
-        are_hv = ensure_iterability(
-            bus_names.loc[idx_trafo].values
-            == data["Transformer"]["nodeHV"]
-            .loc[data["Measurement"]["element"].loc[idx_trafo]]
-            .values
+        buses = np.empty(len(pos), dtype=np.int64)
+        for side, bus_col in side_buses.items():
+            is_side = type_sides == side
+            buses[is_side] = net[element_type][bus_col].values[pos[is_side]]
+        element1[is_type] = bus_names[_positions_in(net.bus.index, buses)]
+        element2[is_type] = net[element_type]["name"].values[pos]
+
+    meas["element1"] = element1
+    meas["element2"] = element2
+    del meas["element"]
+    net["measurement"] = meas
+
+
+def _convert_csv_measurement_to_pp(csv_data):
+    """Converts the columns "element1" (node name), "element2" (branch name) and "variable" of the
+    Measurement table into "element_type", "element", "side" and "measurement_type" by one lookup
+    per table."""
+    meas = csv_data["Measurement"].rename(
+        columns={"element2": "element", "variable": "measurement_type"}
+    )
+    element1 = meas["element1"].values
+    element2 = meas["element"].values
+
+    # --- determine the element type of each measurement
+    trafo_pos = _positions_in(csv_data["Transformer"]["id"], element2)
+    line_pos = _positions_in(csv_data["Line"]["id"], element2)
+    is_line = line_pos >= 0
+    is_trafo = (trafo_pos >= 0) & ~is_line
+    is_bus = ~(is_line | is_trafo)
+    n_no_element2_info = meas["element"].isnull().sum()
+    if n_no_element2_info != is_bus.sum():
+        logger.warning(
+            "%i Measurement have no element2 info, but " % n_no_element2_info
+            + "%i are assumed as bus measurements. " % is_bus.sum()
+            + "Most likely there are line or "
+            + "trafo names given in element2 which do not exist in the "
+            + "csv_data[element] table."
         )
-        data["Measurement"].loc[idx_trafo, "side"] = [
-            "hv" if is_hv else "lv" for is_hv in are_hv
-        ]
-        are_from = ensure_iterability(
-            bus_names.loc[idx_line].values
-            == data["Line"]["nodeA"]
-            .loc[data["Measurement"]["element"].loc[idx_line]]
-            .values
+    node_pos = _positions_in(csv_data["Node"]["id"], element1)
+    if (node_pos < 0).any():
+        raise ValueError(
+            "These element1 values of the Measurement table miss in the Node table: "
+            + str(list(pd.unique(element1[node_pos < 0])))
         )
-        data["Measurement"].loc[idx_line, "side"] = [
-            "from" if is_from else "to" for is_from in are_from
-        ]
-        data["Measurement"].loc[
-            data["Measurement"]["side"] == "", "side"
-        ] = None
-        del data["Measurement"]["element1"]
+    element_type = np.full(meas.shape[0], "bus", dtype=object)
+    element_type[is_trafo] = "trafo"
+    element_type[is_line] = "line"
+
+    # --- fill "element" and "side" columns
+    element = np.empty(meas.shape[0], dtype=object)
+    element[is_bus] = csv_data["Node"].index.values[node_pos[is_bus]]
+    side = np.full(meas.shape[0], None, dtype=object)
+    for is_type, pos, tablename, node_col, sides in [
+        (is_trafo, trafo_pos, "Transformer", "nodeHV", ("hv", "lv")),
+        (is_line, line_pos, "Line", "nodeA", ("from", "to")),
+    ]:
+        element[is_type] = csv_data[tablename].index.values[pos[is_type]]
+        is_first_side = element1[is_type] == csv_data[tablename][node_col].values[pos[is_type]]
+        side[is_type] = np.where(is_first_side, *sides)
+
+    meas["element_type"] = element_type
+    meas["element"] = element
+    meas["side"] = side
+    del meas["element1"]
+    csv_data["Measurement"] = meas
 
 
 def _sort_measurement_elements(csv_data):
@@ -627,11 +727,14 @@ def _sort_measurement_elements(csv_data):
             + str(list(idx_both_is_node))
         )
 
-    el1_data = deepcopy(csv_data["Measurement"].element1[idx_el2_is_node])
-    csv_data["Measurement"].loc[idx_el2_is_node, "element1"] = csv_data[
-        "Measurement"
-    ].element2[idx_el2_is_node]
-    csv_data["Measurement"].loc[idx_el2_is_node, "element2"] = el1_data
+    if idx_el2_is_node.any():
+        el1 = csv_data["Measurement"].element1.values
+        el2 = csv_data["Measurement"].element2.values
+        is_swapped = idx_el2_is_node.values
+        csv_data["Measurement"] = csv_data["Measurement"].assign(
+            element1=np.where(is_swapped, el2, el1),
+            element2=np.where(is_swapped, el1, el2),
+        )
 
 
 def _csv_profiles_to_pp(net, csv_data):
@@ -715,26 +818,47 @@ def _csv_types_to_pp2(net):
         )
         if element_type == "line":
             _assume_cs_ohl_line_type(merged_type_table)
-        data = merged_type_table.to_dict("index")
-        pp.create_std_types(net, data, element_type)
+        _create_std_types_in_bulk(net, merged_type_table, element_type)
 
-        # --- load type data into element tables
+        # --- load type data into element tables by one indexed lookup of all elements
         type_columns = net[element_type].columns.intersection(
             net[tablename].columns
         )
-        uniq_types = net[element_type].std_type.unique()
-        for uniq_type in uniq_types:
-            this_type_elm = net[element_type].std_type == uniq_type
-            net[element_type].loc[this_type_elm, type_columns] = (
-                merged_type_table.loc[uniq_type, type_columns]
-                .values.reshape(1, -1)
-                .repeat(sum(this_type_elm), axis=0)
+        std_type = net[element_type].std_type
+        type_pos = merged_type_table.index.get_indexer(std_type.values)
+        unknown = std_type.notnull().values & (type_pos < 0)
+        if unknown.any():
+            raise ValueError(
+                "These std_types of %s are not given in the type data: " % element_type
+                + str(sorted(set(std_type.values[unknown])))
             )
+        has_type = type_pos >= 0
+        if has_type.any():
+            net[element_type].loc[has_type, type_columns] = merged_type_table[
+                type_columns
+            ].values[type_pos[has_type]]
 
         # --- delete dataframes like net["LineType*std_types|line"]
         del net[tablename]
 
 
+def _create_std_types_in_bulk(net, type_table, element_type):
+    """Adds all rows of type_table to net.std_types[element_type] at once. The required
+    parameters are checked once for the columns of the table instead of for every type."""
+    if required_std_type_parameters is None:
+        pp.create_std_types(net, type_table.to_dict("index"), element_type)
+        return
+    missing = [
+        par for par in required_std_type_parameters(element_type)
+        if par not in type_table.columns
+    ]
+    if len(missing):
+        raise UserWarning(
+            "%s are required as %s type parameters." % (missing, element_type)
+        )
+    net.std_types[element_type].update(type_table.to_dict("index"))
+
+
 def _assume_cs_ohl_line_type(line_types_df):
     """Assumes some known types as cable or overhead lines."""
     cable_name_parts = ["NA", "NY", "N2XS"]
@@ -833,13 +957,13 @@ def _pp_types_to_csv1(net, export_pp_std_types):
 
     # --- determine line, trafo and trafo3w typenames to be converted,
     # --- considering export_pp_std_types. changes net.std_types dicts into dataframes
-    dummy_net = pp.create_empty_network()
+    pp_std_type_names = get_conversion_plan().pp_std_type_names
     pp_elms_with_type = ["line", "trafo", "trafo3w"]
     for elm in pp_elms_with_type:
         if export_pp_std_types:
             typenames2convert = set(net.std_types[elm].keys())
         else:
-            pp_typenames = set(dummy_net.std_types[elm].keys())
+            pp_typenames = set(pp_std_type_names[elm])
             unused_pp_typenames = pp_typenames - set(
                 net[elm].std_type.unique()
             )
@@ -991,7 +1115,7 @@ def _rename_and_split_input_tables(data):
     split_ppelm_into_type_and_elm = ["dcline"] if _is_pp_type(data) else []
     input_elm_col = "pp" if _is_pp_type(data) else "csv"
     output_elm_col = "csv" if _is_pp_type(data) else "pp"
-    corr_df = _csv_table_pp_dataframe_correspondings(
+    corr_df = get_conversion_plan().correspondings(
         pd.DataFrame, not _is_pp_type(data)
     )
     corr_df["comb_str"] = corr_df["csv"] + "*" + corr_df["pp"]
@@ -1052,9 +1176,7 @@ def _get_split_gen_val(element):
 
 def _rename_and_multiply_columns(data):
     """Renames the columns of all dataframes as needed in output data."""
-    to_rename_and_multiply_tuples = _get_parameters_to_rename_and_multiply(
-        True
-    )
+    to_rename_and_multiply_tuples = get_conversion_plan().rename_and_multiply
     for corr_str, tuples in to_rename_and_multiply_tuples.items():
         # --- remove "type" from data if "std_type" exists too
         if (
@@ -1099,66 +1221,12 @@ def _rename_and_multiply_columns(data):
             data[corr_str].loc[:, col] *= factors
 
 
-def _get_parameters_to_rename_and_multiply(drop_bus_geodata):
-    """Returns a dict of tuples and a dict of dataframes where csv column names are assigned to
-    pandapower columns names which differ."""
-    # --- create dummy_net to get pp columns
-    dummy_net = pp.create_empty_network()
-    _extend_pandapower_net_columns(dummy_net)
-    _prepare_res_bus_table(dummy_net)
-    for elm in ["dcline"]:
-        dummy_net[elm] = dummy_net[elm].rename(columns={"type": "std_type"})
-    for elm in ["gen", "sgen"]:
-        dummy_net[elm]["vm_pu"] = np.nan
-        dummy_net[elm]["va_degree"] = np.nan
-
-    # --- get corresponding tables and dataframes
-    corr_strings = _csv_table_pp_dataframe_correspondings(
-        str, drop_bus_geodata
-    )
-    csv_tablenames_, pp_dfnames = _csv_table_pp_dataframe_correspondings(
-        list, drop_bus_geodata
-    )
-
-    # --- initialize tuples_dict
-    tuples_dict = dict.fromkeys(corr_strings, [("id", "name", None)])
-    tuples_dict["NodePFResult*res_bus"] = []
-
-    # --- determine tuples_dict
-    for corr_str, csv_tablename, pp_dfname in zip(
-        corr_strings, csv_tablenames_, pp_dfnames
-    ):
-        # adapt tuples_dict initialization of Type tables
-        if "Type" in csv_tablename:
-            tuples_dict[corr_str] = [("id", "std_type", None)]
-        # get all column correspodings
-        corr_col_tuples = _csv_pp_column_correspondings(csv_tablename)
-        # get csv and pp columns
-        csv_columns = get_columns(csv_tablename)
-        pp_columns = (
-            dummy_net[pp_dfname].columns
-            if "std_types" not in pp_dfname
-            else pd.DataFrame(dummy_net["std_types"][pp_dfname[10:]]).T.columns
-        )
-        # determine tuples_dict: all tuples which are in columns of both, csv and pp
-        tuples_dict[corr_str] = tuples_dict[corr_str] + [
-            corr_col_tuple
-            for corr_col_tuple in corr_col_tuples
-            if corr_col_tuple[0] in csv_columns
-            and corr_col_tuple[1] in pp_columns
-        ]
-        # unused:
-    #    dfs_dict = {key: pd.DataFrame(data, columns=["csv_col", "pp_col", "factor"]) for key, data in
-    #                tuples_dict.items()}
-    return tuples_dict
-
-
 def _replace_name_index(data):
     """While the simbench csv format assigns connected nodes via names, pandapower assigns via
     indices. This function replaces the assignment of the input data."""
     node_names = {"node", "nodeA", "nodeB", "nodeHV", "nodeMV", "nodeLV"}
     bus_names = {"bus", "from_bus", "to_bus", "hv_bus", "mv_bus", "lv_bus"}
-    corr_strings = _csv_table_pp_dataframe_correspondings(str, True)
+    corr_strings = get_conversion_plan().correspondings(str, True)
     corr_strings.remove(
         "Measurement*measurement"
     )  # already done in convert_measurement()
@@ -1199,7 +1267,7 @@ def _merge_dcline_and_storage_type_and_element_data(input_data):
         Type_col_except_std_type = input_data[
             corr_str_type
         ].columns.difference(["std_type"])
-        if version.parse(pd.__version__) >= version.parse("0.21.0"):
+        if get_conversion_plan().has_reindex_columns:
             input_data[corr_str] = input_data[corr_str].reindex(
                 columns=input_data[corr_str].columns.union(
                     Type_col_except_std_type
@@ -1219,116 +1287,110 @@ def _merge_dcline_and_storage_type_and_element_data(input_data):
 
 
 def _copy_data(input_data, output_data):
-    """Copies the data from output_data[corr_strings] into input_data[element_table]. This function
-    handles that some corr_strings are not in output_data.keys() and copies all columns which
-    exists in both, output_data[corr_strings] and input_data[element_table]."""
+    """Copies the data from input_data[corr_strings] into output_data[element_table]. This function
+    handles that some corr_strings are not in input_data.keys() and copies all columns which
+    exists in both, input_data[corr_strings] and output_data[element_table].
+    Each output table is built at once out of all input tables which are converted into it: every
+    column is allocated once with its final dtype and filled with the input data or the fix
+    values."""
     out_is_pp = _is_pp_type(output_data)
-    corr_strings = _csv_table_pp_dataframe_correspondings(str, out_is_pp)
-    output_names = _csv_table_pp_dataframe_correspondings(list, out_is_pp)[
-        int(out_is_pp)
-    ]
+    plan = get_conversion_plan()
+    corr_strings = plan.correspondings(str, out_is_pp)
+    output_names = plan.correspondings(list, out_is_pp)[int(out_is_pp)]
+    input_tables = dict()
     for corr_str, output_name in zip(corr_strings, output_names):
         if corr_str in input_data.keys() and input_data[corr_str].shape[0]:
-            cols_to_copy = list(
-                set(output_data[output_name].columns)
-                & set(
-                    input_data[corr_str].columns[
-                        ~input_data[corr_str].isnull().all()
-                    ]
-                )
+            input_tables.setdefault(output_name, []).append(input_data[corr_str])
+    fix_values = dict(plan.fix_values[out_is_pp])
+
+    for output_name, tables in input_tables.items():
+        if output_data[output_name].shape[0]:
+            tables = [output_data[output_name]] + tables
+        output_data[output_name] = _build_output_table(
+            output_data[output_name].dtypes, tables, fix_values
+        )
+        if "std_types" in output_name and out_is_pp:
+            output_data[output_name].index = pd.Index(
+                np.concatenate([table["std_type"].values for table in tables]),
+                name="std_type",
             )
-            if version.parse(pd.__version__) >= version.parse("2.2.0"):
-                with warnings.catch_warnings():
-                    warnings.simplefilter(
-                        action="ignore", category=FutureWarning
-                    )
-                    output_data[output_name] = pd.concat(
-                        [
-                            output_data[output_name],
-                            input_data[corr_str][cols_to_copy],
-                        ],
-                        ignore_index=True,
-                        sort=False,
-                    ).reindex(columns=output_data[output_name].columns)
-            elif version.parse(pd.__version__) >= version.parse("0.23.0"):
-                output_data[output_name] = pd.concat(
-                    [
-                        output_data[output_name],
-                        input_data[corr_str][cols_to_copy],
-                    ],
-                    ignore_index=True,
-                    sort=False,
-                ).reindex(columns=output_data[output_name].columns)
-            elif version.parse(pd.__version__) >= version.parse("0.21.0"):
-                output_data[output_name] = pd.concat(
-                    [
-                        output_data[output_name],
-                        input_data[corr_str][cols_to_copy],
-                    ],
-                    ignore_index=True,
-                ).reindex(columns=output_data[output_name].columns)
-            else:
-                output_data[output_name] = pd.concat(
-                    [
-                        output_data[output_name],
-                        input_data[corr_str][cols_to_copy],
-                    ],
-                    ignore_index=True,
-                ).reindex_axis(output_data[output_name].columns, axis=1)
-            if "std_types" in corr_str and out_is_pp:
-                output_data[output_name].index = input_data[corr_str][
-                    "std_type"
-                ]
-            _inscribe_fix_values(output_data, output_name)
-
-
-def _inscribe_fix_values(output_data, output_name):
-    """Writes fix values (which are not given in the input_data format) given in tuples into
-    output table columns."""
-    if _is_pp_type(output_data) and version.parse(
-        pp.__version__
-    ) >= version.parse("3.2.0"):
-        fix_values_tuples = [
-            ("in_service", True),
-            ("scaling", 1.0),
-            ("parallel", 1),
-            ("g_us_per_km", 0.0),
-            ("df", 1.0),
-            ("tap_step_degree", 0.0),
-            ("tap_phase_shifter", False),
-            ("const_i_p_percent", 0.0),
-            ("const_z_p_percent", 0.0),
-            ("const_i_q_percent", 0.0),
-            ("const_z_q_percent", 0.0),
-            ("min_e_mwh", 0.0),
-            ("slack", False),
-            ("z_ohm", 0.0),
-        ]
-    elif _is_pp_type(output_data):
-        fix_values_tuples = [
-            ("in_service", True),
-            ("scaling", 1.0),
-            ("parallel", 1),
-            ("g_us_per_km", 0.0),
-            ("df", 1.0),
-            ("tap_step_degree", 0.0),
-            ("tap_phase_shifter", False),
-            ("const_i_percent", 0.0),
-            ("const_z_percent", 0.0),
-            ("min_e_mwh", 0.0),
-            ("slack", False),
-            ("z_ohm", 0.0),
-        ]
-    else:
-        fix_values_tuples = [
-            ("dVa", 0.0),
-            ("dVaHV", 0.0),
-            ("dVaMV", 0.0),
-            ("dVaLV", 0.0),
+
+
+def _build_output_table(output_dtypes, tables, fix_values):
+    """Returns a DataFrame with the columns of output_dtypes and the rows of all tables. Columns
+    given in fix_values get their fix value. Columns which are missing or only nan in a table are
+    nan in the rows of that table.
+    Columns whose input data have the dtype of the output column are allocated once and filled.
+    The dtypes of the other columns result from pd.concat(), as by _concat_output_columns()."""
+    n_rows = [table.shape[0] for table in tables]
+    starts = np.cumsum([0] + n_rows)
+    columns = dict()
+    cols_to_concat = list()
+    for col, output_dtype in output_dtypes.items():
+        if col in fix_values.keys():
+            columns[col] = np.full(starts[-1], fix_values[col])
+            continue
+        parts = [
+            table[col] if col in table.columns and table[col].notnull().any() else None
+            for table in tables
         ]
-    for fxt in fix_values_tuples:
-        if fxt[0] in output_data[output_name].columns:
-            output_data[output_name][fxt[0]] = fxt[1]
+        given = [part for part in parts if part is not None]
+        if any(part.dtype != output_dtype for part in given):
+            cols_to_concat.append(col)
+            continue
+        dtype = _column_dtype(output_dtype, len(given) < len(tables))
+        if len(given) == len(tables) == 1:
+            values = given[0].values
+            columns[col] = values if given[0].dtype == dtype else values.astype(dtype)
+            continue
+        is_numpy_dtype = isinstance(dtype, np.dtype)
+        values = np.empty(starts[-1], dtype=dtype if is_numpy_dtype else object)
+        if len(given) < len(tables):
+            values[:] = np.nan
+        for start, stop, part in zip(starts[:-1], starts[1:], parts):
+            if part is not None:
+                values[start:stop] = part.to_numpy()
+        columns[col] = values if is_numpy_dtype else pd.array(values, dtype=dtype)
+    if len(cols_to_concat):
+        concatenated = _concat_output_columns(output_dtypes[cols_to_concat], tables)
+        for col in cols_to_concat:
+            columns[col] = concatenated[col].values
+    return pd.DataFrame(
+        columns, index=pd.RangeIndex(starts[-1]), columns=output_dtypes.index
+    )
+
+
+def _column_dtype(output_dtype, has_nan):
+    """Returns the dtype of an output column which is filled by input data of output_dtype, as it
+    results from pd.concat(): if the column has missing values, integer columns become float and
+    boolean columns become object columns."""
+    if has_nan and isinstance(output_dtype, np.dtype):
+        if output_dtype.kind in "iu":
+            return np.dtype(float)
+        elif output_dtype.kind == "b":
+            return np.dtype(object)
+    return output_dtype
+
+
+def _concat_output_columns(output_dtypes, tables):
+    """Returns a DataFrame with the columns of output_dtypes and the rows of all tables by
+    concatenating an empty table of output_dtypes and each input table, restricted to the columns
+    which are not only nan. The resulting dtypes depend on the dtypes of all tables and on their
+    order, as determined by pd.concat()."""
+    output_table = pd.DataFrame(
+        {col: pd.Series([], dtype=dtype) for col, dtype in output_dtypes.items()}
+    )
+    with _catch_warnings_lock, warnings.catch_warnings():
+        warnings.simplefilter(action="ignore", category=FutureWarning)
+        for table in tables:
+            cols = [
+                col for col in output_table.columns
+                if col in table.columns and table[col].notnull().any()
+            ]
+            output_table = pd.concat(
+                [output_table, table[cols]], ignore_index=True, sort=False
+            ).reindex(columns=output_table.columns)
+    return output_table
 
 
 if __name__ == "__main__":
@@ -11,6 +11,10 @@ logger = logging.getLogger(__name__)
 
 __author__ = "smeinecke"
 
+# all_columns() and all_dtypes() are static and thus only computed once for get_columns() and
+# get_dtypes()
+_format_information_cache = dict()
+
 
 def sb2pp_base(variable="power"):
     """converting factor from simbench data structure to pandapower:
@@ -461,23 +465,30 @@ def all_columns():
     return tablenames
 
 
+def _cached_format_information(key, func):
+    """Returns the result of func(), which is computed only at the first call for the key."""
+    if key not in _format_information_cache:
+        _format_information_cache[key] = func()
+    return _format_information_cache[key]
+
+
 def get_dtypes(tablename):
     """This function returns simbench csv file column dtypes for a given table name."""
-    alldtypes = all_dtypes()
+    alldtypes = _cached_format_information("dtypes", all_dtypes)
     if tablename in alldtypes.keys():
         if "Profile" in tablename:
             logger.debug(
                 "The returned dtypes list of %s is for 1000 profiles columns."
                 % tablename
             )
-        return alldtypes[tablename]
+        return list(alldtypes[tablename])
     else:
         raise ValueError("The tablename %s is unknown." % tablename)
 
 
 def get_columns(tablename):
     """This function returns simbench csv file column names for a given table name."""
-    allcolumns = all_columns()
+    allcolumns = _cached_format_information("columns", all_columns)
     if tablename in allcolumns.keys():
         if "Profile" in tablename:
             logger.debug(
@@ -485,7 +496,7 @@ def get_columns(tablename):
                 % tablename
                 + "dataset and may be incomplete"
             )
-        return allcolumns[tablename]
+        return list(allcolumns[tablename])
     else:
         raise ValueError("The tablename %s is unknown." % tablename)
 
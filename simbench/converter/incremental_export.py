@@ -0,0 +1,335 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import os
+import numpy as np
+import pandas as pd
+import pandapower as pp
+
+from simbench.converter.conversion_plan import get_conversion_plan
+from simbench.converter.csv_pp_converter import pp2csv_data
+from simbench.converter.read_and_write import write2csv
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+# pandapower tables whose rows are converted independently of all other rows and tables, as long
+# as these columns are not changed
+_row_local_tables = ["load", "sgen", "shunt"]
+_structure_columns = ["name", "bus", "in_service"]
+
+
+def _row_hashes(df, index=True):
+    """Returns a hash per row of df."""
+    try:
+        return pd.util.hash_pandas_object(df, index=index).values
+    except TypeError:  # unhashable objects, e.g. lists
+        return pd.util.hash_pandas_object(df.astype(str), index=index).values
+
+
+def _table_state(df, structure=False):
+    """Returns what is needed to detect changes of df: columns, dtypes, index, row hashes and
+    whether the columns contain any data. If structure is True, the structure columns are kept."""
+    state = {
+        "columns": list(df.columns),
+        "dtypes": list(df.dtypes),
+        "index": df.index,
+        "row_hashes": _row_hashes(df),
+        "has_data": df.notnull().any().values,
+    }
+    if structure:
+        state["structure"] = df[[col for col in _structure_columns if col in df.columns]].copy()
+    return state
+
+
+def _net_state(net):
+    """Returns the states of all data of net which is used by pp2csv_data()."""
+    plan = get_conversion_plan()
+    keys = set(plan.correspondings(list, True)[1]) | {"bus_geodata", "line_geodata", "loadcases"}
+    states = {
+        key: _table_state(net[key], structure=key in _row_local_tables)
+        for key in keys
+        if key in net.keys() and isinstance(net[key], pd.DataFrame)
+    }
+    for name, profiles in net.get("profiles", dict()).items():
+        if isinstance(profiles, pd.DataFrame):
+            states["profiles|%s" % name] = _table_state(profiles)
+    states["std_types"] = repr(net.get("std_types"))
+    return states
+
+
+def _table_hash(df):
+    """Returns a hash of the content of a csv table."""
+    return list(df.columns), list(df.dtypes), _row_hashes(df).tobytes()
+
+
+def _replace_rows(df, positions, rows):
+    """Returns a copy of df in which the rows at positions are replaced by rows, keeping the dtypes
+    of df. Returns None if the values of rows cannot be represented by these dtypes."""
+    df = df.copy()
+    for col in df.columns:
+        values = rows[col]
+        if values.dtype != df[col].dtype:
+            try:
+                values = values.astype(df[col].dtype)
+            except (TypeError, ValueError):
+                return None
+            if not values.astype(rows[col].dtype).equals(rows[col]):
+                return None
+        column = df[col].copy()
+        column.iloc[positions] = values.values
+        if column.dtype != df[col].dtype:
+            return None
+        df[col] = column
+    return df
+
+
+def _same_table_layout(state1, state2):
+    return (
+        state1["columns"] == state2["columns"]
+        and state1["dtypes"] == state2["dtypes"]
+        and state1["index"].equals(state2["index"])
+        and np.array_equal(state1["has_data"], state2["has_data"])
+    )
+
+
+class IncrementalCsvExporter:
+    """Exports a pandapower net repeatedly to the same folder of csv files in simbench format,
+    e.g. within a planning loop which changes the net slightly between the exports. The written
+    files are the same as of pp2csv() with mode="w", but only the changed files are rewritten.
+
+    The exporter remembers the converted data of the previous export and hashes of all input
+    tables. If only values of loads, sgens or shunts are changed (but not their index, name, bus or
+    in_service), only these tables are converted again and only the rows of the changed elements
+    are rewritten in the csv files. Otherwise, the whole net is converted and only the csv files
+    with changed content are rewritten.
+
+    INPUT:
+        **path** (str) - folder path, the csv files should be stored into
+
+    OPTIONAL:
+        **sep**, **export_pp_std_types**, **exclude_table**, **nrows**,
+        **drop_inactive_elements**, **round_qLoad_by_voltLvl**, **check_std_type_deviation** -
+        see pp2csv()
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> exporter = sb.IncrementalCsvExporter("folder")
+        >>> exporter.export(net)
+        >>> net.load.loc[[3, 7], "p_mw"] *= 1.1
+        >>> exporter.export(net)  # rewrites only two rows of Load.csv
+        ['Load']
+    """
+
+    def __init__(
+        self,
+        path,
+        sep=";",
+        export_pp_std_types=False,
+        exclude_table=set(),
+        nrows=None,
+        drop_inactive_elements=True,
+        round_qLoad_by_voltLvl=False,
+        check_std_type_deviation=True,
+    ):
+        self.path = path
+        self.sep = sep
+        self.export_pp_std_types = export_pp_std_types
+        self.exclude_table = set(exclude_table)
+        self.nrows = nrows
+        self.drop_inactive_elements = drop_inactive_elements
+        self.round_qLoad_by_voltLvl = round_qLoad_by_voltLvl
+        self.check_std_type_deviation = check_std_type_deviation
+        self.last_export_was_incremental = False
+        self.reset()
+
+    def __repr__(self):
+        return "%s to %s" % (self.__class__.__name__, self.path)
+
+    def reset(self):
+        """Forgets the previous export, so that the next export converts and writes everything."""
+        self._csv_data = None
+        self._net_state = None
+        self._csv_hashes = dict()
+        self._written = set()
+        self._lines = dict()
+
+    def export(self, net):
+        """Exports net to the csv files in path and returns the names of the rewritten tables.
+        net is not changed."""
+        net_state = _net_state(net)
+        csv_data = self._convert_changed_tables(net, net_state)
+        self.last_export_was_incremental = csv_data is not None
+        if csv_data is None:
+            csv_data = pp2csv_data(
+                net,
+                export_pp_std_types=self.export_pp_std_types,
+                drop_inactive_elements=self.drop_inactive_elements,
+                round_qLoad_by_voltLvl=self.round_qLoad_by_voltLvl,
+                check_std_type_deviation=self.check_std_type_deviation,
+            )
+            changed_rows = None
+        else:
+            csv_data, changed_rows = csv_data
+        written = self._write(csv_data, changed_rows)
+        self._csv_data = csv_data
+        self._net_state = net_state
+        return written
+
+    # --- conversion
+
+    def _convert_changed_tables(self, net, net_state):
+        """Returns the csv data of net, in which only the changed row-local tables are converted
+        again, and the positions of the changed rows per csv table. Returns None if the whole net
+        must be converted."""
+        prev_state = self._net_state
+        if prev_state is None or set(prev_state.keys()) != set(net_state.keys()):
+            return None
+        if prev_state["std_types"] != net_state["std_types"]:
+            return None
+        changed = list()
+        for key, state in net_state.items():
+            if key == "std_types":
+                continue
+            prev = prev_state[key]
+            if _same_table_layout(prev, state) and np.array_equal(
+                prev["row_hashes"], state["row_hashes"]
+            ):
+                continue
+            if key not in _row_local_tables or not _same_table_layout(prev, state):
+                return None
+            if not prev["structure"].equals(state["structure"]):
+                return None
+            changed.append(key)
+        if not len(changed):
+            return self._csv_data, dict()
+        if not net.bus["name"].notnull().all() or not net.bus["name"].is_unique:
+            return None
+
+        plan = get_conversion_plan()
+        corr_strings = plan.correspondings(str, False)
+        csv_data = dict(self._csv_data)
+        changed_rows = dict()
+        for element in changed:
+            names = net[element]["name"]
+            if not names.notnull().all() or not names.is_unique:
+                return None
+            targets = [
+                corr.split("*")[0] for corr in corr_strings if corr.split("*")[1] == element
+            ]
+            # names of the element must not be used by other elements converted to the targets
+            other_elements = {
+                corr.split("*")[1]
+                for corr in corr_strings
+                if corr.split("*")[0] in targets and corr.split("*")[1] != element
+            }
+            for other in other_elements:
+                if other in net.keys() and net[other].get("name", pd.Series()).isin(names).any():
+                    return None
+
+            # --- convert the element rows of the previous export
+            prev_ids = pd.concat([self._csv_data[target]["id"] for target in targets])
+            kept = net[element].index[names.isin(prev_ids).values]
+            part = pp.create_empty_network()
+            part["bus"] = net["bus"]
+            part[element] = net[element].loc[kept]
+            part_csv_data = pp2csv_data(
+                part,
+                export_pp_std_types=False,
+                drop_inactive_elements=False,
+                round_qLoad_by_voltLvl=self.round_qLoad_by_voltLvl,
+                check_std_type_deviation=False,
+            )
+
+            # --- replace the rows of the previous csv tables
+            for target in targets:
+                prev_table = csv_data[target]
+                new_rows = part_csv_data[target]
+                prev_from_element = prev_table["id"].isin(names).values
+                if set(prev_table["id"].values[prev_from_element]) != set(new_rows["id"]):
+                    return None  # elements moved between csv tables
+                if not new_rows.shape[0]:
+                    continue
+                if not prev_table["id"].is_unique or list(prev_table.columns) != list(
+                    new_rows.columns
+                ):
+                    return None
+                table = _replace_rows(
+                    prev_table, pd.Index(prev_table["id"]).get_indexer(new_rows["id"]), new_rows
+                )
+                if table is None:
+                    return None
+                csv_data[target] = table
+                changed_rows[target] = np.flatnonzero(
+                    _row_hashes(table, index=False) != _row_hashes(prev_table, index=False)
+                )
+        return csv_data, changed_rows
+
+    # --- writing
+
+    def _file(self, tablename):
+        return os.path.join(self.path, "%s.csv" % tablename)
+
+    def _write(self, csv_data, changed_rows=None):
+        """Writes the csv tables which differ from the previous export and returns their names.
+        If changed_rows is given, only its tables have changed, at the given row positions."""
+        os.makedirs(self.path, exist_ok=True)
+        tablenames = changed_rows.keys() if changed_rows is not None else csv_data.keys()
+        written = list()
+        for tablename in sorted(set(tablenames) - self.exclude_table):
+            df = csv_data[tablename]
+            if changed_rows is not None:
+                if not len(changed_rows[tablename]):
+                    continue
+                csv_hash = _table_hash(df)
+                if not self._write_rows(tablename, df, changed_rows[tablename]):
+                    self._write_table(tablename, df)
+            else:
+                csv_hash = _table_hash(df)
+                if self._csv_hashes.get(tablename) == csv_hash:
+                    continue
+                self._write_table(tablename, df)
+            self._csv_hashes[tablename] = csv_hash
+            written.append(tablename)
+        return written
+
+    def _write_table(self, tablename, df):
+        """Writes the complete csv file of tablename, as pp2csv() does."""
+        if tablename in self._written:  # the table may not be written anymore, e.g. if empty
+            os.remove(self._file(tablename))
+            self._written.discard(tablename)
+        self._lines.pop(tablename, None)
+        write2csv(self.path, {tablename: df}, sep=self.sep, float_format="%g", nrows=self.nrows)
+        if os.path.isfile(self._file(tablename)):
+            self._written.add(tablename)
+
+    def _write_rows(self, tablename, df, positions):
+        """Rewrites only the rows at positions of the csv file of tablename. Returns False if this
+        is not possible, e.g. because the formatting of other rows would change as well."""
+        if tablename not in self._written or tablename == "StudyCases":
+            return False
+        prev_df = self._csv_data[tablename]
+        frame = df.replace("", "NULL").fillna("NULL")
+        if list(frame.dtypes) != list(prev_df.replace("", "NULL").fillna("NULL").dtypes):
+            return False
+        if tablename not in self._lines:
+            with open(self._file(tablename), newline="", encoding="utf-8") as f:
+                self._lines[tablename] = f.read().split(os.linesep)
+        lines = self._lines[tablename]
+        if len(lines) != df.shape[0] + 2 or lines[-1] != "":  # header, rows and final linesep
+            self._lines.pop(tablename)
+            return False
+        new_lines = frame.iloc[positions].to_csv(
+            sep=self.sep, index=False, header=False, float_format="%g"
+        ).split(os.linesep)
+        if len(new_lines) != len(positions) + 1:
+            return False
+        for position, line in zip(positions, new_lines):
+            lines[position + 1] = line
+        with open(self._file(tablename), "w", newline="", encoding="utf-8") as f:
+            f.write(os.linesep.join(lines))
+        return True
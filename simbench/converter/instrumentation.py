@@ -0,0 +1,184 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import os
+import json
+import time
+import threading
+import tracemalloc
+import contextvars
+from contextlib import contextmanager, nullcontext
+import pandas as pd
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+# StageRecorder of record_stages() in the current thread (or asyncio task)
+_active_recorder = contextvars.ContextVar("simbench_stage_recorder", default=None)
+_no_stage = nullcontext()
+# tracemalloc is global to the process: only one recording at a time may reset its peak
+_memory_recording = threading.Lock()
+
+
+class StageRecorder:
+    """Records wall time, CPU time and tracemalloc peak of the stages of conversions, see
+    record_stages(). Each stage is recorded as dict with the keys "name", "depth" (number of
+    enclosing stages), "start_s" (seconds after the start of the recording), "wall_s", "cpu_s"
+    (CPU time of the thread) and "peak_memory_mb" (peak of traced memory during the stage above
+    the traced memory at its start, nan without memory tracing).
+    Since tracemalloc traces all threads of the process, the memory peaks include allocations of
+    other threads and are only meaningful for single-threaded code.
+
+    OPTIONAL:
+        **trace_memory** (bool, True) - whether the memory peaks are recorded via tracemalloc
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = list()
+        self._stack = list()
+        self._start = time.perf_counter()
+
+    def __repr__(self):
+        return "%s with %i stages" % (self.__class__.__name__, len(self.stages))
+
+    @contextmanager
+    def stage(self, name):
+        """Records the code within the with-statement as stage 'name'."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if len(self._stack):  # the peak of the enclosing stage is reset below
+                self._stack[-1]["child_peak"] = max(self._stack[-1]["child_peak"], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+        frame = {"memory": current, "child_peak": 0}
+        self._stack.append(frame)
+        record = {"name": name, "depth": len(self._stack) - 1}
+        self.stages.append(record)  # stages are listed in order of their start
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield record
+        finally:
+            record["start_s"] = wall - self._start
+            record["wall_s"] = time.perf_counter() - wall
+            record["cpu_s"] = time.thread_time() - cpu
+            self._stack.pop()
+            if tracing:
+                peak = max(tracemalloc.get_traced_memory()[1], frame["child_peak"])
+                record["peak_memory_mb"] = (peak - frame["memory"]) / 1e6
+                if len(self._stack):
+                    self._stack[-1]["child_peak"] = max(self._stack[-1]["child_peak"], peak)
+            else:
+                record["peak_memory_mb"] = float("nan")
+            record["thread"] = threading.get_ident()
+
+    def to_dataframe(self):
+        """Returns the recorded stages as DataFrame, in order of their start."""
+        return pd.DataFrame(
+            self.stages,
+            columns=["name", "depth", "start_s", "wall_s", "cpu_s", "peak_memory_mb", "thread"],
+        )
+
+    def summary(self):
+        """Returns a DataFrame with the number of calls, the summed wall and CPU times and the
+        maximum memory peak per stage name, sorted by the wall time."""
+        return self.to_dataframe().groupby("name").agg(
+            calls=("wall_s", "size"),
+            wall_s=("wall_s", "sum"),
+            cpu_s=("cpu_s", "sum"),
+            peak_memory_mb=("peak_memory_mb", "max"),
+        ).sort_values("wall_s", ascending=False)
+
+    def to_chrome_trace(self):
+        """Returns the recorded stages in the Chrome trace event format, which can be viewed e.g.
+        via chrome://tracing or https://ui.perfetto.dev."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": record["name"],
+                "ph": "X",
+                "ts": record["start_s"] * 1e6,
+                "dur": record["wall_s"] * 1e6,
+                "pid": pid,
+                "tid": record["thread"],
+                "args": {
+                    "cpu_ms": record["cpu_s"] * 1e3,
+                    "peak_memory_mb": None
+                    if pd.isnull(record["peak_memory_mb"])
+                    else record["peak_memory_mb"],
+                },
+            }
+            for record in self.stages
+            if "wall_s" in record.keys()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """Writes the recorded stages as Chrome trace json file to path, see to_chrome_trace()."""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+@contextmanager
+def record_stages(trace_memory=True):
+    """Records wall time, CPU time and memory peak of the stages of get_simbench_net(),
+    csv_data2pp(), pp2csv_data() and other functions of simbench which are called within the
+    with-statement in the same thread. Without record_stages(), the stages are not recorded.
+    Memory tracing via tracemalloc slows the code down noticeably; if tracemalloc is not
+    already tracing, it is started for the recording only.
+    tracemalloc is global to the process, so memory peaks are only valid for single-threaded code
+    and only one recording traces memory at a time: recordings which start while another one
+    traces memory (in other threads or nested) record no memory peaks.
+
+    OPTIONAL:
+        **trace_memory** (bool, True) - whether the memory peaks are recorded
+
+    OUTPUT:
+        **recorder** (StageRecorder) - the recorded stages
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> with sb.record_stages() as recorder:
+        ...     net = sb.get_simbench_net("1-MV-rural--0-sw")
+        >>> recorder.summary()
+        >>> recorder.write_chrome_trace("get_simbench_net_trace.json")
+    """
+    traces_memory = trace_memory and _memory_recording.acquire(blocking=False)
+    if trace_memory and not traces_memory:
+        logger.info(
+            "Another recording traces memory at the same time, so no memory peaks are recorded."
+        )
+    recorder = StageRecorder(trace_memory=traces_memory)
+    started_tracing = traces_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    token = _active_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active_recorder.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+        if traces_memory:
+            _memory_recording.release()
+
+
+def conversion_stage(name):
+    """Returns a context manager which records the code within the with-statement as stage
+    'name' if record_stages() is active, and does nothing otherwise.
+
+    EXAMPLE:
+        >>> with conversion_stage("my_postprocessing"):
+        ...     my_postprocessing(net)
+    """
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return _no_stage
+    return recorder.stage(name)
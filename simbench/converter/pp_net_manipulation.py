@@ -7,6 +7,8 @@ import numpy as np
 import pandas as pd
 import pandapower as pp
 from copy import deepcopy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import breadth_first_order, connected_components
 
 import logging
 
@@ -34,6 +36,30 @@ def pp_profile_names():
     return ["load", "powerplants", "renewables", "storage"]
 
 
+def _copy_net_for_export(net):
+    """Returns a copy of net which can be changed by pp2csv_data() without changing net. Only the
+    data which is changed by the conversion is copied: all tables except the result tables, as well
+    as res_bus and std_types. The other result tables and the profiles are copied shallowly, i.e.
+    rows and columns can be added or dropped but their values are shared. All other entries, e.g.
+    internal power flow data, are shared since the conversion does not use them."""
+    net_copy = net.__class__.__new__(net.__class__)
+    net_copy._setattr("_allow_invalid_attributes", net._allow_invalid_attributes)
+    for key, value in net.items():
+        if isinstance(value, pd.DataFrame):
+            is_shared_result = key.startswith(("res_", "_empty_res_")) and key != "res_bus"
+            net_copy[key] = value.copy(deep=not is_shared_result)
+        elif key == "std_types":
+            net_copy[key] = deepcopy(value)
+        elif key == "profiles" and isinstance(value, dict):
+            net_copy[key] = {
+                name: df.copy(deep=False) if isinstance(df, pd.DataFrame) else df
+                for name, df in value.items()
+            }
+        else:
+            net_copy[key] = value
+    return net_copy
+
+
 def _extend_pandapower_net_columns(net):
     """
     This functions adds new columns to pandapower element tables as well as new tables. These new
@@ -332,6 +358,29 @@ def convert_geojson_to_bus_geodata_xy(net):
         ]
 
 
+def _geojson_points(x, y):
+    """Returns GeoJSON strings of points with the given x and y values."""
+    return [
+        f'{{"type":"Point", "coordinates":[{x_}, {y_}]}}' for x_, y_ in zip(x, y)
+    ]
+
+
+def materialize_bus_geo(net):
+    """Writes GeoJSON strings into net.bus.geo for all buses without geo data but with numeric
+    coordinates in the columns "x" and "y", as created by csv_data2pp() with geodata "numeric"."""
+    bus = net["bus"]
+    if "x" not in bus.columns or "y" not in bus.columns:
+        return
+    geo = bus["geo"] if "geo" in bus.columns else pd.Series(None, index=bus.index, dtype=object)
+    x = bus["x"].values
+    y = bus["y"].values
+    missing = (pd.isnull(geo.values) | (geo.values == "")) & ~pd.isnull(x) & ~pd.isnull(y)
+    if missing.any():
+        geo = geo.astype(object)
+        geo.values[missing] = _geojson_points(x[missing], y[missing])
+        bus["geo"] = geo
+
+
 def merge_busbar_coordinates(net, on_bus_geodata):
     """merges x and y coordinates of busbar node connected via bus-bus switches"""
     if on_bus_geodata:
@@ -360,6 +409,113 @@ def merge_busbar_coordinates(net, on_bus_geodata):
             all_connected_buses |= connected_nodes
 
 
+def _isclose_or_equal(value, std_type_value):
+    try:
+        return np.isclose(value, std_type_value, equal_nan=True)
+    except TypeError:
+        return value == std_type_value
+
+
+def _std_type_values_isclose(values, std_type_values):
+    """Compares the values of an element column with the std type values like pandapower's
+    DeviationFromStdType: numbers via np.isclose() with equal NaNs, other values via '=='."""
+    numeric = ["floating", "integer", "mixed-integer-float", "boolean", "empty"]
+    if (
+        pd.api.types.infer_dtype(values, skipna=True) in numeric
+        and pd.api.types.infer_dtype(std_type_values, skipna=True) in numeric
+    ):
+        try:
+            return np.isclose(
+                values.astype(float), std_type_values.astype(float), equal_nan=True
+            )
+        except TypeError:  # e.g. None
+            pass
+    isclose = np.zeros(len(values), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        is_equal = values == std_type_values
+    if isinstance(is_equal, np.ndarray):
+        isclose |= is_equal.astype(bool)
+    # unequal values are checked value by value, e.g. numbers in object columns or NaNs
+    for pos in np.flatnonzero(~isclose):
+        isclose[pos] = bool(_isclose_or_equal(values[pos], std_type_values[pos]))
+    return isclose
+
+
+def deviation_from_std_type(net):
+    """Returns the elements whose parameters deviate from their standard type, in the format of
+    pandapower's DeviationFromStdType().diagnostic(net), but with one joined comparison per
+    element type instead of a loop over the elements.
+
+    INPUT:
+        **net** (pandapowerNet) - pandapower net
+
+    OUTPUT:
+        **deviations** (dict, None) - for each element type with deviations, a dict of element
+        index and {"param": ..., "e_value": ..., "std_type_value": ..., "std_type_in_lib": True},
+        or {"std_type_in_lib": False} if the std_type is not in net.std_types. If there are no
+        deviations, None is returned.
+    """
+    deviations = dict()
+    for element, std_types in net.std_types.items():
+        if element not in net.keys() or not net[element].shape[0]:
+            continue
+        df = net[element]
+        if "std_type" not in df.columns:
+            continue
+        types = df["std_type"].values.astype(object)
+        in_lib = pd.Series(types).isin(std_types.keys()).values
+        not_in_lib = ~in_lib & ~np.equal(types, None)
+        results = {idx: {"std_type_in_lib": False} for idx in df.index[not_in_lib]}
+
+        # --- join the std type parameters to the elements with std type in the library
+        used_types = pd.unique(types[in_lib])
+        params = list(
+            dict.fromkeys(
+                param
+                for std_type in used_types
+                for param in std_types[std_type].keys()
+                if param != "tap_pos" and param in df.columns
+            )
+        )
+        if len(params):
+            # values and positions of the parameters per used std type (-1 if it misses them)
+            type_values = np.empty((len(used_types), len(params)), dtype=object)
+            type_param_pos = np.full((len(used_types), len(params)), -1)
+            param_idx = {param: i_param for i_param, param in enumerate(params)}
+            for i_type, std_type in enumerate(used_types):
+                for pos, (param, value) in enumerate(std_types[std_type].items()):
+                    if param in param_idx.keys():
+                        type_values[i_type, param_idx[param]] = value
+                        type_param_pos[i_type, param_idx[param]] = pos
+            type_pos = pd.Index(used_types).get_indexer(types[in_lib])
+            std_values = type_values[type_pos]
+            param_pos = type_param_pos[type_pos]
+
+            deviating = np.zeros(param_pos.shape, dtype=bool)
+            for i_param, param in enumerate(params):
+                has_param = param_pos[:, i_param] >= 0
+                deviating[has_param, i_param] = ~_std_type_values_isclose(
+                    df[param].values[in_lib][has_param],
+                    std_values[has_param, i_param],
+                )
+
+            # as DeviationFromStdType, report the last deviating parameter of the std type
+            rows = np.flatnonzero(deviating.any(axis=1))
+            last_params = np.where(deviating[rows], param_pos[rows], -1).argmax(axis=1)
+            elm_pos = np.flatnonzero(in_lib)[rows]
+            for row, elm_p, i_param in zip(rows, elm_pos, last_params):
+                param = params[i_param]
+                results[df.index[elm_p]] = {
+                    "param": param,
+                    "e_value": df[param].values[elm_p],
+                    "std_type_value": std_values[row, i_param],
+                    "std_type_in_lib": True,
+                }
+        if len(results):
+            deviations[element] = results
+    return deviations if len(deviations) else None
+
+
 def provide_subnet_col(net):
     """This function provides 'subnet' column in all DataFrames of net. While
     csv2pp() writes all subnet information into pandapower_net[element]["subnet"], this function
@@ -923,3 +1079,119 @@ def ensure_bus_index_columns_as_int(net):
     ebts |= {("switch", "element"), ("measurement", "element")}
     for elm, bus in ebts:
         net[elm][bus] = net[elm][bus].astype(int)
+
+
+def _bus_graph_edges(net):
+    """Returns two arrays with the buses of all branches and bus-bus switches of the net."""
+    pairs = [
+        ("line", "from_bus", "to_bus"),
+        ("trafo", "hv_bus", "lv_bus"),
+        ("trafo3w", "hv_bus", "mv_bus"),
+        ("trafo3w", "hv_bus", "lv_bus"),
+        ("impedance", "from_bus", "to_bus"),
+        ("dcline", "from_bus", "to_bus"),
+    ]
+    buses_a = [net[elm][a].values for elm, a, b in pairs if elm in net.keys()]
+    buses_b = [net[elm][b].values for elm, a, b in pairs if elm in net.keys()]
+    is_bb_sw = (net.switch.et == "b").values
+    buses_a.append(net.switch.bus.values[is_bb_sw])
+    buses_b.append(net.switch.element.values[is_bb_sw])
+    return np.concatenate(buses_a).astype(np.int64), np.concatenate(buses_b).astype(np.int64)
+
+
+def create_generic_tree_coordinates(net, gap=2):
+    """Creates generic coordinates for all buses of a net as GeoJSON strings in net.bus.geo,
+    considering the radial structure of SimBench grids. Each subnet (the first part of
+    net.bus.subnet, e.g. "MV1.101") is laid out as a tree starting from the bus of its feeding
+    transformer; buses of the same depth are side by side, their children below. The trees of the
+    subnets are placed next to each other without overlap. In contrast to pandapower's
+    create_generic_coordinates(), the layout needs linear time and no graph layout package.
+
+    INPUT:
+        **net** (pandapowerNet) - net to create the coordinates for
+
+    OPTIONAL:
+        **gap** (float, 2) - horizontal distance between the trees of the subnets, given in
+        distances of neighboured buses
+
+    OUTPUT:
+        **net** (pandapowerNet) - the net with generic coordinates
+    """
+    n_bus = net.bus.shape[0]
+    if not n_bus:
+        return net
+    bus_a, bus_b = _bus_graph_edges(net)
+    pos_a = net.bus.index.get_indexer(bus_a)
+    pos_b = net.bus.index.get_indexer(bus_b)
+    known = (pos_a >= 0) & (pos_b >= 0)
+    pos_a, pos_b = pos_a[known], pos_b[known]
+    if "subnet" in net.bus.columns:
+        subnet = net.bus.subnet.astype(str).str.split("_").str[0].values
+    else:
+        subnet = np.zeros(n_bus)
+    group = pd.factorize(subnet)[0]
+    vn_kv = net.bus.vn_kv.values.astype(float)
+
+    # --- feeding buses: low voltage ends of branches between subnets
+    intra = group[pos_a] == group[pos_b]
+    cross_a, cross_b = pos_a[~intra], pos_b[~intra]
+    a_is_lower = vn_kv[cross_a] < vn_kv[cross_b]
+    is_fed = np.zeros(n_bus, dtype=bool)
+    is_fed[np.where(a_is_lower, cross_a, cross_b)] = True
+    has_ext_grid = net.bus.index.isin(net.ext_grid.bus.values)
+
+    # --- one root per connected part of a subnet: feeding bus, slack bus or highest voltage
+    graph = coo_matrix(
+        (np.ones(intra.sum()), (pos_a[intra], pos_b[intra])), shape=(n_bus, n_bus)
+    )
+    _, component = connected_components(graph, directed=False)
+    root_candidates = pd.DataFrame({
+        "component": component, "is_fed": is_fed, "has_ext_grid": has_ext_grid,
+        "vn_kv": vn_kv, "pos": np.arange(n_bus)})
+    roots = root_candidates.sort_values(
+        ["is_fed", "has_ext_grid", "vn_kv", "pos"], ascending=[False, False, False, True]
+    ).drop_duplicates("component").sort_values(["vn_kv", "pos"], ascending=[False, True])
+    roots = roots.pos.values
+
+    # --- breadth first search over all subnet trees from a virtual node n_bus above all roots
+    tree_graph = coo_matrix(
+        (
+            np.ones(intra.sum() + len(roots)),
+            (
+                np.r_[pos_a[intra], np.full(len(roots), n_bus)],
+                np.r_[pos_b[intra], roots],
+            ),
+        ),
+        shape=(n_bus + 1, n_bus + 1),
+    ).tocsr()
+    order, pred = breadth_first_order(
+        tree_graph, n_bus, directed=False, return_predecessors=True
+    )
+    depth = np.zeros(n_bus + 1, dtype=np.int64)
+    pred_list = pred.tolist()
+    for node in order[1:].tolist():
+        depth[node] = depth[pred_list[node]] + 1
+
+    # --- widths of the subtrees, from the deepest buses upwards
+    # within a depth, the buses of the same parent are contiguous in the bfs order
+    levels = np.split(order[1:], np.flatnonzero(np.diff(depth[order[1:]])) + 1)
+    width = np.zeros(n_bus + 1)
+    for level in levels[::-1]:
+        width[level] = np.maximum(width[level], 1)
+        np.add.at(width, pred[level], width[level])
+    width[roots] += gap
+
+    # --- positions of the subtrees, from the roots downwards
+    x_start = np.zeros(n_bus + 1)
+    for level in levels:
+        cum_width = np.cumsum(width[level]) - width[level]
+        parent = pred[level]
+        first_of_parent = np.r_[True, parent[1:] != parent[:-1]]
+        group_start = np.maximum.accumulate(np.where(first_of_parent, np.arange(len(level)), 0))
+        x_start[level] = x_start[parent] + cum_width - cum_width[group_start]
+    width[roots] -= gap
+    x = (x_start + (width - 1) / 2)[:n_bus]
+    y = -depth[:n_bus].astype(float)
+
+    net.bus["geo"] = _geojson_points(x, y)
+    return net
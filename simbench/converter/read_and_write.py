@@ -128,6 +128,34 @@ def read_csv_data(path, sep, tablename=None, nrows=None):
         return csv_tables[tablename[0]]
 
 
+def _concat_csv_tables(tablename, dfs):
+    """Concatenates the DataFrames dfs of the csv table 'tablename'. Study cases are kept as index,
+    since they are written as index if they are not given as column "Study Case"."""
+    if tablename == "StudyCases":
+        dfs = [df.set_index("Study Case") if "Study Case" in df.columns else df for df in dfs]
+        df = pd.concat(dfs)
+        df.index.name = "Study Case"
+        return df
+    return pd.concat(dfs, ignore_index=True)
+
+
+def _drop_duplicated_rows(tablename, df, keep="last"):
+    """Drops the rows of the csv table 'tablename' which are duplicated by name (or node), voltLvl
+    and subnet. Study cases are duplicated by their index."""
+    if tablename == "StudyCases":
+        return df.loc[~df.index.duplicated(keep=keep)]
+    dupl_cols = ["id"] if "id" in df.columns else ["node"]
+    dupl_cols += [col for col in ["voltLvl", "subnet"] if col in df.columns]
+    duplicates = df.loc[df.duplicated(dupl_cols, keep=keep)]
+    if len(duplicates) and "Type" not in tablename:
+        logger.info(
+            "Writing to table '%s', these duplicated names are " % tablename
+            + "dropped: "
+            + str(["%s" % name for name in duplicates[dupl_cols[0]]])
+        )
+    return df.drop(duplicates.index)
+
+
 def write2csv(
     path,
     data,
@@ -190,26 +218,12 @@ def write2csv(
 
             if "Profile" not in i:
                 # append only unique named elements to existing csv
-                index = (i == "StudyCases") & ("Study Case" not in d.columns)
                 if mod == "append_unique":
-                    d = pd.concat(
-                        [read_csv_data(path, sep, i), d], ignore_index=True
+                    d = _drop_duplicated_rows(
+                        i, _concat_csv_tables(i, [read_csv_data(path, sep, i), d]), keep
                     )
-                    dupl_cols = ["id"] if "id" in d.columns else ["node"]
-                    dupl_cols += [
-                        col
-                        for col in ["voltLvl", "subnet"]
-                        if col in d.columns
-                    ]
-                    duplicates = d.loc[d.duplicated(dupl_cols, keep=keep)]
-                    if len(duplicates) and "Type" not in i:
-                        logger.info(
-                            "Writing to table '%s', these duplicated names are "
-                            % i
-                            + "dropped: "
-                            + str(["%s" % name for name in duplicates.id])
-                        )
-                    d = d.drop(duplicates.index)
+                index = (i == "StudyCases") & ("Study Case" not in d.columns)
+                if mod == "append_unique":
                     d.replace("", "NULL").fillna("NULL").to_csv(
                         this_path,
                         sep=sep,
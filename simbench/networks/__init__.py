@@ -6,5 +6,11 @@ from .simbench_code import *
 from .profiles import *
 from .loadcases import *
 from .extract_simbench_grids_from_csv import *
+from .shared_dataset import *
+from .grid_server import *
+from .scenario_diff import *
+from .subnet_extraction import *
+from .spatial_index import *
+from .catalog import *
 
 __author__ = "smeinecke"
@@ -0,0 +1,305 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+import simbench
+from simbench import csv_tablenames
+from simbench.converter.format_information import _correct_calc_type
+from simbench.networks.simbench_code import (
+    collect_all_simbench_codes,
+    get_simbench_code_and_parameters,
+)
+from simbench.networks.extract_simbench_grids_from_csv import (
+    _ensure_simbench_dataset,
+    _get_extracted_csv_table,
+    _private_directory,
+    complete_data_path,
+    get_relevant_subnets,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+_parameter_columns = ["version", "hv_level", "lv_level", "hv_type", "lv_grid", "scenario", "sw"]
+_calc_type_elements = {
+    "vavm": "ext_grid", "pvm": "gen", "pq": "sgen", "Ward": "ward", "xWard": "xward"}
+
+
+def default_catalog_cache_dir():
+    """Returns the folder in which get_simbench_catalog() stores computed catalogs if no other
+    cache_dir is given: the folder "simbench" in the cache folder of the current user, which is
+    $XDG_CACHE_HOME or ~/.cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "simbench")
+
+
+def _write_catalog_data(data, file):
+    """Writes the catalog data as json file, which keeps the dtypes and the exact values."""
+    split = data.to_dict(orient="split")
+    split["index_name"] = data.index.name
+    split["dtypes"] = [str(dtype) for dtype in data.dtypes]
+    with open(file, "w") as f:
+        json.dump(split, f)
+
+
+def _read_catalog_data(file):
+    """Reads catalog data written by _write_catalog_data()."""
+    with open(file) as f:
+        split = json.load(f)
+    return pd.DataFrame(
+        split["data"],
+        index=pd.Index(split["index"], name=split["index_name"]),
+        columns=split["columns"],
+    ).astype(dict(zip(split["columns"], split["dtypes"])))
+
+
+def _n_buses_and_switches(node, switch, sw):
+    """Returns the number of buses and switches of the pandapower net which is converted from the
+    extracted Node and Switch tables. Auxiliary nodes with one switch are replaced by branch
+    switches in the conversion. Without switches, buses connected by bus-bus switches are fused
+    and only open branch switches remain."""
+    sw_nodes = pd.concat([switch.nodeA, switch.nodeB], ignore_index=True)
+    n_sw_at_node = sw_nodes.value_counts()
+    aux_nodes = node.id[node.type == "auxiliary"]
+    branch_sw_aux = set(aux_nodes[aux_nodes.isin(n_sw_at_node.index[n_sw_at_node == 1])])
+    n_bus = node.shape[0] - len(branch_sw_aux)
+    if sw:
+        return n_bus, switch.shape[0]
+
+    is_branch_sw = (switch.nodeA.isin(branch_sw_aux) | switch.nodeB.isin(branch_sw_aux)).values
+    bus_bus_sw = switch.loc[~is_branch_sw]
+    if bus_bus_sw.shape[0]:
+        n_sw = bus_bus_sw.shape[0]
+        codes, nodes = pd.factorize(
+            pd.concat([bus_bus_sw.nodeA, bus_bus_sw.nodeB], ignore_index=True)
+        )
+        graph = coo_matrix(
+            (np.ones(n_sw), (codes[:n_sw], codes[n_sw:])), shape=(len(nodes), len(nodes))
+        )
+        n_groups, _ = connected_components(graph, directed=False)
+        n_bus -= len(nodes) - n_groups
+    n_open_branch_sw = int((switch.cond.values[is_branch_sw].astype(float) == 0).sum())
+    return n_bus, n_open_branch_sw
+
+
+def _n_profile_columns(csv_data, dataset):
+    """Returns the number of profile columns which remain after filter_unapplied_profiles()."""
+    n_columns = 0
+    for prof_tab in csv_tablenames("profiles"):
+        elm_tab = prof_tab.split("Profile")[0]
+        applied_profiles = pd.Series(csv_data[elm_tab].profile.dropna().unique(), dtype=object)
+        if elm_tab == "Load":
+            applied_profiles = pd.concat(
+                [applied_profiles + "_pload", applied_profiles + "_qload"]
+            )
+        n_columns += int(dataset.table(prof_tab).columns.isin(applied_profiles).sum())
+    return n_columns
+
+
+def get_simbench_code_metadata(sb_code_info, input_path=None):
+    """Returns the size of the net of a SimBench code without creating it: the numbers of buses
+    and elements, determined by the extraction rules of get_simbench_net() on the csv tables, the
+    number of profile columns and time steps, and an estimation of the memory of the net.
+
+    INPUT:
+        **sb_code_info** (str or list) - simbench code information, see get_simbench_net()
+
+    OPTIONAL:
+        **input_path** (str or SimBenchDataset, None) - path to the simbench grid csv files or a
+        SimBenchDataset of these files. If None, the complete data of the scenario of the code is
+        used.
+
+    OUTPUT:
+        **metadata** (dict) - SimBench code parameters and sizes, e.g. {"hv_level": "MV", ...,
+        "n_bus": 129, ..., "memory_mb": 14.2}
+    """
+    sb_code, sb_code_parameters = get_simbench_code_and_parameters(sb_code_info)
+    dataset = _ensure_simbench_dataset(
+        input_path if input_path is not None else complete_data_path(sb_code_parameters[5])
+    )
+    relevant_subnets = get_relevant_subnets(sb_code_parameters, dataset)
+    if "complete_data" in relevant_subnets[0]:
+        csv_data = {
+            tablename: dataset.table(tablename) for tablename in csv_tablenames("elements")
+        }
+    else:
+        csv_data = {
+            tablename: _get_extracted_csv_table(relevant_subnets, tablename, dataset)
+            for tablename in csv_tablenames("elements")
+        }
+    sw = bool(sb_code_parameters[6])
+
+    metadata = dict(zip(_parameter_columns, sb_code_parameters))
+    metadata["scenario"] = int(metadata["scenario"])
+    metadata["sw"] = sw
+    metadata["n_bus"], metadata["n_switch"] = _n_buses_and_switches(
+        csv_data["Node"], csv_data["Switch"], sw
+    )
+    is_dcline = csv_data["Line"].type.isin(dataset.table("DCLineType").id)
+    metadata["n_line"] = int((~is_dcline).sum())
+    metadata["n_dcline"] = int(is_dcline.sum())
+    metadata["n_trafo"] = csv_data["Transformer"].shape[0]
+    metadata["n_trafo3w"] = csv_data["Transformer3W"].shape[0]
+    metadata["n_load"] = csv_data["Load"].shape[0]
+    metadata["n_storage"] = csv_data["Storage"].shape[0]
+
+    # --- generating elements are converted to pandapower tables by their calc_type
+    gen_data = {
+        tablename: csv_data[tablename][["calc_type"]].copy()
+        for tablename in ["ExternalNet", "PowerPlant", "RES"]
+    }
+    _correct_calc_type(gen_data)
+    calc_types = pd.concat(gen_data.values()).calc_type.value_counts()
+    for calc_type, element in _calc_type_elements.items():
+        metadata["n_" + element] = int(calc_types.get(calc_type, 0))
+
+    metadata["n_profile_columns"] = _n_profile_columns(csv_data, dataset)
+    metadata["n_time_steps"] = dataset.table("LoadProfile").shape[0]
+    element_bytes = sum(df.memory_usage(deep=True).sum() for df in csv_data.values())
+    profile_bytes = 8 * metadata["n_time_steps"] * (
+        metadata["n_profile_columns"] + len(csv_tablenames("profiles"))
+    )
+    metadata["memory_mb"] = (element_bytes + profile_bytes) / 1e6
+    return metadata
+
+
+class SimBenchCatalog:
+    """Metadata of SimBench codes, as returned by get_simbench_catalog(). The metadata is
+    available as DataFrame 'data' (indexed by the SimBench codes) and is queried via select().
+
+    INPUT:
+        **data** (DataFrame) - metadata of get_simbench_code_metadata(), indexed by SimBench codes
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._codes = data.index.values
+        self._columns = {col: data[col].values for col in data.columns}
+
+    def __repr__(self):
+        return "%s with %i SimBench codes" % (self.__class__.__name__, len(self))
+
+    def __len__(self):
+        return len(self._codes)
+
+    def select(self, **conditions):
+        """Returns the list of SimBench codes which fulfill all conditions. Each condition refers
+        to a column of 'data': 'max_<column>' and 'min_<column>' give inclusive bounds, '<column>'
+        gives a value or a list of allowed values.
+
+        EXAMPLE:
+            >>> catalog.select(max_n_bus=499, hv_level="MV", sw=True)
+        """
+        selected = np.ones(len(self), dtype=bool)
+        for key, value in conditions.items():
+            if key.startswith("max_") and key[4:] in self._columns:
+                selected &= self._columns[key[4:]] <= value
+            elif key.startswith("min_") and key[4:] in self._columns:
+                selected &= self._columns[key[4:]] >= value
+            elif key in self._columns:
+                if isinstance(value, (list, tuple, set)):
+                    selected &= pd.Series(self._columns[key]).isin(value).values
+                else:
+                    selected &= self._columns[key] == value
+            else:
+                raise ValueError("'%s' does not refer to a column of the catalog." % key)
+        return list(self._codes[selected])
+
+
+def _dataset_state(dataset):
+    """Returns a tuple describing the csv files of a dataset, to detect changes of the files."""
+    path = os.path.abspath(dataset.path)
+    files = sorted(
+        (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+        for entry in os.scandir(path)
+        if entry.name.endswith(".csv")
+    )
+    return path, dataset.sep, tuple(files)
+
+
+def get_simbench_catalog(sb_codes=None, input_path=None, cache_dir=None, use_cache=True):
+    """Returns the metadata (sizes and estimated memory) of SimBench codes as SimBenchCatalog, e.g.
+    to plan batch jobs. The metadata is computed once via get_simbench_code_metadata() and stored
+    in cache_dir. The cache is renewed if the csv files of the datasets change.
+
+    OPTIONAL:
+        **sb_codes** (list, None) - SimBench codes to include. If None, all codes of
+        collect_all_simbench_codes() are included.
+
+        **input_path** (str or SimBenchDataset, None) - path to the simbench grid csv files or a
+        SimBenchDataset of these files. If None, the complete data of the scenario of each code is
+        used.
+
+        **cache_dir** (str, None) - folder to store computed catalogs as json files. If None,
+        default_catalog_cache_dir() is used, which is created with access for the current user
+        only.
+
+        **use_cache** (bool, True) - if False, the catalog is computed without reading or writing
+        the cache.
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> catalog = sb.get_simbench_catalog()
+        >>> small_codes = catalog.select(max_n_bus=499)
+        >>> catalog.data.loc[small_codes, ["n_bus", "n_line", "memory_mb"]]
+    """
+    sb_codes = list(sb_codes) if sb_codes is not None else collect_all_simbench_codes()
+
+    # --- assign the codes to their datasets
+    datasets = dict()
+    code_datasets = list()
+    for sb_code in sb_codes:
+        if input_path is not None:
+            key = input_path
+        else:
+            key = complete_data_path(get_simbench_code_and_parameters(sb_code)[1][5])
+        if key not in datasets:
+            datasets[key] = _ensure_simbench_dataset(key)
+        code_datasets.append(datasets[key])
+
+    if use_cache:
+        state = (
+            simbench.__version__,
+            tuple(sb_codes),
+            tuple(_dataset_state(dataset) for dataset in datasets.values()),
+        )
+        if cache_dir is None:
+            cache_dir = default_catalog_cache_dir()
+            os.makedirs(os.path.dirname(cache_dir), exist_ok=True)
+            _private_directory(cache_dir)
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+        cache_file = os.path.join(
+            cache_dir,
+            "simbench_catalog_%s.json" % hashlib.sha1(repr(state).encode()).hexdigest(),
+        )
+        if os.path.isfile(cache_file):
+            return SimBenchCatalog(_read_catalog_data(cache_file))
+
+    data = pd.DataFrame(
+        [
+            get_simbench_code_metadata(sb_code, dataset)
+            for sb_code, dataset in zip(sb_codes, code_datasets)
+        ],
+        index=pd.Index(sb_codes, name="sb_code"),
+    )
+
+    if use_cache:
+        # write to a temporary file first, so that other processes never read incomplete files
+        tmp_file = "%s.%i.tmp" % (cache_file, os.getpid())
+        _write_catalog_data(data, tmp_file)
+        os.replace(tmp_file, cache_file)
+    return SimBenchCatalog(data)
@@ -5,7 +5,16 @@
 import numpy as np
 import pandas as pd
 import os
+import stat
+import getpass
+import hashlib
+import tempfile
+import threading
 from copy import deepcopy
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 import pandapower as pp
 
 from simbench import sb_dir
@@ -20,12 +29,26 @@ from simbench import (
     ensure_iterability,
     pp_profile_names,
 )
+from simbench.converter.read_and_write import _init_csv_table
+from simbench.converter.instrumentation import conversion_stage
 
 try:
-    from pandapower.toolbox.element_selection import get_connected_buses
-    from pandapower.toolbox.grid_modification import fuse_buses
+    from pandapower.toolbox.element_selection import branch_element_bus_dict, element_bus_tuples
+    from pandapower.toolbox.grid_modification import (
+        drop_buses,
+        drop_duplicated_measurements,
+        drop_lines,
+        drop_trafos,
+    )
 except ImportError:
-    from pandapower import get_connected_buses, fuse_buses
+    from pandapower import (
+        branch_element_bus_dict,
+        element_bus_tuples,
+        drop_buses,
+        drop_duplicated_measurements,
+        drop_lines,
+        drop_trafos,
+    )
 
 import logging
 
@@ -111,6 +134,132 @@ def get_bus_bus_switch_indices_from_csv(
     return list(switch_table.index[~(aux_nodeA | aux_nodeB)])
 
 
+class SimBenchDataset:
+    """Session object of a folder of SimBench csv files, e.g. of complete_data_path(scenario).
+    Every csv table is read at most once and derived data (the subnet split of the tables, the
+    lv_subnets of the hv_subnets, the lookup of node ids and the set of bus-bus switches) is
+    determined at most once. Thus, getting many SimBench grids out of one dataset is much faster
+    if a SimBenchDataset is passed as 'input_path' to get_simbench_net(),
+    get_relevant_subnets() or get_extracted_csv_data(). A dataset can be shared by several
+    threads.
+
+    INPUT:
+        **path** (str) - path to folder with csv data files
+
+    OPTIONAL:
+        **sep** (str, ";") - csv seperator
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> dataset = sb.SimBenchDataset(sb.complete_data_path(0))
+        >>> nets = [sb.get_simbench_net(code, dataset) for code in ["1-LV-rural1--0-sw",
+        ...                                                         "1-MV-rural--0-sw"]]
+    """
+
+    def __init__(self, path, sep=";"):
+        self.path = path
+        self.sep = sep
+        # guards the lazily filled caches, so that one dataset can be used by several threads
+        self._lock = threading.RLock()
+        self.clear()
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.path)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def clear(self):
+        """Drops all read tables and derived data."""
+        with self._lock:
+            self._tables = dict()
+            self._subnet_splits = dict()
+            self._lv_subnet_lists = dict()
+            self._node_lookup = None
+            self._bus_bus_switches = None
+
+    def table(self, tablename):
+        """Returns the csv table 'tablename'. The table is read from csv file at the first request.
+        The returned DataFrame is cached and shared by all requests, so it must not be modified.
+        """
+        if tablename not in self._tables:
+            with self._lock:
+                if tablename not in self._tables:
+                    with conversion_stage("read_csv_data:%s" % tablename):
+                        self._tables[tablename] = read_csv_data(
+                            self.path, sep=self.sep, tablename=tablename
+                        )
+        return self._tables[tablename]
+
+    def __getitem__(self, tablename):
+        return self.table(tablename)
+
+    def is_read_only(self, tablename):
+        """Returns True if the data of the csv table 'tablename' is read-only, e.g. since it is
+        shared with other processes. Read-only profile tables are extracted without copying their
+        data, see get_extracted_csv_data()."""
+        return False
+
+    def subnet_split(self, tablename):
+        """Returns the subnet strings of the csv table 'tablename', splitted at "_" into columns.
+        """
+        if tablename not in self._subnet_splits:
+            with self._lock:
+                if tablename not in self._subnet_splits:
+                    self._subnet_splits[tablename] = self.table(
+                        tablename
+                    ).subnet.str.split("_", expand=True)
+        return self._subnet_splits[tablename]
+
+    def lv_subnet_list(self, lv_level, hv_subnet, hv_grid_number):
+        """Returns the list of all lv_subnets of voltage level 'lv_level' which are connected to
+        hv_subnet."""
+        key = (lv_level, hv_subnet, hv_grid_number)
+        if key not in self._lv_subnet_lists:
+            with self._lock:
+                if key not in self._lv_subnet_lists:
+                    self._lv_subnet_lists[key] = _lv_subnet_list(
+                        self.table("Load"), lv_level, hv_subnet, hv_grid_number
+                    )
+        return list(self._lv_subnet_lists[key])
+
+    @property
+    def node_lookup(self):
+        """Series of the Node table indices, indexed by the node ids."""
+        if self._node_lookup is None:
+            with self._lock:
+                if self._node_lookup is None:
+                    node = self.table("Node")
+                    self._node_lookup = pd.Series(node.index, index=node.id.values)
+        return self._node_lookup
+
+    @property
+    def bus_bus_switches(self):
+        """Set of the Switch table indices of all bus-bus switches."""
+        if self._bus_bus_switches is None:
+            with self._lock:
+                if self._bus_bus_switches is None:
+                    self._bus_bus_switches = set(
+                        get_bus_bus_switch_indices_from_csv(
+                            self.table("Switch"), self.table("Node")
+                        )
+                    )
+        return self._bus_bus_switches
+
+
+def _ensure_simbench_dataset(input_path, sep=";"):
+    """Returns input_path as SimBenchDataset, if it is a path string."""
+    if isinstance(input_path, SimBenchDataset):
+        return input_path
+    return SimBenchDataset(input_path, sep=sep)
+
+
 def _simple_hv_subnet_determination(sb_code_parameters):
     """Determines the hv_subnet, neglecting special cases of complete grid or complete dataset
     download."""
@@ -127,6 +276,29 @@ def _simple_hv_subnet_determination(sb_code_parameters):
     return hv_subnet, hv_grid_number
 
 
+def _lv_subnet_list(load_data, lv_level, hv_subnet, hv_grid_number):
+    """Returns the list of all lv_subnets of voltage level 'lv_level' which are connected to
+    hv_subnet, derived from the profiles of the equivalent loads in 'load_data'."""
+    lv_types = load_data.loc[
+        load_data.subnet.str.startswith(hv_subnet + "_" + lv_level)
+    ].profile.value_counts()
+    filtered_lv_types = lv_types[
+        (pd.Series(lv_types.index.str[:2]).str.upper() == lv_level).values
+    ]
+
+    lv_subnet_list = []
+    for type_, number in filtered_lv_types.items():
+        if type_[:2].upper() == lv_level:
+            if type_[3:] in _grid_number_dict()[lv_level].keys():
+                lv_subnet_list += [
+                    lv_level
+                    + str(_grid_number_dict()[lv_level][type_[3:]])
+                    + ".%i" % (i + (hv_grid_number) * 100)
+                    for i in range(1, 1 + number)
+                ]
+    return lv_subnet_list
+
+
 def _simple_lv_subnets_determination(
     sb_code_parameters, hv_subnet, hv_grid_number, input_path
 ):
@@ -141,36 +313,9 @@ def _simple_lv_subnets_determination(
             sb_code_parameters[4]
         ]
     else:
-        load_data = pd.read_csv(os.path.join(input_path, "Load.csv"), sep=";")
-        lv_types = load_data.loc[
-            load_data.subnet.str.startswith(
-                hv_subnet + "_" + sb_code_parameters[2]
-            )
-        ].profile.value_counts()
-        filtered_lv_types = lv_types[
-            (
-                pd.Series(lv_types.index.str[:2]).str.upper()
-                == sb_code_parameters[2]
-            ).values
-        ]
-
-        lv_subnet_list = []
-        for type_, number in filtered_lv_types.items():
-            if type_[:2].upper() == sb_code_parameters[2]:
-                if (
-                    type_[3:]
-                    in _grid_number_dict()[sb_code_parameters[2]].keys()
-                ):
-                    lv_subnet_list += [
-                        sb_code_parameters[2]
-                        + str(
-                            _grid_number_dict()[sb_code_parameters[2]][
-                                type_[3:]
-                            ]
-                        )
-                        + ".%i" % (i + (hv_grid_number) * 100)
-                        for i in range(1, 1 + number)
-                    ]
+        lv_subnet_list = _ensure_simbench_dataset(input_path).lv_subnet_list(
+            sb_code_parameters[2], hv_subnet, hv_grid_number
+        )
 
         # --- determine lv_subnets for single or all lv grids
         if sb_code_parameters[4] == "all":
@@ -196,13 +341,21 @@ def _simple_lv_subnets_determination(
 def get_relevant_subnets(sb_code_info, input_path):
     """Determines a list of relevant subnet names of a parameter set, describing a SimBench grid
     selection. This list of subnets can be used to extract the requested SimBench grid from all
-    grids data."""
+    grids data.
+
+    INPUT:
+        **sb_code_info** (str or list) - simbench code information, see get_simbench_net()
+
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+    """
     _, sb_code_parameters = get_simbench_code_and_parameters(sb_code_info)
 
     # --- in case of complete data download:
     if sb_code_parameters[1] == "complete_data":
         assert sb_code_parameters[2] == ""
         return sb_code_parameters[1], sb_code_parameters[2]
+    input_path = _ensure_simbench_dataset(input_path)
 
     # --- in case of complete grid download:
     if sb_code_parameters[2] == "HVMVLV":
@@ -236,7 +389,7 @@ def get_relevant_subnets(sb_code_info, input_path):
 
 
 def _extract_csv_table_by_subnet(
-    csv_table, tablename, relevant_subnets, bus_bus_switches={}
+    csv_table, tablename, relevant_subnets, bus_bus_switches={}, subnet_split=None
 ):
     """Extracts csv table by subnet names.
 
@@ -251,6 +404,9 @@ def _extract_csv_table_by_subnet(
     OPTIONAL:
         **bus_bus_switches** (set, {}) - indices of bus-bus-switches in csv DataFrame.
         Only used if tablename == "Switch".
+
+        **subnet_split** (DataFrame, None) - csv_table.subnet.str.split("_", expand=True), if
+        already known
     """
     hv_subnets = ensure_iterability(relevant_subnets[0])
     lv_subnets = relevant_subnets[1]
@@ -260,11 +416,12 @@ def _extract_csv_table_by_subnet(
         and not csv_table.shape[0]
     ):
         return csv_table  # no extraction needed
-    csv_table = deepcopy(csv_table)
 
     if isinstance(csv_table, pd.DataFrame) and "subnet" in csv_table.columns:
         logger.debug("Start extracting %s" % tablename)
-        subnet_split = csv_table.subnet.str.split("_", expand=True)
+        csv_table = deepcopy(csv_table)
+        if subnet_split is None:
+            subnet_split = csv_table.subnet.str.split("_", expand=True)
 
         # --- hv_elms: all elements starting with hv_subnet
         hv_elms = set(subnet_split.index[subnet_split[0].isin(hv_subnets)])
@@ -313,9 +470,6 @@ def _extract_csv_table_by_subnet(
                     index=subnet_split.index,
                     columns=subnet_split.columns,
                 )
-                subnet_split.loc[[0, 1]] = subnet_split.loc[[0, 1]].replace(
-                    {"EHV": 1, "HV": 3, "MV": 5, "LV": 5}
-                )
                 # for col in [0, 1]:
                 #     for level_str, level_int in zip(["EHV", "HV", "MV", "LV"], [1, 3, 5, 7]):
                 #         subnet_split_level.loc[
@@ -375,23 +529,36 @@ def _extract_csv_table_by_subnet(
 
 def _get_extracted_csv_table(relevant_subnets, tablename, input_path, sep=";"):
     """Returns extracted csv data of the requested SimBench grid."""
-    csv_table = read_csv_data(input_path, sep=sep, tablename=tablename)
-    if tablename == "Switch":
-        node_table = read_csv_data(input_path, sep=sep, tablename="Node")
-        bus_bus_switches = set(
-            get_bus_bus_switch_indices_from_csv(csv_table, node_table)
-        )
-    else:
-        bus_bus_switches = {}
-    extracted_csv_table = _extract_csv_table_by_subnet(
-        csv_table,
-        tablename,
-        relevant_subnets,
-        bus_bus_switches=bus_bus_switches,
+    dataset = _ensure_simbench_dataset(input_path, sep=sep)
+    csv_table = dataset.table(tablename)
+    bus_bus_switches = dataset.bus_bus_switches if tablename == "Switch" else {}
+    subnet_split = (
+        dataset.subnet_split(tablename)
+        if csv_table.shape[0] and "subnet" in csv_table.columns
+        else None
     )
+    with conversion_stage("_extract_csv_table_by_subnet:%s" % tablename):
+        extracted_csv_table = _extract_csv_table_by_subnet(
+            csv_table,
+            tablename,
+            relevant_subnets,
+            bus_bus_switches=bus_bus_switches,
+            subnet_split=subnet_split,
+        )
+    if extracted_csv_table is csv_table:  # never return the shared table of the dataset
+        extracted_csv_table = _copy_dataset_table(dataset, tablename, csv_table)
     return extracted_csv_table
 
 
+def _copy_dataset_table(dataset, tablename, csv_table):
+    """Returns a copy of a csv table of the dataset which can be consumed by the conversion.
+    Read-only profile tables, e.g. of a SharedSimBenchDataset, are copied shallowly, since the
+    conversion does not change their values: their columns remain views on the data of the
+    dataset."""
+    deep = tablename not in csv_tablenames("profiles") or not dataset.is_read_only(tablename)
+    return csv_table.copy(deep=deep)
+
+
 def _get_extracted_csv_data_from_dict(csv_data, relevant_subnets):
     """Returns extracted csv data of the requested SimBench grid from given csv data dict."""
     csv_data = deepcopy(csv_data)
@@ -413,62 +580,199 @@ def _get_extracted_csv_data_from_dict(csv_data, relevant_subnets):
     return csv_data
 
 
-def get_extracted_csv_data(relevant_subnets, input_path, sep=";", **kwargs):
+# csv tables which are needed to convert the elements of a csv table
+_required_csv_tables = {
+    "Line": ["LineType", "DCLineType"],
+    "Transformer": ["TransformerType"],
+    "Transformer3W": ["Transformer3WType"],
+}
+_csv_table_groups = ["elements", "profiles", "types", "cases", "res_elements"]
+_branch_csv_tablenames = ["Line", "Transformer", "Transformer3W"]
+
+
+def _expand_csv_tablenames(names):
+    """Returns the csv tablenames of a list of tablenames and table groups, e.g. ["profiles"]."""
+    all_tablenames = csv_tablenames(_csv_table_groups)
+    tablenames = list()
+    for name in ensure_iterability(names):
+        if name in _csv_table_groups:
+            tablenames += csv_tablenames(name)
+        elif name in all_tablenames:
+            tablenames.append(name)
+        else:
+            raise ValueError(
+                "'%s' is neither a csv table nor a group of csv tables " % name
+                + str(_csv_table_groups) + "."
+            )
+    return tablenames
+
+
+def _selected_csv_tablenames(include=None, exclude=None):
+    """Returns the set of csv tablenames which are selected by include and exclude. The Node table
+    and the types of selected branches are always selected."""
+    selected = set(
+        _expand_csv_tablenames(include if include is not None else _csv_table_groups)
+    )
+    if exclude is not None:
+        selected -= set(_expand_csv_tablenames(exclude))
+    selected.add("Node")
+    for tablename, required in _required_csv_tables.items():
+        if tablename in selected:
+            selected |= set(required)
+    return selected
+
+
+def get_extracted_csv_data(
+    relevant_subnets, input_path, sep=";", include=None, exclude=None, **kwargs
+):
     """Returns extracted csv data of the requested SimBench grid
     (per default from all SimBench grids csv data).
+    'input_path' can be a path string or a SimBenchDataset.
+    'include' and 'exclude' select csv tables, see get_simbench_net(). Unselected tables are
+    neither read nor extracted but returned as empty tables.
     **kwargs are ignored.
     """
+    dataset = _ensure_simbench_dataset(input_path, sep=sep)
+    selected = _selected_csv_tablenames(include, exclude)
+
     # --- import input data
+    csv_data = dict()
     if "complete_data" in relevant_subnets[0]:  # return complete data
-        return read_csv_data(input_path, sep=sep)
+        for tablename in csv_tablenames(_csv_table_groups):
+            csv_data[tablename] = (
+                _copy_dataset_table(dataset, tablename, dataset.table(tablename))
+                if tablename in selected
+                else _init_csv_table(tablename)
+            )
     else:
-        csv_data = dict()
         for tablename in csv_tablenames(
             ["elements", "profiles", "types", "cases"]
         ):
-            csv_data[tablename] = _get_extracted_csv_table(
-                relevant_subnets, tablename, input_path=input_path
+            csv_data[tablename] = (
+                _get_extracted_csv_table(relevant_subnets, tablename, input_path=dataset)
+                if tablename in selected
+                else _init_csv_table(tablename)
             )
+    if "Coordinates" not in selected:
+        csv_data["Node"]["coordID"] = None
+    if not all(tablename in selected for tablename in _branch_csv_tablenames):
+        _drop_references_to_unselected_branches(csv_data)
     return csv_data
 
 
-def _get_connected_buses_via_bus_bus_switch(net, buses):
-    """Returns a set of buses which are connected to 'buses' via bus-bus switches."""
-    buses = set(ensure_iterability(buses))
-    add_buses = [1]  # set anything to add_buses to start the while loop
-    while len(add_buses):
-        add_buses = get_connected_buses(net, buses, consider=("s"))
-        buses |= add_buses
-    return buses
+def _drop_references_to_unselected_branches(csv_data):
+    """Drops the auxiliary nodes which are not connected to any element of csv_data, e.g. the
+    auxiliary nodes of branch tables which are not selected, together with their switches, as well
+    as the measurements of these nodes and of branches which are not in csv_data. Thus, the csv
+    data remains consistent, analogous to get_extracted_csv_data_by_area()."""
+    referenced = set()
+    for tablename, csv_table in csv_data.items():
+        if tablename not in ["Node", "Switch", "Measurement", "NodePFResult"]:
+            for col in _csv_node_columns(csv_table):
+                referenced |= set(csv_table[col])
+    node = csv_data["Node"]
+    csv_data["Node"] = node.loc[(node.type != "auxiliary") | node.id.isin(referenced)]
+    nodes = set(csv_data["Node"].id)
+    switch = csv_data["Switch"]
+    csv_data["Switch"] = switch.loc[switch.nodeA.isin(nodes) & switch.nodeB.isin(nodes)]
+
+    branches = set()
+    for tablename in _branch_csv_tablenames:
+        branches |= set(csv_data[tablename].id)
+    measurement = csv_data["Measurement"]
+    csv_data["Measurement"] = measurement.loc[
+        measurement.element1.isin(nodes)
+        & (measurement.element2.isnull() | measurement.element2.isin(branches))
+    ]
+    if "NodePFResult" in csv_data.keys():
+        res = csv_data["NodePFResult"]
+        csv_data["NodePFResult"] = res.loc[res.node.isin(nodes)]
+
+
+def _get_bus_bus_switch_groups(net, bus_bus_sw):
+    """Returns a Series of representing buses, indexed by all buses which are connected via the
+    given bus-bus switches. Groups of connected buses are determined in one pass as connected
+    components of the graph of the bus-bus switches. The representing bus of each group is the
+    'bus' of the first switch of the group."""
+    if not len(bus_bus_sw):
+        return pd.Series([], dtype=np.int64)
+    sw_buses = net.switch.bus.loc[bus_bus_sw].values.astype(np.int64)
+    sw_elements = net.switch.element.loc[bus_bus_sw].values.astype(np.int64)
+    buses, inverse = np.unique(
+        np.concatenate([sw_buses, sw_elements]), return_inverse=True
+    )
+    n_sw = len(bus_bus_sw)
+    graph = coo_matrix(
+        (np.ones(n_sw), (inverse[:n_sw], inverse[n_sw:])),
+        shape=(len(buses), len(buses)),
+    )
+    _, labels = connected_components(graph, directed=False)
+    representing_buses = pd.Series(sw_buses).groupby(labels[inverse[:n_sw]]).first()
+    return pd.Series(representing_buses.loc[labels].values, index=buses)
+
+
+def _fuse_bus_groups(net, representing_buses):
+    """Fuses all buses of the index of 'representing_buses' to the bus given by the values.
+    In contrast to calling pandapower's fuse_buses() per group of buses, the buses of each element
+    table are remapped in one vectorized operation."""
+    fused = representing_buses.loc[
+        representing_buses.index != representing_buses.values
+    ]
+    if not len(fused):
+        return
+    reps = set(fused.values)
+
+    # --- reroute element connections and bus measurements from fused buses to representing buses
+    bus_columns = list(element_bus_tuples()) + [("measurement", "element")]
+    for element, column in bus_columns:
+        if not net[element].shape[0]:
+            continue
+        is_fused = net[element][column].isin(fused.index)
+        if element == "switch" and column == "element":
+            is_fused &= net[element]["et"] == "b"
+        elif element == "measurement":
+            is_fused &= net[element]["element_type"] == "bus"
+        if is_fused.any():
+            net[element].loc[is_fused, column] = fused.loc[
+                net[element][column].loc[is_fused]
+            ].values
+
+    # --- drop fused buses and branches which now connect representing buses with themselves
+    drop_buses(net, fused.index, drop_elements=False)
+    for element, columns in branch_element_bus_dict(include_switch=True).items():
+        if not net[element].shape[0]:
+            continue
+        first = net[element][columns[0]]
+        inner = first.isin(reps)
+        for column in columns[1:]:
+            inner &= net[element][column] == first
+        if element == "switch":
+            inner &= (net[element]["element"] == first) & (net[element]["et"] == "b")
+        if inner.any():
+            if element == "line":
+                drop_lines(net, net[element].index[inner])
+            elif "trafo" in element:
+                drop_trafos(net, net[element].index[inner], table=element)
+            else:
+                net[element] = net[element].drop(net[element].index[inner])
+    if net.measurement.shape[0]:
+        drop_duplicated_measurements(net, buses=reps)
 
 
 def generate_no_sw_variant(net):
     """Drops all bus-bus switches and fuses buses which were connected by bus-bus switches.
     Furthermore drop all closed line and trafo switches."""
-    # get bus-bus switch indices and close the switches to let get_connected_buses() find them
+    # determine groups of buses connected via bus-bus switches, regardless of the switch position
     bus_bus_sw = net.switch.index[net.switch.et == "b"]
-    net.switch.loc[bus_bus_sw, "closed"] = True
-
-    # determine to_fuse dict
-    # to_fuse is used to fuse buses which are connected via bus-bus switches
-    to_fuse = dict()
-    already_considered = set()
-    for bbs in bus_bus_sw:
-        bus1 = net.switch.bus.at[bbs]
-        if bus1 not in already_considered:
-            bus2 = net.switch.element.at[bbs]
-            to_fuse[bus1] = _get_connected_buses_via_bus_bus_switch(
-                net, {bus1, bus2}
-            ) - {bus1}
-            already_considered |= {bus1}
-            already_considered |= to_fuse[bus1]
-
-    # drop all closed switches (which now also includes all bus-bus switches (see above))
-    net.switch = net.switch.drop(net.switch.index[net.switch.closed])
+    representing_buses = _get_bus_bus_switch_groups(net, bus_bus_sw)
+
+    # drop all closed switches and all bus-bus switches
+    net.switch = net.switch.drop(
+        net.switch.index[net.switch.closed.astype(bool) | (net.switch.et == "b")]
+    )
 
     # fuse buses which are connected via bus-bus switches
-    for b1, b2 in to_fuse.items():
-        fuse_buses(net, b1, b2)
+    _fuse_bus_groups(net, representing_buses)
 
     # replace auxiliary type of buses with no switch connected anymore
     aux_buses = net.bus.index[net.bus.type == "auxiliary"]
@@ -479,7 +783,296 @@ def generate_no_sw_variant(net):
     net.bus.loc[aux_buses_to_change_type, "type"] = "b"
 
 
-def get_simbench_net(sb_code_info: str, input_path: str = None):
+def _csv_node_columns(csv_table):
+    """Returns the columns of a csv table which refer to node ids."""
+    return [
+        col
+        for col in ["node", "nodeA", "nodeB", "nodeHV", "nodeMV", "nodeLV", "element1",
+                    "element2"]
+        if col in csv_table.columns
+    ]
+
+
+def _group_csv_nodes_by_bus_bus_switches(csv_data, bus_bus_sw):
+    """Returns a Series of representing node ids, indexed by all node ids which are connected via
+    the given bus-bus switches and which can be fused without changing setpoints of connected
+    elements, i.e. all nodes of a group have equal vmSetp and vaSetp.
+    Analogous to _get_bus_bus_switch_groups(), the representing node of each group is nodeA of the
+    first switch of the group."""
+    switch = csv_data["Switch"].loc[bus_bus_sw]
+    if not switch.shape[0]:
+        return pd.Series([], dtype=object)
+    n_sw = switch.shape[0]
+    codes, nodes = pd.factorize(pd.concat([switch.nodeA, switch.nodeB], ignore_index=True))
+    graph = coo_matrix(
+        (np.ones(n_sw), (codes[:n_sw], codes[n_sw:])), shape=(len(nodes), len(nodes))
+    )
+    _, labels = connected_components(graph, directed=False)
+    representing_nodes = switch.nodeA.groupby(labels[codes[:n_sw]]).first()
+
+    # --- only groups with equal setpoints can be fused in the csv data
+    setpoints = (
+        csv_data["Node"]
+        .set_index("id")[["vmSetp", "vaSetp"]]
+        .loc[nodes]
+        .astype(float)
+        .fillna(np.inf)
+    )
+    consistent = (setpoints.groupby(labels).nunique() == 1).all(axis=1)
+    in_consistent_group = consistent.loc[labels].values
+    return pd.Series(
+        representing_nodes.loc[labels[in_consistent_group]].values,
+        index=nodes[in_consistent_group],
+    )
+
+
+def generate_no_sw_variant_of_csv_data(csv_data):
+    """Fuses nodes which are connected by bus-bus switches and drops closed branch switches
+    (switches between a node and an auxiliary node at a line or transformer end) directly in the
+    csv data. Converting the resulting csv_data via csv_data2pp() and applying
+    generate_no_sw_variant() to the net gives a net which is equivalent to the net of the
+    conversion of the unchanged csv_data and applying generate_no_sw_variant() - but without
+    creating and dropping most of the auxiliary buses and switches in pandapower.
+    The only differences are the bus and element indices, since the dropped nodes and elements do
+    not leave gaps in the indices.
+
+    Switch constellations which cannot be collapsed in the csv data without changing setpoints of
+    connected elements are kept and remain to be handled by generate_no_sw_variant():
+    groups of nodes with different vmSetp or vaSetp, auxiliary nodes which are connected to other
+    elements than one line or transformer, as well as open switches.
+    If no switch remains, csv_data2pp() skips all switch related steps
+    (_ensure_single_switch_at_aux_node_and_copy_vm_setp(),
+    _sort_switch_nodes_and_prepare_element_and_et() and create_branch_switches()) and
+    get_simbench_net() skips generate_no_sw_variant(). Otherwise, these steps are run as usual but
+    only handle the remaining switches.
+
+    INPUT:
+        **csv_data** (dict) - extracted SimBench csv data of one grid, which is changed inplace
+    """
+    node = csv_data["Node"]
+    switch = csv_data["Switch"]
+    if not switch.shape[0]:
+        return
+
+    # --- determine auxiliary nodes with only one switch which connect lines or transformers
+    sw_nodes = pd.concat([switch.nodeA, switch.nodeB], ignore_index=True)
+    n_sw_at_node = sw_nodes.value_counts()
+    aux_nodes = pd.Index(node.id[node.type == "auxiliary"])
+    single_sw_aux = aux_nodes[aux_nodes.isin(n_sw_at_node.index[n_sw_at_node == 1])]
+    branch_ends = {
+        "Line": ["nodeA", "nodeB"],
+        "Transformer": ["nodeHV", "nodeLV"],
+    }
+    branch_end_nodes = pd.concat(
+        [csv_data[elm][col] for elm, cols in branch_ends.items() for col in cols],
+        ignore_index=True,
+    )
+    branch_aux = single_sw_aux[single_sw_aux.isin(branch_end_nodes)]
+
+    nodeA_is_aux = switch.nodeA.isin(branch_aux)
+    nodeB_is_aux = switch.nodeB.isin(branch_aux)
+    is_branch_sw = nodeA_is_aux | nodeB_is_aux
+    is_bus_bus_sw = ~(
+        switch.nodeA.isin(single_sw_aux) | switch.nodeB.isin(single_sw_aux)
+    )
+    sw_aux = switch.nodeA.where(nodeA_is_aux, switch.nodeB)
+    sw_other = switch.nodeB.where(nodeA_is_aux, switch.nodeA)
+    aux_to_node = pd.Series(sw_other[is_branch_sw].values, index=sw_aux[is_branch_sw].values)
+
+    # --- closed branch switches can be collapsed if the auxiliary node is only connected to one
+    # ac line or transformer. Otherwise, setpoints of the auxiliary node could be relevant.
+    other_node_refs = [
+        csv_data[elm][col]
+        for elm in ["ExternalNet", "PowerPlant", "RES", "Load", "Storage", "Shunt",
+                    "Transformer3W"]
+        if elm in csv_data.keys()
+        for col in _csv_node_columns(csv_data[elm])
+    ]
+    if "DCLineType" in csv_data.keys():
+        dclines = csv_data["Line"].type.isin(csv_data["DCLineType"].id)
+        other_node_refs += [csv_data["Line"].loc[dclines, col] for col in ["nodeA", "nodeB"]]
+    n_branch_ends = branch_end_nodes.value_counts()
+    collapsible_aux = branch_aux[
+        (n_branch_ends.loc[branch_aux] == 1).values
+        & ~branch_aux.isin(pd.concat(other_node_refs) if len(other_node_refs) else [])
+    ]
+    is_closed = switch.cond.astype(float).fillna(0).astype(bool)
+    sw_to_collapse = switch.index[is_branch_sw & is_closed & sw_aux.isin(collapsible_aux)]
+    collapsed_aux = aux_to_node.loc[sw_aux.loc[sw_to_collapse].values]
+
+    # --- determine node groups to fuse (analogous to generate_no_sw_variant())
+    fuse_map = _group_csv_nodes_by_bus_bus_switches(csv_data, switch.index[is_bus_bus_sw])
+    reps = set(fuse_map.values)
+    fuse_map = fuse_map.loc[fuse_map.index != fuse_map.values]
+    bus_bus_sw_to_drop = switch.index[is_bus_bus_sw & switch.nodeA.isin(fuse_map.index.union(
+        pd.Index(list(reps))))]
+
+    # --- branches which would connect representing nodes with themselves are dropped as well as
+    # their switches and auxiliary nodes
+    def fused(nodes):
+        mapped = nodes.map(aux_to_node).fillna(nodes)
+        return mapped.map(fuse_map).fillna(mapped)
+
+    dropped_branches = dict()
+    branches = list(branch_ends.items()) + [("Transformer3W", ["nodeHV", "nodeMV", "nodeLV"])]
+    for elm, cols in branches:
+        if elm not in csv_data.keys() or not csv_data[elm].shape[0]:
+            continue
+        first = fused(csv_data[elm][cols[0]])
+        inner = first.isin(reps)
+        for col in cols[1:]:
+            inner &= fused(csv_data[elm][col]) == first
+        dropped_branches[elm] = csv_data[elm].index[inner]
+    dropped_branch_aux = pd.concat([
+        csv_data[elm].loc[idx, col] for elm, idx in dropped_branches.items()
+        for col in _csv_node_columns(csv_data[elm])] + [pd.Series([], dtype=object)])
+    dropped_branch_aux = dropped_branch_aux[dropped_branch_aux.isin(branch_aux)]
+    sw_of_dropped_branches = switch.index[is_branch_sw & sw_aux.isin(dropped_branch_aux)]
+
+    # --- drop switches, nodes, branches and measurements
+    nodes_to_drop = set(fuse_map.index) | set(collapsed_aux.index) | set(dropped_branch_aux)
+    csv_data["Switch"] = switch.drop(
+        sw_to_collapse.union(bus_bus_sw_to_drop).union(sw_of_dropped_branches)
+    )
+    csv_data["Node"] = node.loc[~node.id.isin(nodes_to_drop)]
+    for elm, idx in dropped_branches.items():
+        if "Measurement" in csv_data.keys():
+            meas = csv_data["Measurement"]
+            at_dropped = meas.element1.isin(csv_data[elm].id.loc[idx]) | meas.element2.isin(
+                csv_data[elm].id.loc[idx])
+            csv_data["Measurement"] = meas.loc[~at_dropped]
+        csv_data[elm] = csv_data[elm].drop(idx)
+    if "NodePFResult" in csv_data.keys():
+        res = csv_data["NodePFResult"]
+        csv_data["NodePFResult"] = res.loc[~res.node.isin(nodes_to_drop)]
+
+    # --- replace node ids of collapsed auxiliary nodes and fused nodes
+    node_map = pd.concat([collapsed_aux.map(fuse_map).fillna(collapsed_aux), fuse_map])
+    for key, table in csv_data.items():
+        if not isinstance(table, pd.DataFrame) or key in ["Node", "NodePFResult"]:
+            continue
+        cols = _csv_node_columns(table)
+        if not len(cols) or not table.shape[0]:
+            continue
+        csv_data[key] = table = table.copy()
+        for col in cols:
+            to_replace = table[col].isin(node_map.index)
+            if to_replace.any():
+                table.loc[to_replace, col] = node_map.loc[table.loc[to_replace, col]].values
+
+    # --- drop bus measurements which are duplicated at representing nodes
+    if "Measurement" in csv_data.keys() and csv_data["Measurement"].shape[0]:
+        meas = csv_data["Measurement"]
+        bus_meas = meas.loc[meas.element2.isnull() & meas.element1.isin(reps)]
+        dupl = bus_meas.index[bus_meas.duplicated(subset=["element1", "variable"])]
+        csv_data["Measurement"] = meas.drop(dupl)
+
+
+def _private_directory(path):
+    """Creates the folder 'path' with access for the current user only, if it does not exist, and
+    returns path. Since files of such folders are trusted, e.g. unpickled, a ValueError is raised
+    if path is no folder, is owned by another user or is accessible by other users."""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    path_stat = os.lstat(path)
+    if not stat.S_ISDIR(path_stat.st_mode):
+        raise ValueError("%s must be a folder." % path)
+    if hasattr(os, "getuid") and (
+        path_stat.st_uid != os.getuid() or path_stat.st_mode & 0o077
+    ):
+        raise ValueError(
+            "The folder %s must be owned by the current user and must not be " % path
+            + "accessible by other users."
+        )
+    return path
+
+
+def _simbench_runtime_dir():
+    """Returns the private folder of the current user for the socket and the key of the
+    SimBenchGridServer: $XDG_RUNTIME_DIR/simbench or a folder in the temporary directory."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return _private_directory(os.path.join(runtime_dir, "simbench"))
+    return _private_directory(
+        os.path.join(tempfile.gettempdir(), "simbench_%s" % getpass.getuser())
+    )
+
+
+def default_grid_server_address():
+    """Returns the path of the Unix domain socket which is used by SimBenchGridServer and by
+    get_simbench_net(..., server=True) if no other address is given. The socket is located in a
+    folder which is only accessible by the current user."""
+    return os.path.join(_simbench_runtime_dir(), "grid_server.sock")
+
+
+def _grid_server_authkey():
+    """Returns the secret key by which SimBenchGridServer and its clients authenticate each other
+    before any pickled data is exchanged. The key is created at the first call and stored in the
+    private folder of the current user."""
+    path = os.path.join(_simbench_runtime_dir(), "grid_server.key")
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        with os.fdopen(fd, "wb") as f:
+            f.write(os.urandom(32))
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _request_simbench_net_from_server(
+    server,
+    sb_code,
+    input_path,
+    generate_no_sw_in_csv,
+    include=None,
+    exclude=None,
+    geodata="geojson",
+):
+    """Requests a net from the SimBenchGridServer listening at 'server'. Returns None if no server
+    is reachable. Errors of the grid creation are raised as in get_simbench_net()."""
+    if isinstance(input_path, SimBenchDataset):
+        input_path = input_path.path
+    address = server
+    try:
+        # Unix domain sockets are not available on all platforms, which raises ValueError
+        address = default_grid_server_address() if server is True else server
+        with Client(address, family="AF_UNIX", authkey=_grid_server_authkey()) as conn:
+            conn.send(
+                (
+                    "get_simbench_net",
+                    sb_code,
+                    input_path,
+                    generate_no_sw_in_csv,
+                    include,
+                    exclude,
+                    geodata,
+                )
+            )
+            status, result = conn.recv()
+    except (OSError, EOFError, ValueError, AuthenticationError) as e:
+        logger.info(
+            "No SimBench grid server is reachable at %s (%s). " % (address, e)
+            + "The net is created locally."
+        )
+        return None
+    if status == "error":
+        raise result
+    return result
+
+
+def get_simbench_net(
+    sb_code_info: str,
+    input_path: str = None,
+    generate_no_sw_in_csv: bool = False,
+    server=None,
+    include=None,
+    exclude=None,
+    geodata="geojson",
+):
     """Returns the simbench net, requested by a given SimBench code information. Please have a look
     into jupyter notebook tutorials to learn more about simbench grids and the meaning of SimBench
     codes.
@@ -492,10 +1085,37 @@ def get_simbench_net(sb_code_info: str, input_path: str = None):
         all connected LV grids, both of SimBench version 1, scenario zero and with full switch
         representation.
         As an alternative :code:`[1, "MV", "LV", "urban", "all", 0, "sw"]` can be passed.
-    input_path : str, optional
+    input_path : str or SimBenchDataset, optional
         option to change the path to all simbench grid csv files. However, a change should not be
         necessary and is only for cases of applying the function to data from alternative location,
-        by default None
+        by default None.
+        If many grids are requested, passing a SimBenchDataset avoids reading the csv files again
+        for every grid.
+    generate_no_sw_in_csv : bool, optional
+        only relevant for SimBench codes without switches ("no_sw"). If True, bus-bus switches and
+        closed branch switches are already collapsed in the csv data via
+        generate_no_sw_variant_of_csv_data() which avoids creating and dropping many auxiliary
+        buses and switches. The resulting net is equivalent but the indices of buses and elements
+        have no gaps, by default False
+    server : str or bool, optional
+        address (path of the Unix domain socket) of a running SimBenchGridServer which holds the
+        parsed csv data in memory and creates the net. True means default_grid_server_address().
+        If no server is reachable, the net is created locally, by default None
+    include : str or list, optional
+        csv tables (e.g. "Line") or groups of csv tables ("elements", "profiles", "types", "cases")
+        which are read, extracted and converted. If None, all tables are included. The Node table
+        and the types of included lines and transformers are always included, by default None
+    exclude : str or list, optional
+        csv tables or groups of csv tables which are neither read nor converted, e.g.
+        ["Measurement", "profiles", "StudyCases", "Coordinates"] for topology studies. The net has
+        empty tables for the excluded data and, without Coordinates, no geodata. Excluded branch
+        tables are dropped together with their auxiliary nodes, switches and measurements, by
+        default None
+    geodata : str, optional
+        how the bus coordinates are stored: "geojson" (GeoJSON strings in net.bus.geo), "numeric"
+        (numeric columns net.bus.x and net.bus.y; net.bus.geo remains empty until
+        materialize_bus_geo(net) is called, which creates the same GeoJSON strings as "geojson")
+        or "none", see csv_data2pp(), by default "geojson"
 
     Returns
     -------
@@ -510,27 +1130,77 @@ def get_simbench_net(sb_code_info: str, input_path: str = None):
     >>> import pandapower as pp
     >>> pp.toolbox.nets_equal(net, sb.get_simbench_net([1, "MV", "LV", "urban", "all", 0, "sw"]))
     True
+
+    >>> dataset = sb.SimBenchDataset(sb.complete_data_path(0))
+    >>> net1 = sb.get_simbench_net('1-LV-rural1--0-sw', dataset)
+    >>> net2 = sb.get_simbench_net('1-LV-rural2--0-sw', dataset)  # no csv file is read again
+
+    >>> # with a server, started e.g. via 'python -m simbench.networks.grid_server'
+    >>> net = sb.get_simbench_net('1-MVLV-urban-all-0-sw', server=True)
+
+    >>> net = sb.get_simbench_net('1-MVLV-urban-all-0-sw', exclude=["profiles", "Measurement"])
+
+    >>> net = sb.get_simbench_net('1-MVLV-urban-all-0-sw', geodata="numeric")
+    >>> sb.materialize_bus_geo(net)  # GeoJSON strings in net.bus.geo
     """
     # --- get relevant subnets
     sb_code, sb_code_parameters = get_simbench_code_and_parameters(
         sb_code_info
     )
-    input_path = (
-        input_path
-        if input_path is not None
-        else complete_data_path(sb_code_parameters[5])
-    )
-    relevant_subnets = get_relevant_subnets(sb_code_parameters, input_path)
+    if server:
+        net = _request_simbench_net_from_server(
+            server,
+            sb_code,
+            input_path,
+            generate_no_sw_in_csv,
+            include=include,
+            exclude=exclude,
+            geodata=geodata,
+        )
+        if net is not None:
+            return net
+    with conversion_stage("get_simbench_net"):
+        input_path = _ensure_simbench_dataset(
+            input_path
+            if input_path is not None
+            else complete_data_path(sb_code_parameters[5])
+        )
+        with conversion_stage("get_relevant_subnets"):
+            relevant_subnets = get_relevant_subnets(sb_code_parameters, input_path)
+
+        # --- get_extracted_csv_data and convert this data to pandapower net
+        with conversion_stage("get_extracted_csv_data"):
+            csv_data = get_extracted_csv_data(
+                relevant_subnets, input_path, include=include, exclude=exclude
+            )
+        if "Coordinates" not in _selected_csv_tablenames(include, exclude):
+            geodata = "none"  # no generic coordinates without the excluded Coordinates
+        return _extracted_csv_data2pp(
+            csv_data,
+            sb_code_parameters[6],
+            generate_no_sw_in_csv=generate_no_sw_in_csv,
+            geodata=geodata,
+        )
 
-    # --- get_extracted_csv_data and convert this data to pandapower net
-    csv_data = get_extracted_csv_data(relevant_subnets, input_path)
-    filter_unapplied_profiles(csv_data)
-    filter_loadcases(csv_data)
-    net = csv_data2pp(csv_data)
 
-    # --- remove switches if wanted by sb_code_info
-    if not sb_code_parameters[6]:  # remove Switches
-        generate_no_sw_variant(net)
+def _extracted_csv_data2pp(csv_data, sw, generate_no_sw_in_csv=False, geodata="geojson"):
+    """Converts extracted csv data to a pandapower net with (sw=True) or without switches.
+    csv_data is consumed."""
+    with conversion_stage("filter_unapplied_profiles"):
+        filter_unapplied_profiles(csv_data)
+    with conversion_stage("filter_loadcases"):
+        filter_loadcases(csv_data)
+    if not sw and generate_no_sw_in_csv:
+        with conversion_stage("generate_no_sw_variant_of_csv_data"):
+            generate_no_sw_variant_of_csv_data(csv_data)
+    # csv_data is only created for the conversion
+    with conversion_stage("csv_data2pp"):
+        net = csv_data2pp(csv_data, copy=False, geodata=geodata)
+
+    # --- remove switches if wanted by sb_code_info (and not already done in the csv data)
+    if not sw and (net.switch.shape[0] or (net.bus.type == "auxiliary").any()):
+        with conversion_stage("generate_no_sw_variant"):
+            generate_no_sw_variant(net)
 
     return net
 
@@ -569,5 +1239,105 @@ def get_all_simbench_profiles(scenario, input_path=None, sep=";"):
     return profiles
 
 
+def _column_fingerprint(values):
+    """Returns a hashable fingerprint of the values of a column."""
+    if values.dtype == object:
+        data = pd.util.hash_array(values).tobytes()
+    else:
+        data = np.ascontiguousarray(values).tobytes()
+    return values.dtype.str, len(values), hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _columns_equal(values1, values2):
+    """Returns True if both columns have equal values; nan values of float columns are equal."""
+    if values1.dtype.kind in "fc":
+        return np.array_equal(values1, values2, equal_nan=True)
+    return np.array_equal(values1, values2)
+
+
+def get_all_simbench_profiles_of_scenarios(scenarios=(0, 1, 2), input_paths=None, sep=";"):
+    """
+    Returns the profiles of get_all_simbench_profiles() for multiple scenarios, holding every
+    distinct profile column only once in memory. Columns are identified by fingerprints of their
+    values, confirmed by comparing the values. All distinct numeric columns are stored in one
+    shared read-only buffer (per number of time steps and dtype) and the DataFrames of the
+    scenarios are views into this buffer. Thus, profile columns which are equal in multiple
+    scenarios, e.g. most load profiles, need memory only once. The DataFrames must be copied before
+    they are modified.
+
+    OPTIONAL:
+        **scenarios** (iterable, (0, 1, 2)) - scenarios of which the profiles are requested
+
+        **input_paths** (dict, None) - paths to the simbench grid csv files per scenario. If None,
+        complete_data_path(scenario) is used for all scenarios.
+
+        **sep** (str, ";") - seperator of the csv files which contain the profiles information.
+
+    OUTPUT:
+        **profiles** (dict) - dict of profiles per scenario, e.g. profiles[1]["load"]
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> profiles = sb.get_all_simbench_profiles_of_scenarios()
+        >>> load_profiles_scenario_2 = profiles[2]["load"]
+    """
+    input_paths = input_paths if input_paths is not None else dict()
+
+    # --- read the profiles of all scenarios and keep only distinct columns
+    distinct = dict()  # fingerprint -> list of (group, position of the column in the group)
+    groups = dict()  # (number of rows, dtype) -> list of distinct columns
+    layouts = dict()  # scenario -> profile table -> list of (column name, group, position)
+    for scenario in scenarios:
+        profiles = get_all_simbench_profiles(
+            scenario, input_path=input_paths.get(scenario), sep=sep
+        )
+        layouts[scenario] = dict()
+        for key, df in profiles.items():
+            layout = list()
+            for col in df.columns:
+                values = df[col].values
+                group_key = (len(values), values.dtype)
+                group = groups.setdefault(group_key, list())
+                candidates = distinct.setdefault(_column_fingerprint(values), list())
+                position = next((
+                    pos for key_, pos in candidates
+                    if _columns_equal(groups[key_][pos], values)
+                ), None)
+                if position is None:
+                    position = len(group)
+                    candidates.append((group_key, position))
+                    group.append(np.array(values))  # copy to release the read DataFrame
+                layout.append((col, group_key, position))
+            layouts[scenario][key] = layout
+        del profiles
+    logger.debug(
+        "%i distinct profile columns are kept of %i columns." % (
+            sum(len(group) for group in groups.values()),
+            sum(len(layout) for tables in layouts.values() for layout in tables.values()),
+        )
+    )
+
+    # --- move the distinct numeric columns into one buffer per group
+    for (n_rows, dtype), group in groups.items():
+        if dtype == object:
+            continue
+        buffer = np.empty((n_rows, len(group)), dtype=dtype, order="F")
+        for i in range(len(group)):
+            buffer[:, i] = group[i]
+        buffer.flags.writeable = False
+        group[:] = [buffer[:, i] for i in range(len(group))]
+
+    # --- create the DataFrames as views into the buffers
+    all_profiles = dict()
+    for scenario, tables in layouts.items():
+        all_profiles[scenario] = dict()
+        for key, layout in tables.items():
+            columns = dict()
+            for col, group_key, position in layout:
+                columns[col] = groups[group_key][position]
+            all_profiles[scenario][key] = pd.DataFrame(columns, copy=False)
+    return all_profiles
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,209 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import argparse
+import os
+import threading
+from collections import OrderedDict
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from simbench.converter import csv_tablenames
+from simbench.networks.simbench_code import get_simbench_code_and_parameters
+from simbench.networks.extract_simbench_grids_from_csv import (
+    SimBenchDataset,
+    _selected_csv_tablenames,
+    _grid_server_authkey,
+    complete_data_path,
+    default_grid_server_address,
+    get_simbench_net,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+
+class SimBenchGridServer:
+    """Local server which keeps parsed SimBench csv data (and optionally created nets) in memory
+    and answers get_simbench_net() requests of other processes on the same host via a Unix domain
+    socket. Clients request nets by get_simbench_net(..., server=address) which falls back to
+    creating the net locally if no server is running.
+
+    Since requests and nets are transferred as pickles, server and clients authenticate each other
+    by a secret key, which is stored in a folder only accessible by the user who started the
+    server, and the socket file is only accessible by this user.
+
+    INPUT:
+        **address** (str, None) - path of the Unix domain socket. If None,
+        default_grid_server_address() is used.
+
+    OPTIONAL:
+        **preload_scenarios** (iterable, ()) - scenarios of the complete SimBench dataset whose csv
+        tables are read at start. Other datasets are read at the first request.
+
+        **max_cached_nets** (int, 0) - number of created nets which are kept in memory to answer
+        repeated requests without creating the net again.
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> server = sb.SimBenchGridServer(preload_scenarios=[0])
+        >>> server.serve_forever()  # blocks, e.g. in a separate process or thread
+
+        >>> net = sb.get_simbench_net("1-MV-rural--0-sw", server=True)  # in another process
+    """
+
+    def __init__(self, address=None, preload_scenarios=(), max_cached_nets=0):
+        self.address = address if address is not None else default_grid_server_address()
+        self.max_cached_nets = max_cached_nets
+        self._datasets = dict()
+        self._nets = OrderedDict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        for scenario in preload_scenarios:
+            dataset = self.dataset(complete_data_path(scenario))
+            for tablename in csv_tablenames(
+                ["elements", "profiles", "types", "cases", "res_elements"]
+            ):
+                dataset.table(tablename)
+
+    def dataset(self, input_path):
+        """Returns the SimBenchDataset of input_path which is kept by the server."""
+        with self._lock:
+            if input_path not in self._datasets:
+                self._datasets[input_path] = SimBenchDataset(input_path)
+            return self._datasets[input_path]
+
+    def get_simbench_net(
+        self,
+        sb_code_info,
+        input_path=None,
+        generate_no_sw_in_csv=False,
+        include=None,
+        exclude=None,
+        geodata="geojson",
+    ):
+        """Returns the requested net like get_simbench_net() but uses the datasets and nets which
+        are kept in memory by the server. Cached nets are returned without copying and must not be
+        modified."""
+        sb_code, sb_code_parameters = get_simbench_code_and_parameters(sb_code_info)
+        if input_path is None:
+            input_path = complete_data_path(sb_code_parameters[5])
+        key = (
+            sb_code,
+            input_path,
+            generate_no_sw_in_csv,
+            frozenset(_selected_csv_tablenames(include, exclude)),
+            geodata,
+        )
+        with self._lock:
+            if key in self._nets:
+                self._nets.move_to_end(key)
+                return self._nets[key]
+        # the net is created without holding the lock, so that requests are answered in parallel
+        net = get_simbench_net(
+            sb_code,
+            self.dataset(input_path),
+            generate_no_sw_in_csv=generate_no_sw_in_csv,
+            include=include,
+            exclude=exclude,
+            geodata=geodata,
+        )
+        if self.max_cached_nets > 0:
+            with self._lock:
+                self._nets[key] = net
+                self._nets.move_to_end(key)
+                if len(self._nets) > self.max_cached_nets:
+                    self._nets.popitem(last=False)
+        return net
+
+    def _handle_request(self, request):
+        command, args = request[0], request[1:]
+        try:
+            if command == "get_simbench_net":
+                return "ok", self.get_simbench_net(*args)
+            elif command in ["ping", "shutdown"]:
+                return "ok", None
+            raise ValueError("Unknown request '%s' to the SimBench grid server." % command)
+        except Exception as e:
+            return "error", e
+
+    def _serve_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                conn.send(self._handle_request(request))
+                if request[0] == "shutdown":
+                    self.shutdown()
+                    return
+
+    def _is_running(self):
+        try:
+            with Client(self.address, family="AF_UNIX", authkey=_grid_server_authkey()) as conn:
+                conn.send(("ping",))
+                conn.recv()
+        except (OSError, EOFError, ValueError, AuthenticationError):
+            return False
+        return True
+
+    def serve_forever(self):
+        """Answers requests until shutdown() is called or a client requests the shutdown."""
+        if os.path.exists(self.address):
+            if self._is_running():
+                raise ValueError(
+                    "A SimBench grid server is already running at %s." % self.address
+                )
+            os.remove(self.address)  # socket file of a server which was not shut down
+        self._stopped.clear()
+        listener = Listener(self.address, family="AF_UNIX", authkey=_grid_server_authkey())
+        os.chmod(self.address, 0o600)
+        logger.info("SimBench grid server is listening at %s." % self.address)
+        with listener:
+            while not self._stopped.is_set():
+                try:
+                    conn = listener.accept()
+                except (EOFError, AuthenticationError) as e:  # client without the key
+                    logger.warning("A connection to the SimBench grid server was refused: %s" % e)
+                    continue
+                if self._stopped.is_set():
+                    conn.close()
+                    break
+                threading.Thread(
+                    target=self._serve_connection, args=(conn,), daemon=True
+                ).start()
+        logger.info("SimBench grid server at %s is shut down." % self.address)
+
+    def shutdown(self):
+        """Stops serve_forever()."""
+        self._stopped.set()
+        # wake up the listener which waits for the next connection
+        try:
+            Client(self.address, family="AF_UNIX", authkey=_grid_server_authkey()).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Local server which answers get_simbench_net(..., server=address) requests."
+    )
+    parser.add_argument("--address", default=None, help="path of the Unix domain socket")
+    parser.add_argument(
+        "--preload", type=int, nargs="*", default=[], help="scenarios to read at start"
+    )
+    parser.add_argument(
+        "--max-cached-nets", type=int, default=0, help="number of nets kept in memory"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    SimBenchGridServer(
+        args.address,
+        preload_scenarios=args.preload,
+        max_cached_nets=args.max_cached_nets,
+    ).serve_forever()
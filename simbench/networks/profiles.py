@@ -177,9 +177,12 @@ def filter_unapplied_profiles(csv_data):
         logger.debug(
             "These %ss are dropped: " % prof_tab + str(unapplied_profiles)
         )
-        csv_data[prof_tab] = csv_data[prof_tab].drop(
-            unapplied_profiles, axis=1
-        )
+        # deleting the columns of a shallow copy, in contrast to drop(), does not copy the data of
+        # the remaining columns, e.g. of read-only profiles of a SharedSimBenchDataset
+        profiles = csv_data[prof_tab].copy(deep=False)
+        for col in unapplied_profiles:
+            del profiles[col]
+        csv_data[prof_tab] = profiles
 
 
 def filter_unapplied_profiles_pp(net, named_profiles: bool):
@@ -0,0 +1,294 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+from copy import deepcopy
+import numpy as np
+import pandas as pd
+
+try:
+    from pandapower.toolbox.element_selection import element_bus_tuples
+except ImportError:
+    from pandapower import element_bus_tuples
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+_switch_element_tables = {"b": "bus", "l": "line", "t": "trafo", "t3": "trafo3w"}
+
+
+def _is_matchable_by_name(df):
+    """Returns True if the rows of df can be identified by unique names."""
+    return (
+        "name" in df.columns
+        and df.index.is_unique
+        and df.name.notnull().all()
+        and df.name.is_unique
+    )
+
+
+def _values_equal(a, b):
+    """Compares entries of pandapower nets which are no element tables."""
+    if isinstance(a, pd.DataFrame) and isinstance(b, pd.DataFrame):
+        return a.equals(b)
+    elif isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_values_equal(a[key], b[key]) for key in a)
+    elif isinstance(a, (pd.DataFrame, dict)) or isinstance(b, (pd.DataFrame, dict)):
+        return False
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def _translate_references(df, element, index_maps):
+    """Returns df with bus and element indices of the base net translated into the indices of the
+    target net, as far as index_maps includes the referenced element tables."""
+    df = df.copy()
+    for elm, col in element_bus_tuples():
+        if elm == element and "bus" in index_maps and col in df.columns:
+            df[col] = df[col].map(index_maps["bus"])
+    if element in ["switch", "measurement"]:
+        et_col = "et" if element == "switch" else "element_type"
+        for et, elements in df.groupby(et_col).groups.items():
+            et = _switch_element_tables.get(et, et) if element == "switch" else et
+            if et in index_maps:
+                df.loc[elements, "element"] = df.loc[elements, "element"].map(index_maps[et])
+    return df
+
+
+def _index_maps(table_diffs):
+    """Returns a dict of Series, which map the indices of the base net to the indices of the
+    target net, for all element tables of the diff."""
+    maps = dict()
+    for element, table_diff in table_diffs.items():
+        matched = table_diff["base_index"] >= 0
+        maps[element] = pd.Series(
+            table_diff["index"][matched], index=table_diff["base_index"][matched]
+        )
+    return maps
+
+
+def _base_index(base_df, df):
+    """Returns the indices of the rows of base_df with the names of the rows of df, -1 for rows of
+    df which are not in base_df."""
+    return (
+        pd.Series(base_df.index, index=base_df.name.values)
+        .reindex(df.name.values)
+        .fillna(-1)
+        .astype(np.int64)
+        .values
+    )
+
+
+def _table_diff(base_df, df, element, index_maps, base_index):
+    matched = base_index >= 0
+    translated = _translate_references(base_df, element, index_maps)
+    base_rows = translated.loc[base_index[matched]].set_axis(df.index[matched])
+    rows = df.loc[matched]
+
+    changed_mask = pd.DataFrame(False, index=rows.index, columns=rows.columns)
+    for col in rows.columns:
+        if col not in base_rows.columns:
+            changed_mask[col] = True
+        else:
+            changed_mask[col] = ~(
+                base_rows[col].eq(rows[col]) | (base_rows[col].isnull() & rows[col].isnull())
+            )
+    changed_rows = changed_mask.any(axis=1)
+    changed_cols = changed_mask.any(axis=0)
+    return {
+        "index": df.index.values,
+        "base_index": base_index,
+        "added": df.loc[~matched],
+        "changed": rows.loc[changed_rows, changed_cols.index[changed_cols]],
+        "template": df.iloc[:0],
+    }
+
+
+def _apply_table_diff(base_df, table_diff, element, index_maps):
+    matched = table_diff["base_index"] >= 0
+    template = table_diff["template"]
+    translated = _translate_references(base_df, element, index_maps)
+    df = translated.loc[table_diff["base_index"][matched]].set_axis(
+        table_diff["index"][matched]
+    )
+    df = df.reindex(columns=template.columns)
+    if table_diff["added"].shape[0]:
+        df = pd.concat([df.astype(object), table_diff["added"].astype(object)])
+    changed = table_diff["changed"]
+    for col in changed.columns:
+        if df[col].dtype != changed[col].dtype:
+            df[col] = df[col].astype(object)
+        df.loc[changed.index, col] = changed[col]
+    return df.loc[table_diff["index"]].astype(template.dtypes.to_dict())
+
+
+def _is_result_table(key):
+    return key.startswith("res_")
+
+
+def _copy_net_for_diff(net, diff):
+    """Returns a copy of net to which diff can be applied without changing net. Only the entries
+    touched by the diff are copied: the tables of the diff are created anew anyway and the profiles
+    dict is copied shallowly if profiles change. All other entries are shared with net."""
+    net_copy = net.__class__.__new__(net.__class__)
+    net_copy._setattr("_allow_invalid_attributes", net._allow_invalid_attributes)
+    for key, value in net.items():
+        net_copy[key] = value
+    if diff["profiles"] or diff["removed_profiles"]:
+        net_copy["profiles"] = dict(net["profiles"])
+    return net_copy
+
+
+def _profiles_diff(base_profiles, profiles):
+    diff = dict()
+    for key, df in profiles.items():
+        base_df = base_profiles.get(key)
+        if not isinstance(base_df, pd.DataFrame) or not base_df.index.equals(df.index):
+            diff[key] = {"columns": list(df.columns), "changed": df}
+            continue
+        changed = list()
+        for col in df.columns:
+            if col not in base_df.columns or base_df[col].dtype != df[col].dtype:
+                changed.append(col)
+            elif df[col].dtype.kind == "f":
+                if not np.array_equal(base_df[col].values, df[col].values, equal_nan=True):
+                    changed.append(col)
+            elif not base_df[col].equals(df[col]):
+                changed.append(col)
+        if changed or list(df.columns) != list(base_df.columns):
+            diff[key] = {"columns": list(df.columns), "changed": df[changed]}
+    return diff, [key for key in base_profiles.keys() if key not in profiles.keys()]
+
+
+def get_scenario_diff(base_net, net):
+    """Returns the difference between two SimBench nets, e.g. the nets of scenario 0 and scenario
+    1 of the same grid, as compact dict. Elements are identified by their names, which are unique
+    within the element tables of SimBench nets. Thus, only added elements and changed values are
+    stored, even if the element indices differ between the nets. Profiles are compared column-wise.
+    Result tables (res_*) are not part of the diff.
+    apply_scenario_diff() creates 'net' out of 'base_net' and the diff.
+
+    INPUT:
+        **base_net** (pandapowerNet) - net to which the diff should be applied
+
+        **net** (pandapowerNet) - net which should be created by applying the diff
+
+    OUTPUT:
+        **diff** (dict) - difference between the nets; it can be stored, e.g. via pandas.to_pickle()
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> net0 = sb.get_simbench_net("1-MV-rural--0-sw")
+        >>> diff = sb.get_scenario_diff(net0, sb.get_simbench_net("1-MV-rural--1-sw"))
+        >>> net1 = sb.apply_scenario_diff(net0, diff)
+    """
+    table_diffs = dict()
+    unchanged = list()
+    for key, df in net.items():
+        if _is_result_table(key):
+            continue
+        elif (
+            isinstance(df, pd.DataFrame)
+            and isinstance(base_net.get(key), pd.DataFrame)
+            and _is_matchable_by_name(df)
+            and _is_matchable_by_name(base_net[key])
+        ):
+            if base_net[key].equals(df):
+                unchanged.append(key)
+                continue
+            # index and base_index of all tables are needed to determine index_maps
+            table_diffs[key] = {
+                "index": df.index.values,
+                "base_index": _base_index(base_net[key], df),
+            }
+    index_maps = _index_maps(table_diffs)
+    for key, table_diff in table_diffs.items():
+        table_diffs[key] = _table_diff(
+            base_net[key], net[key], key, index_maps, table_diff["base_index"]
+        )
+
+    replaced = dict()
+    profiles = dict()
+    removed_profiles = list()
+    for key, value in net.items():
+        if (
+            key in table_diffs.keys()
+            or key in unchanged
+            or key.startswith("_")
+            or _is_result_table(key)
+        ):
+            continue
+        elif key == "profiles" and isinstance(base_net.get(key), dict):
+            profiles, removed_profiles = _profiles_diff(base_net[key], value)
+        elif key not in base_net.keys() or not _values_equal(base_net[key], value):
+            replaced[key] = deepcopy(value)
+    return {
+        "tables": table_diffs,
+        "replaced": replaced,
+        "removed": [
+            key for key in base_net.keys() if key not in net.keys() and not _is_result_table(key)
+        ],
+        "profiles": profiles,
+        "removed_profiles": removed_profiles,
+    }
+
+
+def apply_scenario_diff(base_net, diff, inplace=False):
+    """Returns the net which is created by applying a diff of get_scenario_diff() to base_net.
+    This is much faster than getting the net of another scenario via get_simbench_net().
+    Since the diff includes no results, the result tables (res_*) of the returned net are empty.
+
+    INPUT:
+        **base_net** (pandapowerNet) - net to which the diff should be applied, i.e. the first net
+        given to get_scenario_diff()
+
+        **diff** (dict) - result of get_scenario_diff()
+
+    OPTIONAL:
+        **inplace** (bool, False) - if True, base_net is changed and returned. Otherwise, only the
+        entries of base_net which are changed by the diff are copied and all other entries, e.g.
+        unchanged element tables, are shared between base_net and the returned net. Thus, such
+        entries must not be changed inplace, unless the returned net is copied by deepcopy().
+
+    OUTPUT:
+        **net** (pandapowerNet) - net which equals the second net given to get_scenario_diff()
+    """
+    net = base_net if inplace else _copy_net_for_diff(base_net, diff)
+    index_maps = _index_maps(diff["tables"])
+    tables = {
+        key: _apply_table_diff(net[key], table_diff, key, index_maps)
+        for key, table_diff in diff["tables"].items()
+    }
+    for key, df in tables.items():
+        net[key] = df
+    for key in diff["removed"]:
+        del net[key]
+    for key, value in diff["replaced"].items():
+        net[key] = deepcopy(value)
+    for key, value in list(net.items()):
+        if _is_result_table(key) and isinstance(value, pd.DataFrame) and value.shape[0]:
+            net[key] = value.iloc[:0].copy()
+
+    if diff["profiles"] or diff["removed_profiles"]:
+        for key in diff["removed_profiles"]:
+            del net["profiles"][key]
+        for key, profile_diff in diff["profiles"].items():
+            base_df = net["profiles"].get(key)
+            changed = profile_diff["changed"]
+            if base_df is None or not base_df.index.equals(changed.index):
+                df = changed.copy()
+            else:
+                df = pd.concat(
+                    [
+                        base_df[[col for col in base_df.columns if col not in changed.columns]],
+                        changed,
+                    ],
+                    axis=1,
+                )
+            net["profiles"][key] = df[profile_diff["columns"]]
+    return net
@@ -0,0 +1,245 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import gc
+import pickle
+import threading
+from multiprocessing import shared_memory, util
+
+import numpy as np
+import pandas as pd
+
+from simbench.converter import csv_tablenames
+from simbench.networks.extract_simbench_grids_from_csv import SimBenchDataset
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+_ALIGNMENT = 64
+
+# datasets which are attached in this process, indexed by the name of the shared memory block
+_attached_shared_datasets = dict()
+_attached_shared_datasets_lock = threading.Lock()
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _open_shared_memory(name):
+    """Attaches to an existing shared memory block without registering it at the resource tracker,
+    if possible (python >= 3.13), since the block is owned by the publishing process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _table_layout(df, offset):
+    """Returns the layout of a DataFrame in the shared memory block, starting at 'offset', and
+    the list of (offset, bytes) to write into the block. Numeric and boolean columns are stored
+    as raw arrays, all other columns and the index are pickled together."""
+    buffer_columns = dict()
+    object_columns = dict()
+    to_write = list()
+    for col in df.columns:
+        values = df[col].values
+        if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+            values = np.ascontiguousarray(values)
+            offset = _aligned(offset)
+            buffer_columns[col] = (values.dtype.str, offset)
+            to_write.append((offset, values))
+            offset += values.nbytes
+        else:
+            object_columns[col] = df[col].values
+    pickled = pickle.dumps((df.index, object_columns), protocol=pickle.HIGHEST_PROTOCOL)
+    offset = _aligned(offset)
+    to_write.append((offset, np.frombuffer(pickled, dtype=np.uint8)))
+    layout = (list(df.columns), df.shape[0], buffer_columns, (offset, len(pickled)))
+    return layout, to_write, offset + len(pickled)
+
+
+def _table_from_buffer(buf, layout):
+    """Returns the DataFrame which is described by 'layout'. The numeric columns are read-only
+    views on 'buf', the other columns are read-only as well."""
+    columns, n_rows, buffer_columns, (pickle_offset, pickle_size) = layout
+    index, object_columns = pickle.loads(buf[pickle_offset : pickle_offset + pickle_size])
+    data = dict()
+    for col in columns:
+        if col in buffer_columns:
+            dtype, offset = buffer_columns[col]
+            values = np.frombuffer(buf, dtype=dtype, count=n_rows, offset=offset)
+            values.flags.writeable = False
+            data[col] = values
+        else:
+            values = object_columns[col]
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False  # shared by all tables of this process
+            data[col] = values
+    return pd.DataFrame(data, index=index, columns=columns, copy=False)
+
+
+class SharedSimBenchDataset(SimBenchDataset):
+    """SimBenchDataset whose csv tables are published once into a block of shared memory
+    (multiprocessing.shared_memory), to be used by worker processes, e.g. of a
+    concurrent.futures.ProcessPoolExecutor, without that every worker reads and holds its own copy
+    of the dataset.
+
+    Numeric columns, i.e. nearly all data of the profiles, are attached as read-only arrays without
+    copying. Columns of other dtypes, e.g. ids and subnet names, are pickled into the block and
+    unpickled once per process.
+    Since the conversion does not change profiles, get_simbench_net() does not copy the profile
+    tables of a SharedSimBenchDataset: the profiles of the nets are read-only views on the shared
+    memory block and must be copied before they are modified.
+    A SharedSimBenchDataset can be passed to worker processes directly: unpickling it attaches the
+    shared memory block, once per process. Thus, it can be given as 'input_path' to
+    get_simbench_net() in the workers.
+
+    The publishing process owns the shared memory block and must close() and unlink() it when all
+    workers are finished, which is done by using the dataset as context manager.
+
+    INPUT:
+        **path** (str or SimBenchDataset) - path to folder with csv data files or a dataset whose
+        already read tables are reused
+
+    OPTIONAL:
+        **sep** (str, ";") - csv seperator
+
+        **tablenames** (list, None) - csv tables to publish. If None, all csv tables are published.
+        Other tables are read from csv files by the processes which request them.
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> codes = ["1-LV-rural1--0-sw", "1-MV-rural--0-sw"]
+        >>> with sb.SharedSimBenchDataset(sb.complete_data_path(0)) as dataset:
+        ...     with ProcessPoolExecutor(2) as executor:
+        ...         nets = list(executor.map(sb.get_simbench_net, codes, [dataset] * len(codes)))
+    """
+
+    def __init__(self, path, sep=";", tablenames=None):
+        source = (
+            path if isinstance(path, SimBenchDataset) else SimBenchDataset(path, sep=sep)
+        )
+        self._shm = None
+        self._shared_tables = dict()
+        super().__init__(source.path, sep=source.sep)
+        if tablenames is None:
+            tablenames = csv_tablenames(
+                ["elements", "profiles", "types", "cases", "res_elements"]
+            )
+
+        # --- determine the layout of all tables in the shared memory block
+        layout = dict()
+        to_write = list()
+        size = 0
+        for tablename in tablenames:
+            layout[tablename], table_to_write, size = _table_layout(
+                source.table(tablename), size
+            )
+            to_write += table_to_write
+
+        # --- write the tables into the shared memory block
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for offset, values in to_write:
+            shm.buf[offset : offset + values.nbytes] = values.view(np.uint8).ravel()
+        del to_write
+
+        self._is_owner = True
+        self._attach(shm, layout)
+        _attached_shared_datasets[shm.name] = self
+
+    @classmethod
+    def attach(cls, name, layout, path, sep=";"):
+        """Returns the SharedSimBenchDataset of the shared memory block 'name' which is already
+        attached in this process or attaches it. Usually, this is not called directly but by
+        unpickling a SharedSimBenchDataset."""
+        with _attached_shared_datasets_lock:
+            if name in _attached_shared_datasets:
+                return _attached_shared_datasets[name]
+            dataset = cls.__new__(cls)
+            dataset._shm = None
+            dataset._shared_tables = dict()
+            SimBenchDataset.__init__(dataset, path, sep=sep)
+            dataset._is_owner = False
+            dataset._attach(_open_shared_memory(name), layout)
+            _attached_shared_datasets[name] = dataset
+        # detach before the interpreter shutdown, when the tables can still be dropped
+        util.Finalize(dataset, dataset.close, exitpriority=10)
+        return dataset
+
+    def _attach(self, shm, layout):
+        self._shm = shm
+        self._layout = layout
+        self._shared_tables = {
+            tablename: _table_from_buffer(shm.buf, table_layout)
+            for tablename, table_layout in layout.items()
+        }
+        self.clear()
+
+    def __reduce__(self):
+        return (
+            _attach_shared_simbench_dataset,
+            (self.name, self._layout, self.path, self.sep),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        if self._is_owner:
+            self.unlink()
+
+    @property
+    def name(self):
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    def is_read_only(self, tablename):
+        """Returns True if the csv table 'tablename' is published in shared memory."""
+        return tablename in self._shared_tables
+
+    def clear(self):
+        """Drops all derived data and all tables which are not published in shared memory."""
+        super().clear()
+        self._tables.update(self._shared_tables)
+
+    def close(self):
+        """Detaches the shared memory block in this process. All tables of the dataset must not be
+        referenced anymore."""
+        if self._shm is None:
+            return
+        self._shared_tables = dict()
+        self.clear()
+        _attached_shared_datasets.pop(self._shm.name, None)
+        try:
+            self._shm.close()
+        except BufferError:
+            gc.collect()  # tables in reference cycles
+        try:
+            self._shm.close()
+        except BufferError:
+            logger.warning(
+                "The shared memory block %s is still referenced by tables of " % self._shm.name
+                + "the dataset. It is detached when these tables are deleted."
+            )
+        if not self._is_owner:
+            self._shm = None
+
+    def unlink(self):
+        """Frees the shared memory block. This should be done once by the publishing process when
+        all workers are finished."""
+        if not self._is_owner:
+            raise ValueError("Only the publishing process can unlink the shared memory block.")
+        if self._shm is not None:
+            self._shm.unlink()
+            self._shm = None
+
+
+def _attach_shared_simbench_dataset(name, layout, path, sep):
+    return SharedSimBenchDataset.attach(name, layout, path, sep=sep)
@@ -0,0 +1,269 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+
+from simbench import csv_tablenames
+from simbench.networks.extract_simbench_grids_from_csv import (
+    _ensure_simbench_dataset,
+    _extracted_csv_data2pp,
+)
+from simbench.networks.subnet_extraction import _grid_level
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+# coordinate indices of SimBenchDatasets, built at the first request
+_coordinate_indices = weakref.WeakKeyDictionary()
+_coordinate_indices_lock = threading.Lock()
+
+
+class CoordinateIndex:
+    """Grid-bucket spatial index over points, e.g. the x and y columns of the Coordinates table.
+    The points are sorted into a regular grid of buckets with about 'bucket_size' points each, so
+    that queries only check the points of the buckets which overlap the queried area.
+
+    INPUT:
+        **x** (array-like) - x values of the points
+
+        **y** (array-like) - y values of the points
+
+    OPTIONAL:
+        **ids** (array-like, None) - ids of the points which are returned by the queries. If None,
+        the positions of the points are returned.
+
+        **bucket_size** (int, 16) - average number of points per bucket
+    """
+
+    def __init__(self, x, y, ids=None, bucket_size=16):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.ids = np.arange(len(x)) if ids is None else np.asarray(ids)
+        valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        self.x = x
+        self.y = y
+
+        if len(valid):
+            self.x_min, self.x_max = x[valid].min(), x[valid].max()
+            self.y_min, self.y_max = y[valid].min(), y[valid].max()
+        else:
+            self.x_min = self.x_max = self.y_min = self.y_max = 0.0
+        width = self.x_max - self.x_min
+        height = self.y_max - self.y_min
+        n_buckets = max(len(valid) / bucket_size, 1.0)
+        if width > 0 and height > 0:
+            self.cell_size = np.sqrt(width * height / n_buckets)
+        else:
+            self.cell_size = max(width, height) / n_buckets or 1.0
+        self.nx = max(int(np.ceil(width / self.cell_size)), 1)
+        self.ny = max(int(np.ceil(height / self.cell_size)), 1)
+
+        # --- sort the points by bucket; bucket k holds order[starts[k]:starts[k+1]]
+        ix, iy = self._cells(x[valid], y[valid])
+        keys = iy * self.nx + ix
+        sort = np.argsort(keys, kind="stable")
+        self.order = valid[sort]
+        self.starts = np.searchsorted(keys[sort], np.arange(self.nx * self.ny + 1))
+
+    def __len__(self):
+        return len(self.order)
+
+    def _cells(self, x, y):
+        ix = np.clip(((x - self.x_min) // self.cell_size).astype(np.int64), 0, self.nx - 1)
+        iy = np.clip(((y - self.y_min) // self.cell_size).astype(np.int64), 0, self.ny - 1)
+        return ix, iy
+
+    def _candidates(self, x_min, y_min, x_max, y_max):
+        """Returns the positions of all points in the buckets which overlap the bounding box."""
+        if (
+            x_max < self.x_min
+            or y_max < self.y_min
+            or x_min > self.x_max
+            or y_min > self.y_max
+            or not len(self)
+        ):
+            return np.array([], dtype=np.int64)
+        (ix0, ix1), (iy0, iy1) = self._cells(
+            np.array([x_min, x_max]), np.array([y_min, y_max])
+        )
+        # the buckets of one row of the grid are contiguous in self.order
+        return np.concatenate(
+            [
+                self.order[self.starts[iy * self.nx + ix0] : self.starts[iy * self.nx + ix1 + 1]]
+                for iy in range(iy0, iy1 + 1)
+            ]
+        )
+
+    def query_bbox(self, x_min, y_min, x_max, y_max):
+        """Returns the ids of all points within the bounding box (borders included)."""
+        pos = self._candidates(x_min, y_min, x_max, y_max)
+        x, y = self.x[pos], self.y[pos]
+        pos = pos[(x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)]
+        return self.ids[np.sort(pos)]
+
+    def query_polygon(self, polygon):
+        """Returns the ids of all points within the polygon, given as sequence of (x, y) vertices
+        or as object with 'exterior.coords', e.g. a shapely Polygon."""
+        if hasattr(polygon, "exterior"):
+            polygon = polygon.exterior.coords
+        polygon = np.asarray(polygon, dtype=float)
+        pos = self._candidates(*polygon.min(axis=0), *polygon.max(axis=0))
+        x, y = self.x[pos], self.y[pos]
+
+        # --- even-odd rule: count the crossings of a ray from each point with the polygon edges
+        inside = np.zeros(len(pos), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for (x1, y1), (x2, y2) in zip(polygon, np.roll(polygon, 1, axis=0)):
+                inside ^= ((y1 > y) != (y2 > y)) & (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
+        return self.ids[np.sort(pos[inside])]
+
+    def query(self, area):
+        """Returns the ids of all points within 'area' which is either a bounding box
+        (x_min, y_min, x_max, y_max) or a polygon, see query_polygon()."""
+        if not hasattr(area, "exterior") and np.shape(area) == (4,):
+            return self.query_bbox(*area)
+        return self.query_polygon(area)
+
+
+def get_coordinate_index(input_path):
+    """Returns the CoordinateIndex of the Coordinates table of a SimBench dataset. For
+    SimBenchDatasets, the index is built once and kept.
+
+    INPUT:
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+    """
+    dataset = _ensure_simbench_dataset(input_path)
+    with _coordinate_indices_lock:
+        if dataset not in _coordinate_indices:
+            coordinates = dataset.table("Coordinates")
+            _coordinate_indices[dataset] = CoordinateIndex(
+                coordinates.x.values, coordinates.y.values, ids=coordinates.id.values
+            )
+        return _coordinate_indices[dataset]
+
+
+def _node_cols(csv_table):
+    return [
+        col for col in ["node", "nodeA", "nodeB", "nodeHV", "nodeMV", "nodeLV"]
+        if col in csv_table.columns
+    ]
+
+
+def get_extracted_csv_data_by_area(area, input_path):
+    """Returns the csv data of all nodes within a geographic area, together with all branches
+    whose nodes are all within the area and the elements connected to these nodes. Auxiliary nodes
+    of branches which are cut at the border of the area are dropped with their switches, as well
+    as equivalent elements between grids which both have nodes within the area. Measurements are
+    kept if their node and branch are kept. Profiles, types and study cases are not filtered.
+
+    INPUT:
+        **area** (tuple or polygon) - bounding box (x_min, y_min, x_max, y_max) or polygon as
+        sequence of (x, y) vertices or shapely Polygon
+
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> dataset = sb.SimBenchDataset(sb.complete_data_path(0))
+        >>> csv_data = sb.get_extracted_csv_data_by_area((9.9, 53.5, 10.1, 53.6), dataset)
+    """
+    dataset = _ensure_simbench_dataset(input_path)
+    coord_ids = get_coordinate_index(dataset).query(area)
+    node = dataset.table("Node")
+    nodes = set(node.id[node.coordID.isin(coord_ids)])
+
+    csv_data = dict()
+    for tablename in csv_tablenames("elements"):
+        csv_table = dataset.table(tablename)
+        if tablename == "Node":
+            keep = csv_table.id.isin(nodes)
+        elif tablename == "Coordinates":
+            keep = csv_table.id.isin(coord_ids)
+        elif tablename in ["Measurement", "Substation"]:
+            continue  # depend on other tables
+        else:
+            keep = pd.Series(True, index=csv_table.index)
+            for col in _node_cols(csv_table):
+                keep &= csv_table[col].isin(nodes)
+        csv_data[tablename] = csv_table.loc[keep].copy()
+
+    # --- drop auxiliary nodes (and their switches) of branches which are cut at the border
+    referenced = set()
+    for tablename, csv_table in csv_data.items():
+        if tablename not in ["Node", "Switch"]:
+            for col in _node_cols(csv_table):
+                referenced |= set(csv_table[col])
+    csv_node = csv_data["Node"]
+    csv_data["Node"] = csv_node.loc[
+        (csv_node.type != "auxiliary") | csv_node.id.isin(referenced)
+    ]
+    nodes = set(csv_data["Node"].id)
+    switch = csv_data["Switch"]
+    csv_data["Switch"] = switch.loc[switch.nodeA.isin(nodes) & switch.nodeB.isin(nodes)]
+
+    # --- drop equivalents of connections between grids which are both within the area
+    grids = {
+        subnet for subnet in csv_data["Node"].subnet.str.split("_").str[0].dropna()
+        if _grid_level(subnet) is not None
+    }
+    for tablename, csv_table in csv_data.items():
+        if "subnet" not in csv_table.columns or not csv_table.shape[0]:
+            continue
+        subnet = csv_table.subnet.astype(str)
+        subnet_split = subnet.str.split("_")
+        is_internal_eq = (
+            subnet.str.endswith("_eq")
+            & subnet_split.str[0].isin(grids)
+            & subnet_split.str[1].isin(grids)
+        )
+        csv_data[tablename] = csv_table.loc[~is_internal_eq]
+
+    measurement = dataset.table("Measurement")
+    branches = set()
+    for tablename in ["Line", "Transformer", "Transformer3W"]:
+        branches |= set(csv_data[tablename].id)
+    csv_data["Measurement"] = measurement.loc[
+        measurement.element1.isin(nodes)
+        & (measurement.element2.isnull() | measurement.element2.isin(branches))
+    ].copy()
+
+    substations = set()
+    for tablename in ["Node", "Switch", "Transformer", "Transformer3W"]:
+        substations |= set(csv_data[tablename].substation.dropna())
+    substation = dataset.table("Substation")
+    csv_data["Substation"] = substation.loc[substation.id.isin(substations)].copy()
+
+    for tablename in csv_tablenames(["profiles", "types", "cases"]):
+        csv_data[tablename] = dataset.table(tablename).copy()
+    return csv_data
+
+
+def get_simbench_net_by_area(area, input_path, sw=True, generate_no_sw_in_csv=False):
+    """Returns the pandapower net of all nodes, branches and elements within a geographic area,
+    see get_extracted_csv_data_by_area(). Since grids are cut at the border of the area, the net
+    may lack an external grid.
+
+    INPUT:
+        **area** (tuple or polygon) - bounding box (x_min, y_min, x_max, y_max) or polygon as
+        sequence of (x, y) vertices or shapely Polygon
+
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+
+    OPTIONAL:
+        **sw** (bool, True) - if False, the variant without switches is created as for SimBench
+        codes ending with "no_sw"
+
+        **generate_no_sw_in_csv** (bool, False) - see get_simbench_net()
+    """
+    csv_data = get_extracted_csv_data_by_area(area, input_path)
+    return _extracted_csv_data2pp(csv_data, sw, generate_no_sw_in_csv=generate_no_sw_in_csv)
@@ -0,0 +1,168 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import re
+
+from simbench import (
+    csv_tablenames,
+    ensure_iterability,
+    convert_voltlvl_to_str,
+)
+from simbench.networks.extract_simbench_grids_from_csv import (
+    _ensure_simbench_dataset,
+    _extracted_csv_data2pp,
+    get_extracted_csv_data,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+__author__ = "smeinecke"
+
+_grid_pattern = re.compile(r"^(EHV|HV|MV|LV)\d")
+
+
+def _grid_level(subnet):
+    """Returns the voltage level of a grid name, e.g. 'MV' for 'MV1.101', or None."""
+    match = _grid_pattern.match(subnet)
+    return match.group(1) if match else None
+
+
+def _grid_subnets(dataset):
+    """Returns the set of all grid names which nodes exist in the dataset."""
+    first = dataset.subnet_split("Node")[0].dropna().unique()
+    return {subnet for subnet in first if _grid_level(subnet) is not None}
+
+
+def get_subnet_graph(input_path):
+    """Returns the connections between the grids of the dataset as dict of sets, e.g.
+    {'MV1.101': {'HV1', 'LV1.101', ...}, ...}. Two grids are connected if any element has a subnet
+    joining both grid names, e.g. 'HV1_MV1.101' or 'MV1.101_LV1.101_eq'. Only grids with nodes in
+    the dataset are considered.
+
+    INPUT:
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+    """
+    dataset = _ensure_simbench_dataset(input_path)
+    grids = _grid_subnets(dataset)
+    graph = {grid: set() for grid in grids}
+    for tablename in csv_tablenames("elements"):
+        csv_table = dataset.table(tablename)
+        if not csv_table.shape[0] or "subnet" not in csv_table.columns:
+            continue
+        subnet_split = dataset.subnet_split(tablename)
+        if 1 not in subnet_split.columns:
+            continue
+        pairs = subnet_split[[0, 1]].dropna().drop_duplicates()
+        pairs = pairs.loc[pairs[0].isin(grids) & pairs[1].isin(grids) & (pairs[0] != pairs[1])]
+        for grid0, grid1 in pairs.itertuples(index=False):
+            graph[grid0].add(grid1)
+            graph[grid1].add(grid0)
+    return graph
+
+
+def get_subnets_of_nodes(nodes, input_path, depth=None, voltage_levels=None):
+    """Returns the sorted list of grid names (subnets) which include the given nodes and the grids
+    which are connected to them, e.g. to extract everything behind a substation via
+    get_extracted_csv_data_by_subnets() or get_simbench_net_by_subnets().
+
+    INPUT:
+        **nodes** (str or list of str) - ids of the seed nodes
+
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+
+    OPTIONAL:
+        **depth** (int, None) - number of grid connections (transformations) which are passed
+        starting from the grids of the nodes. If None, all connected grids are considered.
+
+        **voltage_levels** (list, None) - voltage levels, e.g. ["MV", "LV"] or [5, 7], of the
+        grids which may be included. The search does not pass grids of other voltage levels. If
+        None, all voltage levels are allowed.
+
+    EXAMPLE:
+        >>> import simbench as sb
+        >>> dataset = sb.SimBenchDataset(sb.complete_data_path(0))
+        >>> subnets = sb.get_subnets_of_nodes("MV1.101 Bus 4", dataset, voltage_levels=["MV", "LV"])
+        >>> net = sb.get_simbench_net_by_subnets(subnets, dataset)
+    """
+    dataset = _ensure_simbench_dataset(input_path)
+    graph = get_subnet_graph(dataset)
+    if voltage_levels is not None:
+        voltage_levels = {convert_voltlvl_to_str(lvl) for lvl in voltage_levels}
+
+    # --- determine the grids of the nodes
+    node = dataset.table("Node")
+    nodes = list(ensure_iterability(nodes))
+    missing = set(nodes) - set(node.id)
+    if len(missing):
+        raise ValueError("These nodes are not in the dataset: " + str(sorted(missing)))
+    seeds = set()
+    for subnet, volt_lvl in node.loc[node.id.isin(nodes), ["subnet", "voltLvl"]].itertuples(
+        index=False
+    ):
+        candidates = [grid for grid in str(subnet).split("_") if grid in graph.keys()]
+        matching_level = [
+            grid for grid in candidates
+            if _grid_level(grid) == convert_voltlvl_to_str(volt_lvl)
+        ]
+        seeds |= set(matching_level[:1] or candidates[:1])
+    if voltage_levels is not None:
+        seeds = {grid for grid in seeds if _grid_level(grid) in voltage_levels}
+
+    # --- breadth-first search through the grid connections
+    subnets = set(seeds)
+    front = seeds
+    step = 0
+    while len(front) and (depth is None or step < depth):
+        front = {
+            neighbor for grid in front for neighbor in graph[grid]
+            if neighbor not in subnets
+            and (voltage_levels is None or _grid_level(neighbor) in voltage_levels)
+        }
+        subnets |= front
+        step += 1
+    return sorted(subnets)
+
+
+def get_extracted_csv_data_by_subnets(subnets, input_path):
+    """Returns the csv data of an arbitrary set of SimBench grids, e.g. one MV grid and three of
+    its LV grids. The same boundary rules apply as for the extraction of SimBench codes: the
+    equivalent elements between two of the given grids are dropped while the equivalents of
+    connections to other grids are kept.
+
+    INPUT:
+        **subnets** (str or list of str) - grid names, e.g. ["MV1.101", "LV1.101", "LV1.102"]
+
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files
+    """
+    dataset = _ensure_simbench_dataset(input_path)
+    subnets = list(ensure_iterability(subnets))
+    unknown = set(subnets) - _grid_subnets(dataset)
+    if len(unknown):
+        logger.warning("These subnets are not in the dataset: " + str(sorted(unknown)))
+    return get_extracted_csv_data((subnets, subnets), dataset)
+
+
+def get_simbench_net_by_subnets(subnets, input_path, sw=True, generate_no_sw_in_csv=False):
+    """Returns the pandapower net of an arbitrary set of SimBench grids, see
+    get_extracted_csv_data_by_subnets().
+
+    INPUT:
+        **subnets** (str or list of str) - grid names, e.g. ["MV1.101", "LV1.101", "LV1.102"]
+
+        **input_path** (str or SimBenchDataset) - path to the simbench grid csv files or a
+        SimBenchDataset of these files, e.g. sb.complete_data_path(0)
+
+    OPTIONAL:
+        **sw** (bool, True) - if False, the variant without switches is created as for SimBench
+        codes ending with "no_sw"
+
+        **generate_no_sw_in_csv** (bool, False) - see get_simbench_net()
+    """
+    csv_data = get_extracted_csv_data_by_subnets(subnets, input_path)
+    return _extracted_csv_data2pp(csv_data, sw, generate_no_sw_in_csv=generate_no_sw_in_csv)
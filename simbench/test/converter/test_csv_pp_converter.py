@@ -4,6 +4,8 @@
 
 import pytest
 import os
+import shutil
+import warnings
 from copy import deepcopy
 from packaging import version
 import numpy as np
@@ -14,18 +16,28 @@ from pandapower.networks import example_simple
 from simbench import sb_dir
 from simbench.converter import (
     csv2pp,
+    csv2pp_many,
+    pp2csv_many,
+    IncrementalCsvExporter,
     csv_data2pp,
     pp2csv,
     pp2csv_data,
     convert_parallel_branches,
     read_csv_data,
+    get_columns,
+    get_conversion_plan,
+    record_stages,
+    conversion_stage,
     ensure_full_column_data_existence,
     avoid_duplicates_in_column,
     merge_busbar_coordinates,
+    materialize_bus_geo,
     to_numeric_ignored_errors,
     repl_nans_in_obj_cols_to_empty_str,
 )
 
+from simbench.converter.csv_pp_converter import _build_output_table
+
 try:
     from pandapower.toolbox.comparison import dataframes_equal, nets_equal
     from pandapower.toolbox.grid_modification import drop_buses
@@ -259,6 +271,355 @@ def test_test_network():
     assert all_eq
 
 
+def test_csv_data2pp_without_copy():
+    csv_data = read_csv_data(test_network_path, ";")
+    net = csv_data2pp(csv_data)
+
+    # --- with copy, csv_data is not changed
+    csv_data_orig = read_csv_data(test_network_path, ";")
+    assert csv_data.keys() == csv_data_orig.keys()
+    for tablename, df in csv_data_orig.items():
+        assert csv_data[tablename].equals(df)
+
+    # --- without copy, csv_data is consumed but the net is the same
+    net_without_copy = csv_data2pp(csv_data, copy=False)
+    assert csv_data.keys() == csv_data_orig.keys()
+    assert nets_equal(net, net_without_copy, check_only_results=False)
+
+
+def test_conversion_plan(monkeypatch):
+    plan = get_conversion_plan()
+    assert get_conversion_plan() is plan
+    assert ("in_service", True) in plan.fix_values[True]
+    assert ("dVa", 0.0) in plan.fix_values[False]
+
+    # --- returned correspondings and columns can be changed without changing the plan
+    plan.correspondings(str, True).clear()
+    assert len(plan.correspondings(str, True))
+    get_columns("Node").clear()
+    assert len(get_columns("Node"))
+
+    # --- the conversions only create the nets they return
+    n_created_nets = [0]
+    create_empty_network = pp.create_empty_network
+
+    def counting_create_empty_network(*args, **kwargs):
+        n_created_nets[0] += 1
+        return create_empty_network(*args, **kwargs)
+
+    monkeypatch.setattr(pp, "create_empty_network", counting_create_empty_network)
+    net = csv2pp(test_network_path, ";")
+    assert n_created_nets[0] == 1
+    pp2csv_data(net)
+    assert n_created_nets[0] == 1
+
+
+def test_csv_types_to_pp():
+    csv_data = read_csv_data(test_network_path, ";")
+    net = csv_data2pp(csv_data)
+    for element, type_table in [
+        ("line", "LineType"), ("trafo", "TransformerType"), ("trafo3w", "Transformer3WType")
+    ]:
+        # --- all csv types are registered and all elements got the data of their type
+        assert set(csv_data[type_table].id) <= set(net.std_types[element].keys())
+        std_types = pd.DataFrame(net.std_types[element]).T
+        type_columns = net[element].columns.intersection(std_types.columns).difference(
+            ["type"] if element == "line" else [])
+        expected = std_types.loc[net[element].std_type, type_columns]
+        values = net[element][type_columns].values
+        expected = expected.values
+        assert ((values == expected) | (pd.isnull(values) & pd.isnull(expected))).all()
+
+
+def _concat_output_table(output_table, tables, fix_values):
+    """Builds the output table as the conversion did before _build_output_table(): by concatenating
+    the output table and each input table, restricted to its columns which are not only nan."""
+    with warnings.catch_warnings():
+        warnings.simplefilter(action="ignore", category=FutureWarning)
+        for table in tables:
+            cols = [col for col in output_table.columns
+                    if col in table.columns and table[col].notnull().any()]
+            output_table = pd.concat(
+                [output_table, table[cols]], ignore_index=True, sort=False
+            ).reindex(columns=output_table.columns)
+    for col, value in fix_values.items():
+        output_table[col] = value
+    return output_table
+
+
+def test_build_output_table():
+    output_table = pd.DataFrame({
+        "o": pd.Series([], dtype=object), "f": pd.Series([], dtype=float),
+        "i": pd.Series([], dtype="int64"), "b": pd.Series([], dtype=bool),
+        "I": pd.Series([], dtype="Int64"), "in_service": pd.Series([], dtype=object)})
+    tables = [
+        pd.DataFrame({"o": [1, 2], "f": [1, 2], "i": [1.5, 2.5], "b": [1, 0], "I": [1.0, 2.0]}),
+        pd.DataFrame({"o": [3.0], "i": [np.nan], "b": [True], "x": ["not copied"]}),
+    ]
+    for n_tables in [1, 2]:
+        built = _build_output_table(
+            output_table.dtypes, tables[:n_tables], {"in_service": True})
+
+        # --- same result as concatenating the empty output table and the input tables
+        expected = _concat_output_table(output_table, tables[:n_tables], {"in_service": True})
+        assert list(built.columns) == list(expected.columns)
+        assert built.index.equals(expected.index)
+        assert (built.dtypes == expected.dtypes).all()
+        assert dataframes_equal(built, expected)
+
+
+def test_build_output_table_mixed_dtypes():
+    output_dtypes = {"o": object, "f": float, "i": "int64", "b": bool, "I": "Int64"}
+    variants = {
+        "int": [1, 2], "float": [1.5, 2.0], "bool": [True, False], "str": ["a", "b"],
+        "mixed": [1, "b"], "float_nan": [1.5, np.nan], "nan": [np.nan, np.nan],
+        "none": [None, None], "missing": None,
+    }
+    output_table = pd.DataFrame({
+        col: pd.Series([], dtype=dtype) for col, dtype in output_dtypes.items()})
+    for variant1, values1 in variants.items():
+        for variant2, values2 in variants.items():
+            tables = [pd.DataFrame(index=range(2)) for _ in range(2)]
+            for table, values in zip(tables, [values1, values2]):
+                if values is not None:
+                    for col in output_dtypes.keys():
+                        table[col] = values
+            built = _build_output_table(output_table.dtypes, tables, {"in_service": True})
+            expected = _concat_output_table(output_table, tables, {"in_service": True})
+            for col in output_dtypes.keys():
+                case = (col, variant1, variant2)
+                assert built[col].dtype == expected[col].dtype, case
+                assert list(built[col].isnull()) == list(expected[col].isnull()), case
+                assert list(built[col].dropna()) == list(expected[col].dropna()), case
+
+
+def test_csv_data2pp_generic_coordinates():
+    csv_data = read_csv_data(test_network_path, ";")
+    csv_data["Node"].loc[csv_data["Node"].index[0], "coordID"] = np.nan
+    net = csv_data2pp(csv_data, fill_bus_geo_by_generic_data=False)
+    assert net.bus.geo.notnull().all()
+    assert not net.bus.geo.duplicated().any()
+
+    # --- an empty Coordinates table gets generic coordinates for all buses as well
+    csv_data = read_csv_data(test_network_path, ";")
+    csv_data["Coordinates"] = csv_data["Coordinates"].iloc[:0]
+    csv_data["Node"]["coordID"] = np.nan
+    net = csv_data2pp(csv_data, fill_bus_geo_by_generic_data=False)
+    assert net.bus.geo.notnull().all()
+    assert not net.bus.geo.duplicated().any()
+
+
+def test_csv_data2pp_numeric_geodata():
+    csv_data = read_csv_data(test_network_path, ";")
+    net = csv_data2pp(csv_data)
+    numeric_net = csv_data2pp(csv_data, geodata="numeric")
+    assert numeric_net.bus.geo.isnull().all()
+    assert numeric_net.bus.x.notnull().all() and numeric_net.bus.y.notnull().all()
+
+    # --- the GeoJSON strings are created on request and equal those of geodata="geojson"
+    materialize_bus_geo(numeric_net)
+    assert net.bus.geo.notnull().all()
+    assert list(numeric_net.bus.geo) == list(net.bus.geo)
+    materialize_bus_geo(numeric_net)  # existing geo data is kept
+    assert list(numeric_net.bus.geo) == list(net.bus.geo)
+
+
+def test_record_stages():
+    csv_data = read_csv_data(test_network_path, ";")
+    with record_stages(trace_memory=False) as recorder:
+        net = csv_data2pp(csv_data)
+        with conversion_stage("pp2csv_data"):
+            pp2csv_data(net)
+    stages = recorder.to_dataframe()
+    for name in ["copy_csv_data", "_ensure_safe_csv_ids", "_csv_types_to_pp2", "copy_net",
+                 "_pp_types_to_csv1", "_check_id_voltLvl_subnet"]:
+        assert name in stages.name.values
+    assert stages.peak_memory_mb.isnull().all()
+    assert (stages.depth.loc[stages.name == "_pp_types_to_csv1"] == 1).all()
+    assert recorder.summary().loc["_convert_elements_and_types", "calls"] == 2
+    trace = recorder.to_chrome_trace()
+    assert len(trace["traceEvents"]) == stages.shape[0]
+    assert trace["traceEvents"][0]["dur"] == stages.wall_s.iloc[0] * 1e6
+
+    # --- only one recording at a time traces memory, since tracemalloc is global
+    with record_stages() as outer:
+        with conversion_stage("outer_stage"):
+            with record_stages() as inner:
+                with conversion_stage("inner_stage"):
+                    np.ones(10**6)
+    assert outer.stages[0]["peak_memory_mb"] >= 8
+    assert np.isnan(inner.stages[0]["peak_memory_mb"])
+    with record_stages() as again:
+        with conversion_stage("stage"):
+            pass
+    assert not np.isnan(again.stages[0]["peak_memory_mb"])
+
+
+def test_pp2csv_data_keeps_net_unchanged():
+    net = csv2pp(test_network_path, ";")
+    pp.runpp(net)
+    net.line.loc[net.line.index[0], "parallel"] = 2
+    net.load.loc[net.load.index[0], "in_service"] = False
+    net_orig = deepcopy(net)
+    csv_data = pp2csv_data(net)
+
+    assert nets_equal(net, net_orig, check_only_results=False)
+    for key in net.keys():
+        if isinstance(net[key], pd.DataFrame):
+            assert dataframes_equal(net[key], net_orig[key]), key
+    assert net.std_types == net_orig.std_types
+    for name, profiles in net_orig.profiles.items():
+        assert dataframes_equal(net.profiles[name], profiles)
+    assert dataframes_equal(csv_data["LoadProfile"], net_orig.profiles["load"])
+    assert csv_data["Load"].shape[0] == net_orig.load.shape[0] - 1
+    assert csv_data["NodePFResult"].shape[0]
+
+
+def test_convert_measurement():
+    net = example_simple()
+    for element_type, element, side in [
+        ("trafo", 0, "hv"), ("trafo", 0, "lv"), ("line", 2, "from"), ("line", 3, "to"),
+        ("bus", 4, None), ("line", 1, "to"),
+    ]:
+        for meas_type in ["p", "q"]:
+            pp.create_measurement(net, meas_type, element_type, 1.0, 0.01, element, side)
+    measurement = net.measurement.copy()
+    csv_data = pp2csv_data(net)
+    csv_meas = csv_data["Measurement"]
+    is_trafo = measurement.element_type.values == "trafo"
+    assert list(csv_meas.element2[is_trafo]) == [net.trafo.name.at[0]] * 4
+    assert list(csv_meas.element1[is_trafo]) == list(
+        net.bus.name.loc[[net.trafo.hv_bus.at[0]] * 2 + [net.trafo.lv_bus.at[0]] * 2])
+    assert list(csv_meas.element1[measurement.element_type.values == "bus"]) == [
+        net.bus.name.at[4]] * 2
+
+    # --- element1 and element2 are switched if element2 is a node name
+    swapped = csv_meas.index[[4, 5]]
+    csv_meas.loc[swapped, ["element1", "element2"]] = csv_meas.loc[
+        swapped, ["element2", "element1"]].values
+    net_from_csv = csv_data2pp(csv_data)
+    cols = ["measurement_type", "element_type", "element", "side"]
+    assert dataframes_equal(
+        net_from_csv.measurement[cols].reset_index(drop=True).astype(object),
+        measurement[cols].reset_index(drop=True).astype(object).replace({np.nan: None}),
+    )
+
+    # --- measurements of missing nodes
+    csv_data["Measurement"].loc[csv_data["Measurement"].index[0], "element1"] = "missing"
+    with pytest.raises(ValueError):
+        csv_data2pp(csv_data)
+
+
+def test_csv2pp_many(tmp_path):
+    failing_path = os.path.join(tmp_path, "failing_network")
+    shutil.copytree(test_network_path, failing_path)
+    os.remove(os.path.join(failing_path, "LineType.csv"))
+    paths = [test_network_path, failing_path]
+    net = csv2pp(test_network_path, ";")
+
+    results = {path: (net_, error) for path, net_, error in csv2pp_many(paths, max_workers=2)}
+    assert set(results.keys()) == set(paths)
+    assert results[test_network_path][1] is None
+    assert nets_equal(results[test_network_path][0], net, check_only_results=False)
+    assert results[failing_path][0] is None
+    assert "ValueError" in results[failing_path][1]
+
+    # --- write the nets to an output folder
+    output_dir = os.path.join(tmp_path, "nets")
+    results = {
+        path: (file, error)
+        for path, file, error in csv2pp_many(paths, max_workers=1, output_dir=output_dir)
+    }
+    assert results[test_network_path] == (os.path.join(output_dir, "test_network.json"), None)
+    assert nets_equal(pp.from_json(results[test_network_path][0]), net)
+    assert results[failing_path][0] is None
+    assert os.listdir(output_dir) == ["test_network.json"]
+    with pytest.raises(ValueError):
+        list(csv2pp_many([test_network_path, test_network_path], output_dir=output_dir))
+
+
+def _assert_equal_csv_files(path1, path2):
+    files = sorted(os.listdir(path1))
+    assert files == sorted(os.listdir(path2))
+    for file in files:
+        with open(os.path.join(path1, file), "rb") as f1:
+            with open(os.path.join(path2, file), "rb") as f2:
+                assert f1.read() == f2.read(), file
+
+
+def test_incremental_csv_exporter(tmp_path):
+    net = csv2pp(test_network_path, ";")
+    exporter = IncrementalCsvExporter(os.path.join(tmp_path, "incremental"))
+
+    def export_and_compare(step):
+        written = exporter.export(net)
+        fresh_path = os.path.join(tmp_path, "fresh%i" % step)
+        os.makedirs(fresh_path)
+        pp2csv(net, fresh_path)
+        _assert_equal_csv_files(exporter.path, fresh_path)
+        return written
+
+    assert "Load" in export_and_compare(0)
+    assert not exporter.last_export_was_incremental
+    assert export_and_compare(1) == []
+
+    # --- changed values of loads and shunts are converted and written incrementally
+    net.load.loc[net.load.index[[0, 2]], "p_mw"] *= 1.1
+    net.load.loc[net.load.index[1], "q_mvar"] = np.nan
+    assert export_and_compare(2) == ["Load"]
+    assert exporter.last_export_was_incremental
+    net.shunt.loc[net.shunt.index[0], "q_mvar"] *= 2
+    assert export_and_compare(3) == ["Shunt"]
+    assert exporter.last_export_was_incremental
+
+    # --- other changes need a full conversion, but only changed files are written
+    net.line.loc[net.line.index[0], "length_km"] *= 2
+    assert export_and_compare(4) == ["Line"]
+    assert not exporter.last_export_was_incremental
+    net.load.loc[net.load.index[3], "in_service"] = False
+    assert export_and_compare(5) == ["Load"]
+    assert not exporter.last_export_was_incremental
+
+
+def test_pp2csv_many(tmp_path):
+    net1 = csv2pp(test_network_path, ";")
+    net2 = deepcopy(net1)
+    net2.bus["name"] = ["net2 " + name if name != "Bus 1a" else name for name in net2.bus.name]
+    net3 = deepcopy(net1)
+    net3.load["p_mw"] *= 2
+    nets = [net1, net2, net3]
+
+    # --- the result equals sequential exports via pp2csv(mode="append_unique")
+    sequential_path = os.path.join(tmp_path, "sequential")
+    os.makedirs(sequential_path)
+    reserved = set()
+    for i, net in enumerate(nets):
+        reserved = pp2csv(
+            net,
+            sequential_path,
+            mode="append_unique" if i else "w",
+            reserved_aux_node_names=reserved,
+        )
+    path = os.path.join(tmp_path, "many")
+    reserved_many = pp2csv_many(nets, path, max_workers=2, reserved_aux_node_names=set())
+    assert reserved_many == reserved == {"Bus 1a_1", "Bus 1a_2", "Bus 1a_3"}
+    _assert_equal_csv_files(sequential_path, path)
+    coords = read_csv_data(path, ";", "Coordinates")
+    assert coords.id.is_unique
+    assert set(read_csv_data(path, ";", "Node").coordID) <= set(coords.id)
+
+    # --- append to an existing dataset
+    reserved = pp2csv(net1, sequential_path, mode="append_unique", reserved_aux_node_names=reserved)
+    reserved_many = pp2csv_many(
+        [net1], path, mode="append_unique", reserved_aux_node_names=reserved_many
+    )
+    assert reserved_many == reserved
+    _assert_equal_csv_files(sequential_path, path)
+
+    with pytest.raises(ValueError):
+        pp2csv_many(nets, path, mode="a")
+
+
 def test_example_simple():
     net = example_simple()
 
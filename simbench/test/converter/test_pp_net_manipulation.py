@@ -3,8 +3,10 @@
 # contributors (see AUTHORS file for details). All rights reserved.
 
 import pytest
+import json
 from copy import deepcopy
 from packaging import version
+import numpy as np
 import pandas as pd
 import pandapower as pp
 from pandapower.auxiliary import _preserve_dtypes
@@ -12,7 +14,10 @@ from simbench.converter import (
     replace_branch_switches,
     create_branch_switches,
     repl_nans_in_obj_cols_to_empty_str,
+    create_generic_tree_coordinates,
+    deviation_from_std_type,
 )
+from pandapower.diagnostic.diagnostic_functions import DeviationFromStdType
 
 try:
     from pandapower.toolbox.comparison import nets_equal
@@ -138,6 +143,78 @@ def test_branch_switch_changes():
         assert nets_equal(net_orig, net2)
 
 
+def _bus_xy(net):
+    return pd.DataFrame(
+        [json.loads(geo)["coordinates"] for geo in net.bus.geo],
+        index=net.bus.index, columns=["x", "y"])
+
+
+def test_create_generic_tree_coordinates():
+    # --- MV grid with a ring and two radial LV grids, each fed by a trafo
+    net = pp.create_empty_network()
+    mv = pp.create_buses(net, 6, 20, subnet="MV1.101")
+    pp.create_ext_grid(net, mv[0])
+    for from_bus, to_bus in zip(mv[:-1], mv[1:]):
+        pp.create_line(net, from_bus, to_bus, 1, "NA2XS2Y 1x95 RM/25 12/20 kV")
+    pp.create_line(net, mv[-1], mv[0], 1, "NA2XS2Y 1x95 RM/25 12/20 kV")
+    lv_grids = []
+    for i, mv_bus in enumerate([mv[2], mv[4]]):
+        lv = pp.create_buses(net, 7, 0.4, subnet="LV1.10%i" % i)
+        lv_grids.append(lv)
+        pp.create_transformer(net, mv_bus, lv[0], "0.4 MVA 20/0.4 kV")
+        for parent, child in [(0, 1), (1, 2), (2, 3), (0, 4), (4, 5), (4, 6)]:
+            pp.create_line(net, lv[parent], lv[child], 0.1, "NAYY 4x50 SE")
+    pp.create_bus(net, 0.4, subnet="LV1.103")  # isolated bus
+
+    create_generic_tree_coordinates(net)
+    xy = _bus_xy(net)
+    assert not xy.isnull().any().any()
+    assert not xy.duplicated().any()
+
+    # --- the LV trees start at the feeding trafo and lines go one level down
+    for lv in lv_grids:
+        assert xy.y.at[lv[0]] == xy.y.max()
+        for parent, child in [(0, 1), (1, 2), (2, 3), (0, 4), (4, 5), (4, 6)]:
+            assert xy.y.at[lv[child]] == xy.y.at[lv[parent]] - 1
+
+    # --- the subnets do not overlap
+    x_ranges = xy.x.groupby(net.bus.subnet).agg(["min", "max"]).sort_values("min")
+    assert (x_ranges["min"].values[1:] > x_ranges["max"].values[:-1]).all()
+
+
+def test_create_generic_tree_coordinates_large_net():
+    # --- random trees of 20000 buses in 10 subnets
+    rng = np.random.default_rng(0)
+    net = pp.create_empty_network()
+    n_per_subnet = 2000
+    for i in range(10):
+        buses = pp.create_buses(net, n_per_subnet, 0.4, subnet="LV1.%i" % i)
+        parents = buses[(rng.random(n_per_subnet - 1) * np.arange(1, n_per_subnet)).astype(int)]
+        pp.create_lines(net, parents, buses[1:], 0.1, "NAYY 4x50 SE")
+    create_generic_tree_coordinates(net)
+    xy = _bus_xy(net)
+    assert not xy.duplicated().any()
+    assert (xy.y.loc[net.line.to_bus].values == xy.y.loc[net.line.from_bus].values - 1).all()
+
+
+def test_deviation_from_std_type():
+    net = _net_to_test()
+    assert deviation_from_std_type(net) is None
+    net.line.loc[3, "r_ohm_per_km"] *= 1.1
+    net.line.loc[7, "std_type"] = "not in the library"
+    net.trafo.loc[0, "vector_group"] = "Yy0"
+    net.trafo.loc[0, "vk_percent"] += 1
+    net.trafo.loc[1, "tap_pos"] = 3  # not checked
+
+    deviations = deviation_from_std_type(net)
+    assert deviations == {k: dict(v) for k, v in DeviationFromStdType().diagnostic(net).items()}
+    assert set(deviations["line"].keys()) == {3, 7}
+    assert deviations["line"][3]["param"] == "r_ohm_per_km"
+    assert not deviations["line"][7]["std_type_in_lib"]
+    assert deviations["trafo"][0]["std_type_in_lib"]
+    assert list(deviations["trafo"].keys()) == [0]
+
+
 if __name__ == "__main__":
     if 0:
         pytest.main(["test_pp_net_manipulation.py", "-xs"])
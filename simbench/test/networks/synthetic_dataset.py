@@ -0,0 +1,190 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import numpy as np
+import pandas as pd
+
+import simbench as sb
+
+__author__ = "smeinecke"
+
+
+def _df(tablename, rows):
+    return pd.DataFrame(rows, columns=sb.get_columns(tablename))
+
+
+def synthetic_csv_data(scenario=0):
+    """Returns a small csv_data dict which follows the subnet conventions of the SimBench complete
+    dataset. It contains the MV grid 'MV1.101' (code '1-MV-rural--0-sw') and two connected LV grids
+    'LV1.101' (code '1-LV-rural1--0-sw') and 'LV1.102' (code '1-MVLV-rural-1.102-0-sw' together
+    with the MV grid). Scenarios differ in RES and Load values as well as in one additional LV line
+    and load."""
+    nan = np.nan
+    csv_data = dict()
+    csv_data["Node"] = _df("Node", [
+        ["MV1.101 busbar1", "busbar", 1.02, 0.0, 20, 0.965, 1.055, "HV1_MV1.101_Substation",
+         "coord_0", "MV1.101", 5],
+        ["MV1.101 busbar2", "busbar", nan, nan, 20, 0.965, 1.055, "HV1_MV1.101_Substation",
+         "coord_0", "MV1.101", 5],
+        ["MV1.101 busbar1_1", "auxiliary", nan, nan, 20, 0.965, 1.055,
+         "HV1_MV1.101_Substation", "coord_0", "MV1.101", 5],
+        ["MV1.101 Bus 1", "node", nan, nan, 20, 0.965, 1.055, nan, "coord_1",
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 Bus 1_1", "auxiliary", nan, nan, 20, 0.965, 1.055, nan, "coord_1",
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 Bus 1_2", "auxiliary", nan, nan, 20, 0.965, 1.055, nan, "coord_1",
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 Bus 2", "node", 1.0, 0.0, 20, 0.965, 1.055, nan, "coord_2",
+         "MV1.101_LV1.101_Feeder1", 5],
+        ["MV1.101 Bus 2_1", "auxiliary", nan, nan, 20, 0.965, 1.055, nan, "coord_2",
+         "LV1.101", 5],
+        ["LV1.101 Bus 1", "busbar", nan, nan, 0.4, 0.9, 1.1, nan, "coord_3", "LV1.101", 7],
+        ["LV1.101 Bus 2", "node", nan, nan, 0.4, 0.9, 1.1, nan, "coord_4", "LV1.101", 7],
+        ["LV1.101 Bus 3", "node", nan, nan, 0.4, 0.9, 1.1, nan, "coord_5", "LV1.101", 7],
+        ["LV1.101 Bus 4", "node", nan, nan, 0.4, 0.9, 1.1, nan, "coord_6", "LV1.101", 7],
+        ["MV1.101 Bus 3", "node", 1.0, 0.0, 20, 0.965, 1.055, nan, "coord_7",
+         "MV1.101_LV1.102_Feeder1", 5],
+        ["MV1.101 Bus 3_1", "auxiliary", nan, nan, 20, 0.965, 1.055, nan, "coord_7",
+         "LV1.102", 5],
+        ["LV1.102 Bus 1", "busbar", nan, nan, 0.4, 0.9, 1.1, nan, "coord_8", "LV1.102", 7],
+        ["LV1.102 Bus 2", "node", nan, nan, 0.4, 0.9, 1.1, nan, "coord_9", "LV1.102", 7],
+    ])
+    csv_data["Coordinates"] = _df("Coordinates", [
+        ["coord_0", 11.40, 53.60, "MV1.101", 5],
+        ["coord_1", 11.41, 53.61, "MV1.101_Feeder1", 5],
+        ["coord_2", 11.42, 53.62, "MV1.101_LV1.101_Feeder1", 5],
+        ["coord_3", 11.421, 53.621, "LV1.101", 7],
+        ["coord_4", 11.422, 53.622, "LV1.101", 7],
+        ["coord_5", 11.423, 53.623, "LV1.101", 7],
+        ["coord_6", 11.424, 53.621, "LV1.101", 7],
+        ["coord_7", 11.43, 53.60, "MV1.101_LV1.102_Feeder1", 5],
+        ["coord_8", 11.431, 53.601, "LV1.102", 7],
+        ["coord_9", 11.432, 53.602, "LV1.102", 7],
+    ])
+    csv_data["Line"] = _df("Line", [
+        ["MV1.101 Line 1", "MV1.101 busbar1_1", "MV1.101 Bus 1_1",
+         "NA2XS2Y 1x70 RM/25 12/20 kV", 0.3, 100, "MV1.101_Feeder1", 5],
+        ["MV1.101 Line 2", "MV1.101 Bus 1_2", "MV1.101 Bus 2",
+         "NA2XS2Y 1x70 RM/25 12/20 kV", 0.25, 100, "MV1.101_Feeder1", 5],
+        ["MV1.101 Line 3", "MV1.101 busbar2", "MV1.101 Bus 2",
+         "NA2XS2Y 1x70 RM/25 12/20 kV", 0.4, 100, "MV1.101_Feeder1", 5],
+        ["LV1.101 Line 1", "LV1.101 Bus 1", "LV1.101 Bus 2", "NAYY 4x150SE 0.6/1kV", 0.05,
+         100, "LV1.101", 7],
+        ["LV1.101 Line 2", "LV1.101 Bus 2", "LV1.101 Bus 3", "NAYY 4x150SE 0.6/1kV", 0.04,
+         100, "LV1.101", 7],
+        ["MV1.101 Line 6", "MV1.101 Bus 2", "MV1.101 Bus 3", "NA2XS2Y 1x70 RM/25 12/20 kV",
+         0.5, 100, "MV1.101_Feeder1", 5],
+        ["LV1.102 Line 1", "LV1.102 Bus 1", "LV1.102 Bus 2", "NAYY 4x150SE 0.6/1kV", 0.06,
+         100, "LV1.102", 7],
+    ])
+    csv_data["LineType"] = _df("LineType", [
+        ["NA2XS2Y 1x70 RM/25 12/20 kV", 0.443, 0.1233, 78.5398, 210, "cable"],
+        ["NAYY 4x150SE 0.6/1kV", 0.2067, 0.0804248, 260.752, 270, "cable"],
+    ])
+    csv_data["Switch"] = _df("Switch", [
+        ["MV1.101 Switch 1", "MV1.101 busbar1", "MV1.101 busbar1_1", "CB", 1,
+         "HV1_MV1.101_Substation", "MV1.101", 5],
+        ["MV1.101 Switch 2", "MV1.101 Bus 1", "MV1.101 Bus 1_1", "LBS", 1, nan,
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 Switch 3", "MV1.101 Bus 1", "MV1.101 Bus 1_2", "LBS", 0, nan,
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 Switch 4", "MV1.101 busbar1", "MV1.101 busbar2", "DS", 1,
+         "HV1_MV1.101_Substation", "MV1.101", 5],
+        ["LV1.101 Switch 1", "MV1.101 Bus 2", "MV1.101 Bus 2_1", "LBS", 1, nan, "LV1.101", 5],
+        ["LV1.102 Switch 1", "MV1.101 Bus 3", "MV1.101 Bus 3_1", "LBS", 1, nan, "LV1.102", 5],
+    ])
+    csv_data["Transformer"] = _df("Transformer", [
+        ["MV1.101-LV1.101-Trafo 1", "MV1.101 Bus 2_1", "LV1.101 Bus 1",
+         "0.16 MVA 20/0.4 kV DOTE 160/20  SGB", 0, 0, nan, 100, nan, "LV1.101", 6],
+        ["MV1.101-LV1.102-Trafo 1", "MV1.101 Bus 3_1", "LV1.102 Bus 1",
+         "0.16 MVA 20/0.4 kV DOTE 160/20  SGB", 0, 0, nan, 100, nan, "LV1.102", 6],
+    ])
+    csv_data["TransformerType"] = _df("TransformerType", [
+        ["0.16 MVA 20/0.4 kV DOTE 160/20  SGB", 0.16, 20, 0.4, 150, 4, 2.35, 0.46, 0.28751, 1,
+         "HV", 2.5, 0, 0, -2, 2],
+    ])
+    csv_data["ExternalNet"] = _df("ExternalNet", [
+        ["MV1.101 grid equivalent", "MV1.101 busbar1", "vavm", 1] + [nan] * 7 +
+        ["MV1.101_HV1_eq", 5],
+        ["MV1.101 grid at LV1.101", "MV1.101 Bus 2", "vavm", 1] + [nan] * 7 +
+        ["LV1.101_MV1.101_eq", 5],
+        ["MV1.101 grid at LV1.102", "MV1.101 Bus 3", "vavm", 1] + [nan] * 7 +
+        ["LV1.102_MV1.101_eq", 5],
+    ])
+    p_factor = 1 + 0.1 * scenario
+    csv_data["Load"] = _df("Load", [
+        ["MV1.101 Load 1", "MV1.101 Bus 1", "G3-A", 0.23 * p_factor, 0.0909, 0.247312,
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 Load 2", "MV1.101 Bus 2", "lv_rural1", 0.08 * p_factor, 0.0316, 0.0860215,
+         "MV1.101_LV1.101_eq", 5],
+        ["LV1.101 Load 1", "LV1.101 Bus 2", "H0-A", 0.003 * p_factor, 0.0012, 0.0035,
+         "LV1.101", 7],
+        ["LV1.101 Load 2", "LV1.101 Bus 3", "H0-B", 0.004 * p_factor, 0.0016, 0.0045,
+         "LV1.101", 7],
+        ["MV1.101 Load 3", "MV1.101 Bus 3", "lv_rural1", 0.005, 0.002, 0.0054,
+         "MV1.101_LV1.102_eq", 5],
+        ["LV1.102 Load 1", "LV1.102 Bus 2", "H0-A", 0.005, 0.002, 0.0054, "LV1.102", 7],
+    ])
+    csv_data["RES"] = _df("RES", [
+        ["MV1.101 SGen 1", "MV1.101 Bus 1", "Wind_MV", "WP4", "pq", 2 * p_factor, 0, 2,
+         "MV1.101_Feeder1", 5],
+        ["MV1.101 SGen 2", "MV1.101 Bus 2", "lv_RES", "lv_rural1", "pq", 0.016, 0, 0.016,
+         "MV1.101_LV1.101_eq", 5],
+        ["LV1.101 SGen 1", "LV1.101 Bus 3", "PV5", "PV5", "pq", 0.01 * p_factor, 0, 0.01,
+         "LV1.101", 7],
+    ])
+    csv_data["Measurement"] = _df("Measurement", [
+        ["MV1.101 Measurement 1", "MV1.101 busbar1", nan, "v", "MV1.101", 5],
+        ["MV1.101 Measurement 2", "MV1.101 Bus 1", "MV1.101 Line 1", "i", "MV1.101_Feeder1",
+         5],
+        ["MV1.101 Measurement 3", "MV1.101 busbar2", "MV1.101 Line 3", "p", "MV1.101_Feeder1",
+         5],
+    ])
+    csv_data["Substation"] = _df("Substation", [
+        ["HV1_MV1.101_Substation", "HV1_MV1.101", 4],
+        ["MV1.101_LV1.101_Substation", "MV1.101_LV1.101", 6]])
+    csv_data["StudyCases"] = pd.DataFrame(
+        [[case, lvl, pl, ql, w, pv, res, vm] for lvl in [5, 7] for case, pl, ql, w, pv, res, vm
+         in [["hL", 1, 1, 0, 0, 0, 1.025], ["n1", 1, 1, 0, 0, 0, 1.025],
+             ["hW", 1, 1, 1, 0.8, 1, 1.025], ["hPV", 1, 1, 0.85, 0.95, 1, 1.025],
+             ["lW", 0.1, 0.122543, 1, 0.8, 1, 1.035], ["lPV", 0.1, 0.122543, 0.85, 0.95, 1,
+                                                       1.035]]],
+        columns=["Study Case", "voltLvl", "pload", "qload", "Wind_p", "PV_p", "RES_p",
+                 "Slack_vm"])
+
+    # --- profiles
+    n_time_steps = 8
+    time = pd.date_range("2016-01-01", periods=n_time_steps, freq="15min").strftime(
+        "%d.%m.%Y %H:%M")
+    np.random.seed(scenario)
+    load_profiles = ["G3-A", "H0-A", "H0-B", "lv_rural1"]
+    csv_data["LoadProfile"] = pd.DataFrame(
+        np.random.random((n_time_steps, 2 * len(load_profiles))),
+        columns=[prof + pq for pq in ["_pload", "_qload"] for prof in load_profiles])
+    # scenario independent profile columns
+    csv_data["LoadProfile"]["H0-A_pload"] = np.linspace(0.1, 0.8, n_time_steps)
+    csv_data["LoadProfile"]["H0-A_qload"] = np.linspace(0.05, 0.4, n_time_steps)
+    csv_data["LoadProfile"].insert(0, "time", time)
+    csv_data["RESProfile"] = pd.DataFrame(
+        np.random.random((n_time_steps, 3)), columns=["WP4", "PV5", "lv_rural1"])
+    csv_data["RESProfile"]["PV5"] = np.sin(np.linspace(0, np.pi, n_time_steps))
+    csv_data["RESProfile"].insert(0, "time", time)
+    for tablename in ["PowerPlantProfile", "StorageProfile"]:
+        csv_data[tablename] = pd.DataFrame({"time": time})
+
+    # --- scenario dependent grid extension
+    if scenario > 0:
+        csv_data["Line"].loc[csv_data["Line"].shape[0]] = [
+            "LV1.101 Line 3", "LV1.101 Bus 2", "LV1.101 Bus 4", "NAYY 4x150SE 0.6/1kV", 0.03,
+            100, "LV1.101", 7]
+        csv_data["Load"].loc[csv_data["Load"].shape[0]] = [
+            "LV1.101 Load 3", "LV1.101 Bus 4", "H0-A", 0.002, 0.0008, 0.0025, "LV1.101", 7]
+    return csv_data
+
+
+def write_synthetic_dataset(path, scenario=0):
+    """Writes synthetic_csv_data() to csv files into the folder 'path' and returns 'path'."""
+    csv_data = synthetic_csv_data(scenario)
+    sb.write2csv(path, csv_data, mode="w", sep=";", must_store=list(csv_data.keys()))
+    return str(path)
@@ -0,0 +1,91 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import os
+import stat
+import pytest
+
+import simbench as sb
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
+
+__author__ = "smeinecke"
+
+
+def test_get_simbench_code_metadata(tmp_path):
+    dataset = sb.SimBenchDataset(write_synthetic_dataset(tmp_path))
+    for sb_code in ["1-MV-rural--0-sw", "1-MVLV-rural-all-0-no_sw", "1-LV-rural1--0-no_sw",
+                    "1-complete_data-mixed-all-0-sw"]:
+        metadata = sb.get_simbench_code_metadata(sb_code, dataset)
+        net = sb.get_simbench_net(sb_code, dataset)
+        for element in ["bus", "line", "trafo", "trafo3w", "switch", "load", "sgen", "gen",
+                        "ext_grid", "storage"]:
+            assert metadata["n_" + element] == net[element].shape[0]
+        assert metadata["n_profile_columns"] == sum(
+            df.shape[1] - int("time" in df.columns) for df in net.profiles.values())
+        assert metadata["n_time_steps"] == net.profiles["load"].shape[0]
+        assert metadata["memory_mb"] > 0
+        assert metadata["sw"] == sb_code.endswith("-sw")
+
+
+def test_get_simbench_catalog(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    input_path = write_synthetic_dataset(tmp_path / "data")
+    cache_dir = str(tmp_path / "cache")
+    sb_codes = ["1-MV-rural--0-sw", "1-MV-rural--0-no_sw", "1-MVLV-rural-all-0-sw",
+                "1-MVLV-rural-all-0-no_sw", "1-LV-rural1--0-sw"]
+    catalog = sb.get_simbench_catalog(sb_codes, input_path, cache_dir=cache_dir)
+    assert len(catalog) == 5
+    assert list(catalog.data.index) == sb_codes
+    assert len(os.listdir(cache_dir)) == 1
+    assert os.listdir(cache_dir)[0].endswith(".json")
+
+    assert catalog.select(hv_level="MV", lv_level="") == sb_codes[:2]
+    assert catalog.select(sw=False) == sb_codes[1:4:2]
+    assert catalog.select(lv_level=["LV", ""], min_n_load=4) == sb_codes[2:4]
+    n_bus = catalog.data.n_bus.median()
+    assert catalog.select(max_n_bus=n_bus) == list(catalog.data.index[catalog.data.n_bus <= n_bus])
+    assert 0 < len(catalog.select(max_n_bus=n_bus)) < 5
+    with pytest.raises(ValueError):
+        catalog.select(max_n_buses=10)
+
+    # --- the cached catalog is returned without computing the metadata again
+    def failing_metadata(*args, **kwargs):
+        raise AssertionError("The metadata should be read from the cache.")
+
+    monkeypatch.setattr(
+        "simbench.networks.catalog.get_simbench_code_metadata", failing_metadata
+    )
+    cached = sb.get_simbench_catalog(sb_codes, input_path, cache_dir=cache_dir)
+    assert cached.data.equals(catalog.data)
+    assert list(cached.data.dtypes) == list(catalog.data.dtypes)
+
+    # --- changed csv files renew the cache
+    load_file = os.path.join(input_path, "Load.csv")
+    with open(load_file, "a") as f:
+        f.write("")
+    os.utime(load_file, ns=(0, 0))
+    with pytest.raises(AssertionError):
+        sb.get_simbench_catalog(sb_codes, input_path, cache_dir=cache_dir)
+
+
+def test_default_catalog_cache_dir(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    input_path = write_synthetic_dataset(tmp_path / "data")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache_home"))
+    cache_dir = sb.default_catalog_cache_dir()
+    assert cache_dir == str(tmp_path / "cache_home" / "simbench")
+    sb.get_simbench_catalog(["1-MV-rural--0-sw"], input_path)
+    assert len(os.listdir(cache_dir)) == 1
+    if hasattr(os, "getuid"):
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        os.chmod(cache_dir, 0o777)  # other users could plant files
+        with pytest.raises(ValueError):
+            sb.get_simbench_catalog(["1-MV-rural--0-sw"], input_path)
+
+
+if __name__ == "__main__":
+    if 0:
+        pytest.main([__file__, "-xs"])
+    else:
+        pass
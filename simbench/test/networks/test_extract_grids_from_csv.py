@@ -4,24 +4,30 @@
 
 import pytest
 import os
+import json
 from copy import deepcopy
 import numpy as np
 import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor
 import pandapower as pp
 from pandapower.auxiliary import _preserve_dtypes
+from pandapower.toolbox.element_selection import element_bus_tuples
 from pandapower.topology import unsupplied_buses
 
 from simbench import sb_dir
 import simbench as sb
+from simbench.networks import extract_simbench_grids_from_csv
 from simbench.networks.extract_simbench_grids_from_csv import (
     _get_extracted_csv_data_from_dict,
 )
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
 
 try:
-    from pandapower.toolbox.comparison import dataframes_equal
+    from pandapower.toolbox.comparison import dataframes_equal, nets_equal
+    from pandapower.toolbox.grid_modification import fuse_buses
 except ImportError:
-    from pandapower import dataframes_equal
+    from pandapower import dataframes_equal, nets_equal, fuse_buses
 
 import logging
 
@@ -423,6 +429,187 @@ def test_generate_no_sw_variant():
     )
 
 
+def test_generate_no_sw_variant_with_bus_bus_switch_groups():
+    net = pp.create_empty_network()
+    pp.create_buses(net, 10, 10, name=["Bus %i" % i for i in range(10)])
+    pp.create_bus(net, 0.4, name="Bus 10")
+    for bus, element, closed in [(0, 1, True), (2, 1, False), (1, 3, True), (5, 4, False),
+                                 (4, 6, True), (7, 8, True), (8, 7, False)]:
+        pp.create_switch(net, bus, element, "b", closed=closed)
+    pp.create_line(net, 0, 2, 1, "NAYY 4x50 SE", name="inner line")
+    pp.create_line(net, 3, 4, 1, "NAYY 4x50 SE", name="Line 1")
+    pp.create_line(net, 8, 9, 1, "NAYY 4x50 SE", name="Line 2")
+    pp.create_switch(net, 9, 2, "l", closed=False)
+    pp.create_transformer(net, 6, 10, std_type="0.4 MVA 10/0.4 kV", name="Trafo 0")
+    pp.create_switch(net, 6, 0, "t", closed=True)
+    pp.create_loads(net, [2, 6, 8], 0.1)
+    pp.create_measurement(net, "v", "bus", 1.0, 0.01, 0)
+    pp.create_measurement(net, "v", "bus", 1.0, 0.01, 3)
+    pp.create_measurement(net, "p", "bus", 1.0, 0.01, 3)
+    pp.create_measurement(net, "i", "line", 0.1, 0.01, 1, side=3)
+
+    # --- expected result using pandapower's fuse_buses() per group
+    expected = deepcopy(net)
+    expected.switch = expected.switch.drop(
+        expected.switch.index[expected.switch.closed | (expected.switch.et == "b")])
+    for b1, b2 in [(0, {1, 2, 3}), (5, {4, 6}), (7, {8})]:
+        fuse_buses(expected, b1, b2)
+
+    sb.generate_no_sw_variant(net)
+    assert list(net.bus.index) == [0, 5, 7, 9, 10]
+    assert list(net.bus.type) == ["b"] * 5
+    for elm in ["bus", "line", "trafo", "switch", "load", "measurement"]:
+        assert dataframes_equal(net[elm], expected[elm])
+
+
+def _net_tables_by_names(net):
+    """Returns a dict of the element tables of the net without indices and with names instead of
+    bus and element indices. This allows comparing nets which differ in indices only."""
+    tables = dict()
+    bus_names = net.bus.name
+    branch_tables = {"l": "line", "t": "trafo", "t3": "trafo3w"}
+    for elm in ["bus", "line", "trafo", "trafo3w", "switch", "load", "sgen", "gen", "ext_grid",
+                "storage", "shunt", "measurement", "dcline", "ward", "xward"]:
+        df = deepcopy(net[elm])
+        if df.shape[0]:
+            for element, column in element_bus_tuples():
+                if element == elm:
+                    df[column] = bus_names.loc[df[column]].values
+            if elm == "switch":
+                df["element"] = [
+                    bus_names.at[el] if et == "b" else net[branch_tables[et]].name.at[el]
+                    for el, et in zip(df.element, df.et)]
+            elif elm == "measurement":
+                df["element"] = [net[et].name.at[el] for el, et in zip(df.element,
+                                                                        df.element_type)]
+        tables[elm] = df.reset_index(drop=True)
+    return tables
+
+
+def _double_busbar_csv_data(input_path, multi_auxiliary=True):
+    """Extends the synthetic csv data by a second busbar with the same setpoints, a line which is
+    connected to the busbars via an auxiliary node, a line between the busbars and a bus
+    measurement which becomes duplicated by fusing the busbars. If 'multi_auxiliary', the
+    auxiliary node is connected to both busbars, which prevents fusing the busbars in the csv
+    data."""
+    csv_data = sb.read_csv_data(input_path, ";")
+    node = csv_data["Node"]
+    node.loc[node.id == "MV1.101 busbar2", ["vmSetp", "vaSetp"]] = [1.02, 0.]
+    node_row = node.loc[node.id == "MV1.101 busbar1_1"].iloc[0]
+    for i, name in enumerate(["MV1.101 busbar1_2", "MV1.101 busbar1_3", "MV1.101 Bus 1_3"]):
+        node.loc[node.shape[0]] = node_row.values
+        node.loc[node.shape[0] - 1, "id"] = name
+    line = csv_data["Line"]
+    line_row = line.loc[0]
+    for name, nodeA, nodeB in [("MV1.101 Line 4", "MV1.101 busbar1_2", "MV1.101 Bus 1_3"),
+                               ("MV1.101 Line 5", "MV1.101 busbar1_3", "MV1.101 busbar2")]:
+        line.loc[line.shape[0]] = line_row.values
+        line.loc[line.shape[0] - 1, ["id", "nodeA", "nodeB"]] = [name, nodeA, nodeB]
+    switch = csv_data["Switch"]
+    switch_row = switch.loc[0]
+    for name, nodeA, nodeB, cond in [
+            ("MV1.101 Switch 5", "MV1.101 busbar1", "MV1.101 busbar1_2", 1),
+            ("MV1.101 Switch 6", "MV1.101 busbar1_2", "MV1.101 busbar2", 0),
+            ("MV1.101 Switch 7", "MV1.101 busbar1", "MV1.101 busbar1_3", 0),
+            ("MV1.101 Switch 8", "MV1.101 Bus 1_3", "MV1.101 Bus 1", 1)]:
+        if not multi_auxiliary and name == "MV1.101 Switch 6":
+            continue
+        switch.loc[switch.shape[0]] = switch_row.values
+        switch.loc[switch.shape[0] - 1, ["id", "nodeA", "nodeB", "cond"]] = [
+            name, nodeA, nodeB, int(cond or not multi_auxiliary)]
+    meas = csv_data["Measurement"]
+    meas.loc[meas.shape[0]] = ["MV1.101 Measurement 4", "MV1.101 busbar2", np.nan, "v",
+                               "MV1.101", 5]
+    res = csv_data["RES"]
+    res.loc[res.shape[0]] = res.loc[0].values
+    res.loc[res.shape[0] - 1, ["id", "node"]] = ["MV1.101 SGen 3", "MV1.101 busbar2"]
+    return csv_data
+
+
+def _aux_node_measurement_csv_data(input_path):
+    """Returns the synthetic csv data with the line measurement at the auxiliary node of the line
+    end instead of at the node behind the switch, as in the SimBench dataset."""
+    csv_data = sb.read_csv_data(input_path, ";")
+    meas = csv_data["Measurement"]
+    meas.loc[meas.id == "MV1.101 Measurement 2", "element1"] = "MV1.101 Bus 1_1"
+    return csv_data
+
+
+def _switch_free_csv_data(input_path):
+    """Returns the synthetic csv data with closed switches only and equal setpoints of the busbars,
+    so that generate_no_sw_variant_of_csv_data() collapses all switches."""
+    csv_data = sb.read_csv_data(input_path, ";")
+    csv_data["Switch"]["cond"] = 1
+    node = csv_data["Node"]
+    node.loc[node.id == "MV1.101 busbar2", ["vmSetp", "vaSetp"]] = [1.02, 0.]
+    return csv_data
+
+
+def test_generate_no_sw_variant_of_csv_data(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    for csv_data in [
+        sb.read_csv_data(input_path, ";"),
+        _aux_node_measurement_csv_data(input_path),
+        _switch_free_csv_data(input_path),
+        _double_busbar_csv_data(input_path),
+        _double_busbar_csv_data(input_path, multi_auxiliary=False),
+        sb.read_csv_data(os.path.join(sb_dir, "test", "converter", "test_network"), ";"),
+    ]:
+        net = sb.csv_data2pp(csv_data)
+        sb.generate_no_sw_variant(net)
+
+        csv_data_no_sw = deepcopy(csv_data)
+        sb.generate_no_sw_variant_of_csv_data(csv_data_no_sw)
+        assert csv_data_no_sw["Switch"].shape[0] < csv_data["Switch"].shape[0]
+        net_no_sw = sb.csv_data2pp(csv_data_no_sw)
+        sb.generate_no_sw_variant(net_no_sw)
+
+        tables = _net_tables_by_names(net)
+        tables_no_sw = _net_tables_by_names(net_no_sw)
+        for elm, df in tables.items():
+            assert dataframes_equal(df, tables_no_sw[elm])
+
+    # the busbars connected via a multi auxiliary node are left to generate_no_sw_variant()
+    csv_data = _double_busbar_csv_data(input_path)
+    sb.generate_no_sw_variant_of_csv_data(csv_data)
+    assert "MV1.101 Switch 4" in csv_data["Switch"].id.values
+    assert "MV1.101 busbar2" in csv_data["Node"].id.values
+
+    # all closed switches of the double busbar arrangement are collapsed in the csv data
+    csv_data = _double_busbar_csv_data(input_path, multi_auxiliary=False)
+    sb.generate_no_sw_variant_of_csv_data(csv_data)
+    assert list(csv_data["Switch"].id) == ["MV1.101 Switch 3"]
+    assert "MV1.101 busbar2" not in csv_data["Node"].id.values
+    assert "MV1.101 Line 5" not in csv_data["Line"].id.values
+    assert list(csv_data["Measurement"].id) == ["MV1.101 Measurement %i" % i for i in range(1, 4)]
+
+    # the switch related conversion steps are skipped for csv data without switches
+    csv_data = _switch_free_csv_data(input_path)
+    net = sb.csv_data2pp(csv_data)
+    sb.generate_no_sw_variant(net)
+    sb.generate_no_sw_variant_of_csv_data(csv_data)
+    assert not csv_data["Switch"].shape[0]
+    with sb.record_stages() as recorder:
+        net_no_sw = sb.csv_data2pp(csv_data)
+    stages = set(recorder.to_dataframe().name)
+    assert not stages & {"_ensure_single_switch_at_aux_node_and_copy_vm_setp",
+                         "_sort_switch_nodes_and_prepare_element_and_et",
+                         "create_branch_switches"}
+    assert not net_no_sw.switch.shape[0]
+    tables = _net_tables_by_names(net)
+    tables_no_sw = _net_tables_by_names(net_no_sw)
+    for elm, df in tables.items():
+        assert dataframes_equal(df, tables_no_sw[elm])
+
+    # get_simbench_net(..., generate_no_sw_in_csv=True)
+    for sb_code in ["1-MV-rural--0-no_sw", "1-MVLV-rural-all-0-no_sw"]:
+        tables = _net_tables_by_names(sb.get_simbench_net(sb_code, input_path))
+        tables_no_sw = _net_tables_by_names(sb.get_simbench_net(
+            sb_code, input_path, generate_no_sw_in_csv=True))
+        for elm, df in tables.items():
+            assert dataframes_equal(df, tables_no_sw[elm])
+
+
 def bus_groups_connected_by_switches(net):
     """Returns a list of sets of buses which are connected via switches."""
     bus_groups = []
@@ -673,6 +860,210 @@ def test_get_simbench_net(sb_codes=None, n=8, scenarios=None, input_path=None):
         )
 
 
+def test_simbench_dataset(tmp_path, monkeypatch):
+    input_path = write_synthetic_dataset(tmp_path)
+    sb_codes = ["1-MV-rural--0-sw", "1-LV-rural1--0-no_sw", "1-MVLV-rural-all-0-sw",
+                "1-complete_data-mixed-all-0-sw"]
+    nets = [sb.get_simbench_net(sb_code, input_path) for sb_code in sb_codes]
+    subnets = [sb.get_relevant_subnets(sb_code, input_path) for sb_code in sb_codes]
+
+    # --- count reading of csv tables
+    read_tables = []
+    read_csv_data = sb.read_csv_data
+
+    def counting_read_csv_data(*args, **kwargs):
+        read_tables.append(kwargs["tablename"])
+        return read_csv_data(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "simbench.networks.extract_simbench_grids_from_csv.read_csv_data",
+        counting_read_csv_data,
+    )
+
+    dataset = sb.SimBenchDataset(input_path)
+    for sb_code, net, relevant_subnets in zip(sb_codes, nets, subnets):
+        assert sb.get_relevant_subnets(sb_code, dataset) == relevant_subnets
+        assert nets_equal(sb.get_simbench_net(sb_code, dataset), net)
+    assert len(read_tables) == len(set(read_tables))
+    assert "Load" in read_tables and "Node" in read_tables
+
+    # --- the tables of the dataset must not be changed by the extraction and conversion
+    for tablename in ["Node", "Switch", "Load", "TransformerType", "LoadProfile"]:
+        assert dataframes_equal(
+            dataset.table(tablename), read_csv_data(input_path, ";", tablename)
+        )
+    assert dataset.bus_bus_switches == {3}
+    assert dataset.node_lookup.at["MV1.101 Bus 2"] == 6
+
+
+def test_get_simbench_net_in_threads(tmp_path, monkeypatch):
+    input_path = write_synthetic_dataset(tmp_path)
+    sb_codes = ["1-MV-rural--0-sw", "1-LV-rural1--0-no_sw", "1-MVLV-rural-all-0-sw",
+                "1-MVLV-rural-all-0-no_sw"]
+    nets = {sb_code: sb.get_simbench_net(sb_code, input_path) for sb_code in sb_codes}
+
+    # --- slow down reading to let the threads request the same tables at the same time
+    read_tables = []
+    read_csv_data = sb.read_csv_data
+
+    def slow_read_csv_data(*args, **kwargs):
+        read_tables.append(kwargs["tablename"])
+        time.sleep(0.01)
+        return read_csv_data(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "simbench.networks.extract_simbench_grids_from_csv.read_csv_data",
+        slow_read_csv_data,
+    )
+
+    dataset = sb.SimBenchDataset(input_path)
+    with ThreadPoolExecutor(4) as executor:
+        thread_nets = list(executor.map(
+            lambda sb_code: sb.get_simbench_net(sb_code, dataset), sb_codes * 2))
+    assert len(read_tables) == len(set(read_tables))
+    for sb_code, net in zip(sb_codes * 2, thread_nets):
+        assert nets_equal(net, nets[sb_code], check_only_results=False)
+
+
+def test_get_simbench_net_include_exclude(tmp_path, monkeypatch):
+    input_path = write_synthetic_dataset(tmp_path)
+    sb_code = "1-MVLV-rural-all-0-sw"
+    net = sb.get_simbench_net(sb_code, input_path)
+
+    read_tables = []
+    read_csv_data = sb.read_csv_data
+
+    def counting_read_csv_data(*args, **kwargs):
+        read_tables.append(kwargs["tablename"])
+        return read_csv_data(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "simbench.networks.extract_simbench_grids_from_csv.read_csv_data",
+        counting_read_csv_data,
+    )
+
+    # --- topology only
+    exclude = ["Measurement", "profiles", "StudyCases", "Coordinates"]
+    topology_net = sb.get_simbench_net(sb_code, input_path, exclude=exclude)
+    excluded = ["Measurement", "StudyCases", "Coordinates"] + sb.csv_tablenames("profiles")
+    assert not set(read_tables) & set(excluded)
+    assert not topology_net.measurement.shape[0]
+    assert "loadcases" not in topology_net.keys()
+    assert not any(df.shape[0] for df in topology_net.profiles.values())
+    assert topology_net.bus.geo.isnull().all()
+    for element in ["bus", "line", "trafo", "switch", "load", "sgen", "ext_grid"]:
+        assert list(topology_net[element].name) == list(net[element].name)
+    pp.runpp(net)
+    pp.runpp(topology_net)
+    assert np.allclose(topology_net.res_bus.vm_pu, net.res_bus.vm_pu, equal_nan=True)
+
+    # --- included tables, the Node table and the line types
+    line_net = sb.get_simbench_net(sb_code, input_path, include=["Line"])
+    assert list(line_net.line.name) == list(net.line.name)
+    assert line_net.line.std_type.notnull().all()
+    assert not line_net.load.shape[0] and not line_net.trafo.shape[0]
+
+    with pytest.raises(ValueError):
+        sb.get_simbench_net(sb_code, input_path, exclude="Lines")
+
+
+def test_get_simbench_net_exclude_branches(tmp_path, caplog):
+    input_path = write_synthetic_dataset(tmp_path)
+    for sb_code in ["1-MVLV-rural-all-0-sw", "1-MVLV-rural-all-0-no_sw"]:
+        net = sb.get_simbench_net(sb_code, input_path)
+        for tablename, element in [("Line", "line"), ("Transformer", "trafo"),
+                                   ("Transformer3W", "trafo3w")]:
+            for generate_no_sw_in_csv in [False, True]:
+                caplog.clear()
+                branch_net = sb.get_simbench_net(
+                    sb_code, input_path, exclude=[tablename],
+                    generate_no_sw_in_csv=generate_no_sw_in_csv)
+                assert "assumed as bus measurements" not in caplog.text
+                assert not branch_net[element].shape[0]
+                assert not (branch_net.bus.type == "auxiliary").any()
+                assert branch_net.switch.bus.isin(branch_net.bus.index).all()
+                bus_bus_sw = branch_net.switch.et == "b"
+                assert branch_net.switch.element[bus_bus_sw].isin(branch_net.bus.index).all()
+                for et in ["l", "t", "t3"]:
+                    elm = {"l": "line", "t": "trafo", "t3": "trafo3w"}[et]
+                    is_et = branch_net.switch.et == et
+                    assert branch_net.switch.element[is_et].isin(branch_net[elm].index).all()
+                meas = branch_net.measurement
+                assert element not in set(meas.element_type)
+                for et in set(meas.element_type):
+                    is_et = meas.element_type == et
+                    assert meas.element[is_et].isin(branch_net[et].index).all()
+                assert set(branch_net.bus.name) <= set(net.bus.name)
+                for other in {"line", "trafo", "load", "sgen", "ext_grid"} - {element}:
+                    assert list(branch_net[other].name) == list(net[other].name)
+
+
+def test_get_simbench_net_geodata(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    for sb_code in ["1-MVLV-rural-all-0-sw", "1-MVLV-rural-all-0-no_sw"]:
+        net = sb.get_simbench_net(sb_code, input_path)
+        assert net.bus.geo.notnull().any()
+
+        # --- numeric: numeric coordinates, GeoJSON strings on request
+        numeric_net = sb.get_simbench_net(sb_code, input_path, geodata="numeric")
+        assert type(numeric_net.bus) is pd.DataFrame
+        assert numeric_net.bus.geo.isnull().all()
+        assert numeric_net.bus.x.notnull().sum() == net.bus.geo.notnull().sum()
+        assert numeric_net.bus.y.notnull().sum() == net.bus.geo.notnull().sum()
+        pp.runpp(numeric_net)
+        pp.runpp(net)
+        assert np.allclose(numeric_net.res_bus.vm_pu, net.res_bus.vm_pu, equal_nan=True)
+        assert numeric_net.bus.geo.isnull().all()
+        sb.materialize_bus_geo(numeric_net)
+        assert type(numeric_net.bus) is pd.DataFrame
+        assert list(numeric_net.bus.geo) == list(net.bus.geo)
+
+        # --- none: no geodata
+        none_net = sb.get_simbench_net(sb_code, input_path, geodata="none")
+        assert none_net.bus.geo.isnull().all()
+        assert "x" not in none_net.bus.columns
+        assert list(none_net.bus.name) == list(net.bus.name)
+
+    with pytest.raises(ValueError):
+        sb.get_simbench_net(sb_code, input_path, geodata="svg")
+
+
+
+def test_get_simbench_net_record_stages(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    sb_code = "1-MVLV-rural-all-0-no_sw"
+    with sb.record_stages() as recorder:
+        net = sb.get_simbench_net(sb_code, input_path)
+    assert nets_equal(net, sb.get_simbench_net(sb_code, input_path), check_only_results=False)
+
+    stages = recorder.to_dataframe()
+    assert stages.name.iloc[0] == "get_simbench_net"
+    assert stages.depth.iloc[0] == 0
+    for name in ["get_relevant_subnets", "get_extracted_csv_data", "read_csv_data:Node",
+                 "_extract_csv_table_by_subnet:Line", "filter_unapplied_profiles",
+                 "csv_data2pp", "_convert_elements_and_types", "generate_no_sw_variant"]:
+        assert name in stages.name.values
+    assert stages.depth.loc[stages.name == "_convert_elements_and_types"].iloc[0] == 2
+    assert (stages[["wall_s", "cpu_s", "peak_memory_mb"]] >= 0).all().all()
+    # a stage includes the time and memory peaks of its nested stages
+    total = stages.iloc[0]
+    nested = stages.loc[stages.depth == 1]
+    assert total.wall_s >= nested.wall_s.sum()
+    assert total.peak_memory_mb >= nested.peak_memory_mb.max()
+    assert recorder.summary().loc["get_simbench_net", "calls"] == 1
+
+    trace_file = os.path.join(tmp_path, "trace.json")
+    recorder.write_chrome_trace(trace_file)
+    with open(trace_file) as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == stages.shape[0]
+    assert {event["ph"] for event in events} == {"X"}
+
+    # --- without record_stages(), nothing is recorded
+    sb.get_simbench_net(sb_code, input_path)
+    assert recorder.to_dataframe().shape[0] == stages.shape[0]
+
+
 def aux_node_names_with_dupl_branches(csv_data):
     lA = csv_data["Line"]["nodeA"]
     lB = csv_data["Line"]["nodeB"]
@@ -722,6 +1113,39 @@ def test_get_all_simbench_profiles():
             assert profilesB[prof_table].shape[1] > 0
 
 
+def test_get_all_simbench_profiles_of_scenarios(tmp_path, monkeypatch):
+    input_paths = dict()
+    for scenario in [0, 1, 2]:
+        (tmp_path / str(scenario)).mkdir()
+        input_paths[scenario] = write_synthetic_dataset(tmp_path / str(scenario), scenario)
+    profiles = sb.get_all_simbench_profiles_of_scenarios(input_paths=input_paths)
+
+    for scenario, input_path in input_paths.items():
+        expected = sb.get_all_simbench_profiles(scenario, input_path)
+        assert profiles[scenario].keys() == expected.keys()
+        for key, df in expected.items():
+            pd.testing.assert_frame_equal(profiles[scenario][key], df)
+
+    # --- equal columns share memory, different columns do not
+    for col in ["H0-A_pload", "H0-A_qload", "time"]:
+        assert np.shares_memory(profiles[0]["load"][col].values, profiles[2]["load"][col].values)
+    assert np.shares_memory(profiles[0]["renewables"]["PV5"].values,
+                            profiles[1]["renewables"]["PV5"].values)
+    assert not np.shares_memory(profiles[0]["load"]["G3-A_pload"].values,
+                                profiles[1]["load"]["G3-A_pload"].values)
+    with pytest.raises(ValueError):
+        profiles[1]["load"].loc[0, "H0-A_pload"] = 1.
+
+    # --- columns with equal fingerprints are only shared if their values are equal
+    monkeypatch.setattr(
+        extract_simbench_grids_from_csv, "_column_fingerprint",
+        lambda values: (values.dtype.str, len(values)))
+    colliding = sb.get_all_simbench_profiles_of_scenarios(input_paths=input_paths)
+    for scenario in input_paths.keys():
+        for key, df in profiles[scenario].items():
+            pd.testing.assert_frame_equal(colliding[scenario][key], df)
+
+
 if __name__ == "__main__":
     if 0:
         pytest.main([__file__, "-s"])
@@ -0,0 +1,102 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import pytest
+import os
+import stat
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+import simbench as sb
+from simbench.networks.extract_simbench_grids_from_csv import (
+    _private_directory,
+    _request_simbench_net_from_server,
+)
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
+
+try:
+    from pandapower.toolbox.comparison import nets_equal
+except ImportError:
+    from pandapower import nets_equal
+
+__author__ = "smeinecke"
+
+
+def test_simbench_grid_server(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    address = os.path.join(str(tmp_path), "server.sock")
+    sb_code = "1-MVLV-rural-all-0-no_sw"
+    net_local = sb.get_simbench_net(sb_code, input_path)
+
+    # --- no server is running -> the net is created locally
+    assert nets_equal(
+        sb.get_simbench_net(sb_code, input_path, server=address),
+        net_local,
+        check_only_results=False,
+    )
+
+    server = sb.SimBenchGridServer(address, max_cached_nets=1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        # wait until the server listens
+        for _ in range(100):
+            if server._is_running():
+                break
+            thread.join(0.05)
+        with pytest.raises(ValueError):
+            sb.SimBenchGridServer(address).serve_forever()
+
+        for _ in range(2):
+            net = sb.get_simbench_net(sb_code, input_path, server=address)
+            assert nets_equal(net, net_local, check_only_results=False)
+        assert list(server._datasets.keys()) == [input_path]
+        assert len(server._nets) == 1
+        net.bus.drop(net.bus.index, inplace=True)  # the client got a copy
+        assert nets_equal(
+            server.get_simbench_net(sb_code, input_path), net_local, check_only_results=False
+        )
+
+        # clients without the key of the server are refused, before any pickle is exchanged
+        if hasattr(os, "getuid"):
+            assert stat.S_IMODE(os.stat(address).st_mode) == 0o600
+        with pytest.raises(AuthenticationError):
+            Client(address, family="AF_UNIX", authkey=b"wrong key")
+        assert server._is_running()
+
+        # errors of the server are raised at the client
+        with pytest.raises(IndexError):
+            _request_simbench_net_from_server(address, "1-XX-rural--0-sw", input_path, False)
+    finally:
+        server.shutdown()
+        thread.join(10)
+    assert not thread.is_alive()
+    assert not os.path.exists(address)
+
+
+
+def test_default_grid_server_address():
+    address = sb.default_grid_server_address()
+    folder = os.path.dirname(address)
+    assert os.path.isdir(folder)
+    if hasattr(os, "getuid"):
+        assert stat.S_IMODE(os.stat(folder).st_mode) == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="file permissions of posix systems")
+def test_private_directory(tmp_path):
+    folder = os.path.join(str(tmp_path), "private")
+    assert _private_directory(folder) == folder
+    assert stat.S_IMODE(os.stat(folder).st_mode) == 0o700
+    os.chmod(folder, 0o755)
+    with pytest.raises(ValueError):
+        _private_directory(folder)
+
+
+if __name__ == "__main__":
+    if 0:
+        pytest.main([__file__, "-xs"])
+    else:
+        pass
@@ -0,0 +1,92 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import pytest
+from copy import deepcopy
+import pandas as pd
+import pandapower as pp
+
+import simbench as sb
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
+
+try:
+    from pandapower.toolbox.comparison import nets_equal
+    from pandapower.toolbox.data_modification import reindex_buses, reindex_elements
+except ImportError:
+    from pandapower import nets_equal, reindex_buses, reindex_elements
+
+__author__ = "smeinecke"
+
+
+def _assert_nets_identical(net1, net2):
+    assert nets_equal(net1, net2, check_only_results=False)
+    for key, value in net2.items():
+        if isinstance(value, pd.DataFrame):
+            assert net1[key].equals(value), key
+    assert net1.profiles.keys() == net2.profiles.keys()
+    for key, df in net2.profiles.items():
+        assert net1.profiles[key].equals(df), key
+
+
+def test_scenario_diff(tmp_path):
+    nets = list()
+    for scenario in [0, 1]:
+        (tmp_path / str(scenario)).mkdir()
+        nets.append(sb.get_simbench_net(
+            "1-MVLV-rural-all-%i-sw" % scenario,
+            write_synthetic_dataset(tmp_path / str(scenario), scenario)))
+    # a variant of scenario 1 with different bus and line indices
+    net1_reindexed = deepcopy(nets[1])
+    reindex_buses(net1_reindexed, dict(zip(
+        net1_reindexed.bus.index, net1_reindexed.bus.index[::-1] + 100)))
+    reindex_elements(net1_reindexed, "line", net1_reindexed.line.index[::-1] + 7)
+
+    for base_net, net in [(nets[0], nets[1]), (nets[1], nets[0]),
+                          (nets[0], net1_reindexed), (net1_reindexed, nets[0])]:
+        base_net_copy = deepcopy(base_net)
+        diff = sb.get_scenario_diff(base_net, net)
+        _assert_nets_identical(sb.apply_scenario_diff(base_net, diff), net)
+        _assert_nets_identical(base_net, base_net_copy)
+
+    # the diff only includes changed rows and columns
+    diff = sb.get_scenario_diff(nets[0], net1_reindexed)
+    assert sorted(diff["tables"]["load"]["added"].name) == ["LV1.101 Load 3"]
+    assert list(diff["tables"]["line"]["added"].name) == ["LV1.101 Line 3"]
+    assert diff["tables"]["line"]["changed"].shape == (0, 0)
+    assert diff["tables"]["bus"]["changed"].shape == (0, 0)
+    assert list(diff["tables"]["load"]["changed"].columns) == ["p_mw"]
+    assert "H0-A_pload" not in diff["profiles"]["load"]["changed"].columns
+    assert "PV5" not in diff["profiles"]["renewables"]["changed"].columns
+    assert not len(diff["replaced"])
+
+    # only tables changed by the diff are copied, the other ones are shared with the base net
+    net = sb.apply_scenario_diff(nets[0], diff)
+    assert net.load is not nets[0].load
+    unchanged = [key for key, df in nets[0].items() if isinstance(df, pd.DataFrame) and
+                 not key.startswith(("_", "res_")) and key not in diff["tables"].keys()]
+    assert len(unchanged)
+    assert all(net[key] is nets[0][key] for key in unchanged)
+
+    # result tables are not part of the diff and are empty in the created net
+    base_net = deepcopy(nets[0])
+    pp.runpp(base_net)
+    diff = sb.get_scenario_diff(base_net, net1_reindexed)
+    assert not any(key.startswith("res_") for key in diff["tables"].keys())
+    assert not any(key.startswith("res_") for key in diff["replaced"].keys())
+    net = sb.apply_scenario_diff(base_net, diff)
+    assert base_net.res_bus.shape[0] and not net.res_bus.shape[0]
+    _assert_nets_identical(net, net1_reindexed)
+
+    # inplace
+    base_net = deepcopy(nets[0])
+    net = sb.apply_scenario_diff(base_net, sb.get_scenario_diff(nets[0], nets[1]), inplace=True)
+    assert net is base_net
+    _assert_nets_identical(net, nets[1])
+
+
+if __name__ == "__main__":
+    if 0:
+        pytest.main([__file__, "-xs"])
+    else:
+        pass
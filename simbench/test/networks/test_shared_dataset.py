@@ -0,0 +1,100 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import pytest
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+import simbench as sb
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
+
+try:
+    from pandapower.toolbox.comparison import nets_equal
+except ImportError:
+    from pandapower import nets_equal
+
+__author__ = "smeinecke"
+
+
+def test_shared_simbench_dataset_tables(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    csv_data = sb.read_csv_data(input_path, ";")
+    tablenames = [tablename for tablename in csv_data.keys() if tablename != "Measurement"]
+
+    with sb.SharedSimBenchDataset(input_path, tablenames=tablenames) as dataset:
+        buf = np.frombuffer(dataset._shm.buf, dtype=np.uint8)
+        for tablename, df in csv_data.items():
+            pd.testing.assert_frame_equal(dataset[tablename], df)
+        for col in ["H0-A_pload", "G3-A_qload"]:
+            values = dataset["LoadProfile"][col].values
+            assert not values.flags.writeable
+            assert np.shares_memory(values, buf)
+        assert "Measurement" not in dataset._shared_tables.keys()
+        del buf, values
+
+        # unpickling in the publishing process returns the dataset itself
+        assert pickle.loads(pickle.dumps(dataset)) is dataset
+        name = dataset.name
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_shared_simbench_dataset_profiles_are_not_copied(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    sb_code = "1-MVLV-rural-all-0-sw"
+    expected = sb.get_simbench_net(sb_code, sb.SimBenchDataset(input_path))
+
+    with sb.SharedSimBenchDataset(input_path) as dataset:
+        buf = np.frombuffer(dataset._shm.buf, dtype=np.uint8)
+        for _ in range(2):
+            net = sb.get_simbench_net(sb_code, dataset)
+            assert nets_equal(net, expected, check_only_results=False)
+            for key, col in [("load", "H0-A_pload"), ("renewables", "PV5")]:
+                values = net.profiles[key][col].values
+                assert np.shares_memory(values, buf)
+                assert not values.flags.writeable
+            with pytest.raises(ValueError):
+                net.profiles["load"].loc[0, "H0-A_pload"] = 1.
+
+            # element tables are copied since the conversion changes them
+            assert not np.shares_memory(net.bus.vn_kv.values, buf)
+        pd.testing.assert_frame_equal(dataset["LoadProfile"], sb.read_csv_data(
+            input_path, ";", tablename="LoadProfile"))
+        del buf, values, net
+
+    # tables of other datasets are copied
+    dataset = sb.SimBenchDataset(input_path)
+    net = sb.get_simbench_net(sb_code, dataset)
+    assert not np.shares_memory(
+        net.profiles["load"]["H0-A_pload"].values, dataset["LoadProfile"]["H0-A_pload"].values)
+
+
+def test_shared_simbench_dataset_in_worker_processes(tmp_path):
+    input_path = write_synthetic_dataset(tmp_path)
+    sb_codes = ["1-MV-rural--0-sw", "1-MVLV-rural-all-0-no_sw", "1-LV-rural1--0-sw"]
+
+    with sb.SharedSimBenchDataset(input_path) as dataset:
+        with ProcessPoolExecutor(
+            2, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            nets = list(
+                executor.map(sb.get_simbench_net, sb_codes, [dataset] * len(sb_codes))
+            )
+
+    for sb_code, net in zip(sb_codes, nets):
+        assert nets_equal(
+            net, sb.get_simbench_net(sb_code, input_path), check_only_results=False
+        )
+
+
+if __name__ == "__main__":
+    if 0:
+        pytest.main([__file__, "-xs"])
+    else:
+        pass
@@ -0,0 +1,78 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import pytest
+import numpy as np
+
+import simbench as sb
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
+
+__author__ = "smeinecke"
+
+
+def test_coordinate_index():
+    rng = np.random.default_rng(0)
+    x = rng.random(3000)
+    y = rng.random(3000) * 3
+    x[::50] = np.nan
+    index = sb.CoordinateIndex(x, y)
+    assert len(index) == 3000 - 60
+
+    for _ in range(200):
+        x_min, x_max = np.sort(rng.random(2) * 1.2 - 0.1)
+        y_min, y_max = np.sort(rng.random(2) * 3.6 - 0.3)
+        expected = np.flatnonzero((x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max))
+        assert np.array_equal(index.query((x_min, y_min, x_max, y_max)), expected)
+
+    # triangles: a point is inside if it is on the same side of all edges as the third vertex
+    for _ in range(50):
+        triangle = np.c_[rng.random(3), rng.random(3) * 3]
+        inside = np.isfinite(x)
+        for i in range(3):
+            (x1, y1), (x2, y2), (x3, y3) = np.roll(triangle, i, axis=0)
+            side = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+            inside &= np.sign(side) == np.sign((x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1))
+        assert np.array_equal(index.query(triangle), np.flatnonzero(inside))
+
+    assert not len(index.query((2, 4, 3, 5)))
+    assert not len(sb.CoordinateIndex([], []).query((0, 0, 1, 1)))
+
+
+def test_get_extracted_csv_data_by_area(tmp_path):
+    dataset = sb.SimBenchDataset(write_synthetic_dataset(tmp_path))
+    assert sb.get_coordinate_index(dataset) is sb.get_coordinate_index(dataset)
+
+    # bounding box of the LV grid LV1.101
+    csv_data = sb.get_extracted_csv_data_by_area((11.4205, 53.6205, 11.425, 53.6235), dataset)
+    assert list(csv_data["Node"].id) == ["LV1.101 Bus %i" % i for i in range(1, 5)]
+    assert list(csv_data["Line"].id) == ["LV1.101 Line 1", "LV1.101 Line 2"]
+    assert list(csv_data["Load"].id) == ["LV1.101 Load 1", "LV1.101 Load 2"]
+    assert list(csv_data["RES"].id) == ["LV1.101 SGen 1"]
+    for tablename in ["Transformer", "Switch", "ExternalNet", "Measurement", "Substation"]:
+        assert not csv_data[tablename].shape[0]
+
+    # polygon which cuts MV1.101 Line 2 and includes the LV grid LV1.102
+    polygon = [(11.395, 53.595), (11.435, 53.595), (11.435, 53.615), (11.395, 53.615)]
+    csv_data = sb.get_extracted_csv_data_by_area(polygon, dataset)
+    assert "MV1.101 Bus 1_2" not in csv_data["Node"].id.values
+    assert list(csv_data["Switch"].id) == [
+        "MV1.101 Switch 1", "MV1.101 Switch 2", "MV1.101 Switch 4", "LV1.102 Switch 1"]
+    assert list(csv_data["Transformer"].id) == ["MV1.101-LV1.102-Trafo 1"]
+    assert list(csv_data["Measurement"].id) == ["MV1.101 Measurement 1",
+                                                "MV1.101 Measurement 2"]
+    assert list(csv_data["Substation"].id) == ["HV1_MV1.101_Substation"]
+
+    for sw in [True, False]:
+        net = sb.get_simbench_net_by_area(polygon, dataset, sw=sw)
+        assert set(net.line.name) == {"MV1.101 Line 1", "LV1.102 Line 1"}
+        assert list(net.trafo.name) == ["MV1.101-LV1.102-Trafo 1"]
+        assert list(net.ext_grid.name) == ["MV1.101 grid equivalent"]
+        assert "MV1.101 Load 3" not in net.load.name.values
+
+
+if __name__ == "__main__":
+    if 0:
+        pytest.main([__file__, "-xs"])
+    else:
+        pass
@@ -0,0 +1,64 @@
+# Copyright (c) 2019-2026 by University of Kassel, Tu Dortmund, RWTH Aachen University and Fraunhofer
+# Institute for Energy Economics and Energy System Technology (IEE) Kassel and individual
+# contributors (see AUTHORS file for details). All rights reserved.
+
+import pytest
+
+import simbench as sb
+from simbench.test.networks.synthetic_dataset import write_synthetic_dataset
+
+try:
+    from pandapower.toolbox.comparison import nets_equal
+except ImportError:
+    from pandapower import nets_equal
+
+__author__ = "smeinecke"
+
+
+def test_get_extracted_csv_data_by_subnets(tmp_path):
+    dataset = sb.SimBenchDataset(write_synthetic_dataset(tmp_path))
+    for sb_code, subnets in [
+        ("1-MVLV-rural-all-0-sw", ["MV1.101", "LV1.101", "LV1.102"]),
+        ("1-MVLV-rural-1.102-0-sw", ["MV1.101", "LV1.102"]),
+        ("1-MV-rural--0-sw", "MV1.101"),
+        ("1-LV-rural1--0-sw", ["LV1.101"]),
+    ]:
+        csv_data = sb.get_extracted_csv_data(sb.get_relevant_subnets(sb_code, dataset), dataset)
+        csv_data_by_subnets = sb.get_extracted_csv_data_by_subnets(subnets, dataset)
+        assert csv_data.keys() == csv_data_by_subnets.keys()
+        for tablename, df in csv_data.items():
+            assert df.equals(csv_data_by_subnets[tablename]), tablename
+
+    assert nets_equal(
+        sb.get_simbench_net_by_subnets(["MV1.101", "LV1.102"], dataset, sw=False),
+        sb.get_simbench_net("1-MVLV-rural-1.102-0-no_sw", dataset),
+        check_only_results=False,
+    )
+
+
+def test_get_subnets_of_nodes(tmp_path):
+    dataset = sb.SimBenchDataset(write_synthetic_dataset(tmp_path))
+    assert sb.get_subnet_graph(dataset) == {
+        "MV1.101": {"LV1.101", "LV1.102"}, "LV1.101": {"MV1.101"}, "LV1.102": {"MV1.101"}}
+
+    all_subnets = ["LV1.101", "LV1.102", "MV1.101"]
+    for node, kwargs, subnets in [
+        ("LV1.102 Bus 1", dict(depth=0), ["LV1.102"]),
+        ("LV1.102 Bus 1", dict(depth=1), ["LV1.102", "MV1.101"]),
+        ("LV1.102 Bus 1", dict(), all_subnets),
+        ("LV1.102 Bus 1", dict(voltage_levels=["LV"]), ["LV1.102"]),
+        ("MV1.101 busbar1", dict(voltage_levels=[5, 7]), all_subnets),
+        ("MV1.101 busbar1", dict(voltage_levels=["MV"]), ["MV1.101"]),
+        (["LV1.101 Bus 2", "LV1.102 Bus 2"], dict(depth=0), ["LV1.101", "LV1.102"]),
+    ]:
+        assert sb.get_subnets_of_nodes(node, dataset, **kwargs) == subnets
+
+    with pytest.raises(ValueError):
+        sb.get_subnets_of_nodes("not existing node", dataset)
+
+
+if __name__ == "__main__":
+    if 0:
+        pytest.main([__file__, "-xs"])
+    else:
+        pass